@@ -0,0 +1,170 @@
+"""Partition tickets and ticket_executors by project
+
+Revision ID: 4f6a8c0e2b13
+Revises: 9b3d5f7a1c26
+Create Date: 2026-10-19 14:10:27.503918
+
+Postgres cannot turn a table into a partitioned one in place: both tables
+are renamed aside, recreated hash-partitioned by project_id with
+(id, project_id) keys, refilled with INSERT ... SELECT and dropped. The id
+sequences are carried over. The copy holds an exclusive lock on the tables
+for its whole duration; schedule it in a maintenance window on large data.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4f6a8c0e2b13"
+down_revision: Union[str, None] = "9b3d5f7a1c26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# TICKET_PARTITIONS as of this revision
+PARTITIONS = 16
+
+TICKET_COLUMNS = (
+    "id, title, description, responsible_user_id, status, priority, "
+    "project_id, created_at, updated_at"
+)
+EXECUTOR_COLUMNS = "id, ticket_id, user_id, project_id, created_at, updated_at"
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    ]
+
+
+def _create_tables(partitioned: bool) -> None:
+    """Create empty tickets and ticket_executors tables in either layout."""
+    key = ["id", "project_id"] if partitioned else ["id"]
+    options = {"postgresql_partition_by": "HASH (project_id)"} if partitioned else {}
+
+    op.create_table(
+        "tickets",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            server_default=sa.text("nextval('tickets_id_seq')"),
+            nullable=False,
+        ),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("responsible_user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(name="ticketstatus", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        *_timestamps(),
+        sa.CheckConstraint("priority >= 1 AND priority <= 5", name="priority_check"),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"]),
+        sa.ForeignKeyConstraint(["responsible_user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint(*key),
+        **options,
+    )
+    op.create_table(
+        "ticket_executors",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            server_default=sa.text("nextval('ticket_executors_id_seq')"),
+            nullable=False,
+        ),
+        sa.Column("ticket_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        *_timestamps(),
+        (
+            sa.ForeignKeyConstraint(
+                ["ticket_id", "project_id"],
+                ["tickets.id", "tickets.project_id"],
+                ondelete="CASCADE",
+            )
+            if partitioned
+            else sa.ForeignKeyConstraint(
+                ["ticket_id"], ["tickets.id"], ondelete="CASCADE"
+            )
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id", "project_id"],
+            ["project_members.user_id", "project_members.project_id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(*key),
+        **options,
+    )
+
+    if partitioned:
+        for table in ("tickets", "ticket_executors"):
+            for remainder in range(PARTITIONS):
+                op.execute(
+                    f"CREATE TABLE {table}_p{remainder} PARTITION OF {table} "
+                    f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+                )
+        op.create_index(
+            "ix_ticket_executors_ticket_id", "ticket_executors", ["ticket_id"]
+        )
+    else:
+        op.create_index(op.f("ix_tickets_id"), "tickets", ["id"])
+        op.create_index(op.f("ix_ticket_executors_id"), "ticket_executors", ["id"])
+    op.create_index("ix_tickets_project_id_status", "tickets", ["project_id", "status"])
+
+
+def _rebuild(partitioned: bool) -> None:
+    """Move both tables into the other layout, keeping their rows and ids."""
+    for table in ("ticket_executors", "tickets"):
+        op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+        op.rename_table(table, f"{table}_old")
+        op.execute(f"ALTER INDEX {table}_pkey RENAME TO {table}_old_pkey")
+    if partitioned:
+        op.drop_index("ix_tickets_id", table_name="tickets_old")
+        op.drop_index("ix_ticket_executors_id", table_name="ticket_executors_old")
+    else:
+        op.drop_index(
+            "ix_ticket_executors_ticket_id", table_name="ticket_executors_old"
+        )
+    op.drop_index("ix_tickets_project_id_status", table_name="tickets_old")
+
+    _create_tables(partitioned)
+
+    op.execute(
+        f"INSERT INTO tickets ({TICKET_COLUMNS}) "
+        f"SELECT {TICKET_COLUMNS} FROM tickets_old"
+    )
+    op.execute(
+        f"INSERT INTO ticket_executors ({EXECUTOR_COLUMNS}) "
+        f"SELECT {EXECUTOR_COLUMNS} FROM ticket_executors_old"
+    )
+    op.drop_table("ticket_executors_old")
+    op.drop_table("tickets_old")
+    for table in ("ticket_executors", "tickets"):
+        op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+        op.execute(f"ANALYZE {table}")
+
+
+def upgrade() -> None:
+    _rebuild(partitioned=True)
+
+
+def downgrade() -> None:
+    _rebuild(partitioned=False)
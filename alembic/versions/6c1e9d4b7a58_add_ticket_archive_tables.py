@@ -0,0 +1,96 @@
+"""Add ticket archive tables and the DONE tickets index
+
+Revision ID: 6c1e9d4b7a58
+Revises: 4f6a8c0e2b13
+Create Date: 2026-10-19 15:02:44.180356
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6c1e9d4b7a58"
+down_revision: Union[str, None] = "4f6a8c0e2b13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tickets_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("responsible_user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(name="ticketstatus", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_tickets_archive_project_id"), "tickets_archive", ["project_id"]
+    )
+    op.create_table(
+        "ticket_executors_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("ticket_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_ticket_executors_archive_ticket_id"),
+        "ticket_executors_archive",
+        ["ticket_id"],
+    )
+    op.create_index(
+        "ix_tickets_done_updated_at",
+        "tickets",
+        ["updated_at"],
+        postgresql_where=sa.text("status = 'DONE'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tickets_done_updated_at", table_name="tickets")
+    op.drop_index(
+        op.f("ix_ticket_executors_archive_ticket_id"),
+        table_name="ticket_executors_archive",
+    )
+    op.drop_table("ticket_executors_archive")
+    op.drop_index(op.f("ix_tickets_archive_project_id"), table_name="tickets_archive")
+    op.drop_table("tickets_archive")
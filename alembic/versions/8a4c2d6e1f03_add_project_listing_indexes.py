@@ -0,0 +1,36 @@
+"""Add project listing indexes
+
+Revision ID: 8a4c2d6e1f03
+Revises: 5e1f0c2a9b7d
+Create Date: 2026-10-19 11:02:17.540912
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4c2d6e1f03"
+down_revision: Union[str, None] = "5e1f0c2a9b7d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_projects_owner_id"), "projects", ["owner_id"], unique=False
+    )
+    op.create_index(
+        "ix_tickets_project_id_status",
+        "tickets",
+        ["project_id", "status"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tickets_project_id_status", table_name="tickets")
+    op.drop_index(op.f("ix_projects_owner_id"), table_name="projects")
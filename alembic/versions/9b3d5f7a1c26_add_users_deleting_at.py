@@ -0,0 +1,36 @@
+"""Add users deleting_at and successor_id
+
+Revision ID: 9b3d5f7a1c26
+Revises: e2f8a17c4b90
+Create Date: 2026-10-19 13:05:41.218734
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b3d5f7a1c26"
+down_revision: Union[str, None] = "e2f8a17c4b90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("deleting_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column("users", sa.Column("successor_id", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        "users_successor_id_fkey", "users", "users", ["successor_id"], ["id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("users_successor_id_fkey", "users", type_="foreignkey")
+    op.drop_column("users", "successor_id")
+    op.drop_column("users", "deleting_at")
@@ -0,0 +1,32 @@
+"""Add projects tickets_version
+
+Revision ID: a3d7f1b9c2e4
+Revises: 6c1e9d4b7a58
+Create Date: 2026-10-19 15:48:12.664021
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3d7f1b9c2e4"
+down_revision: Union[str, None] = "6c1e9d4b7a58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "projects",
+        sa.Column(
+            "tickets_version", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("projects", "tickets_version")
@@ -0,0 +1,33 @@
+"""Add project_members project_id index
+
+Revision ID: c7e9b3a05d21
+Revises: 8a4c2d6e1f03
+Create Date: 2026-10-19 11:41:52.093377
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e9b3a05d21"
+down_revision: Union[str, None] = "8a4c2d6e1f03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The primary key leads with user_id, member pages and counts filter by project
+    op.create_index(
+        op.f("ix_project_members_project_id"),
+        "project_members",
+        ["project_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_project_members_project_id"), table_name="project_members")
@@ -0,0 +1,30 @@
+"""Add projects deleting_at
+
+Revision ID: e2f8a17c4b90
+Revises: c7e9b3a05d21
+Create Date: 2026-10-19 12:20:05.771846
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2f8a17c4b90"
+down_revision: Union[str, None] = "c7e9b3a05d21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "projects",
+        sa.Column("deleting_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("projects", "deleting_at")
@@ -17,6 +17,12 @@ class BaseRepository(Generic[ModelType]):
         result = await self.db_session.execute(query)
         return result.scalars().first()
 
+    async def get_version(self, id: int):
+        """Fetch only the (id, updated_at) pair of a row, without loading the entity."""
+        query = select(self.model.id, self.model.updated_at).where(self.model.id == id)
+        result = await self.db_session.execute(query)
+        return result.first()
+
     async def get_all(
         self, skip: Optional[int] = None, limit: Optional[int] = None
     ) -> List[ModelType]:
@@ -0,0 +1,158 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+# Every cache of the process by name, read by the metrics endpoint
+caches: dict[str, "TTLCache | SnapshotCache"] = {}
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    stale: int = 0
+
+
+class TTLCache:
+    """A bounded in-process LRU cache whose entries expire after `ttl` seconds.
+
+    Not shared between worker processes: each worker keeps its own copy.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: OrderedDict = OrderedDict()
+        caches[name] = self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            self.stats.misses += 1
+            return default
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key, value, ttl: float | None = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def pop(self, key, default=None):
+        entry = self._entries.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[0]
+
+    def pop_where(self, predicate) -> int:
+        """Drop every entry whose key matches `predicate`; return how many."""
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def snapshot(self) -> dict:
+        """Size and hit/miss counters, as exposed by the metrics endpoint."""
+        lookups = self.stats.hits + self.stats.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "evictions": self.stats.evictions,
+            "expirations": self.stats.expirations,
+            "hit_ratio": round(self.stats.hits / lookups, 4) if lookups else None,
+        }
+
+
+class SnapshotCache:
+    """Versioned byte snapshots (such as pre-serialised JSON) in an LRU bounded by size.
+
+    An entry is only served for the version it was built from: readers pass
+    the current version and a snapshot of another version is a miss. The
+    least recently used entries are evicted once the bodies add up to more
+    than `max_bytes`. Not shared between worker processes.
+    """
+
+    def __init__(self, name: str, max_bytes: int):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.stats = CacheStats()
+        self._entries: OrderedDict = OrderedDict()
+        caches[name] = self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key, version) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            if entry is not None:
+                self.stats.stale += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry[1]
+
+    def set(self, key, version, body: bytes) -> None:
+        """Store the snapshot of `version`, unless a newer one is already cached."""
+        current = self._entries.get(key)
+        if current is not None and current[0] > version:
+            return
+        self.pop(key)
+        if len(body) > self.max_bytes:
+            return
+        self._entries[key] = (version, body)
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+            self.stats.evictions += 1
+
+    def pop(self, key) -> bytes | None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self.size -= len(entry[1])
+        return entry[1]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def snapshot(self) -> dict:
+        """Size and hit/miss counters, as exposed by the metrics endpoint."""
+        lookups = self.stats.hits + self.stats.misses
+        return {
+            "size": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "stale": self.stats.stale,
+            "evictions": self.stats.evictions,
+            "hit_ratio": round(self.stats.hits / lookups, 4) if lookups else None,
+        }
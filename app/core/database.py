@@ -3,8 +3,15 @@ from sqlalchemy.orm import sessionmaker
 from app.core.settings import settings
 from sqlalchemy.orm import declarative_base
 
-# Create the async engine for PostgreSQL
-engine = create_async_engine(settings.DATABASE_URL, echo=True, future=True)
+# Create the async engine for PostgreSQL, one per worker process
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.DB_ECHO,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    future=True,
+)
 
 # Create the async session
 AsyncSessionLocal = sessionmaker(
@@ -0,0 +1,20 @@
+import hashlib
+
+
+def make_etag(*parts) -> str:
+    """Build a weak ETag from the given version parts (ids, timestamps, counts)."""
+    raw = ":".join(str(part) for part in parts).encode()
+    return f'W/"{hashlib.blake2b(raw, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
@@ -0,0 +1,175 @@
+import asyncio
+import hashlib
+import re
+from dataclasses import dataclass
+
+from app.core.cache import TTLCache
+from app.core.rate_limit import client_key
+from app.core.settings import settings
+
+# Create and assign routes that honour the Idempotency-Key header
+IDEMPOTENT_ROUTES = (
+    ("POST", re.compile(r"^/tickets/?$")),
+    ("POST", re.compile(r"^/tickets/\d+/executors/?$")),
+    ("POST", re.compile(r"^/projects/?$")),
+    ("POST", re.compile(r"^/projects/\d+/members/?$")),
+    ("POST", re.compile(r"^/projects/\d+/members:batch$")),
+)
+
+MAX_KEY_LENGTH = 255
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    fingerprint: str
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+
+async def _send_json(send, status: int, body: bytes) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class IdempotencyMiddleware:
+    """Replay the stored response of a retried create or assign request.
+
+    A request carrying an Idempotency-Key is identified by that key and its
+    client (see rate_limit.client_key). The first request runs and its
+    response (unless 5xx) is kept in a bounded TTL cache; retries get the
+    same status, headers and body back with `Idempotent-Replayed: true`.
+    Duplicates arriving while the first one still runs wait for its result
+    instead of executing. Reusing a key for a different request is a 422.
+
+    Responses are kept per worker process, so retries are only deduplicated
+    when they reach the same worker.
+    """
+
+    def __init__(self, app, store: TTLCache | None = None, routes=IDEMPOTENT_ROUTES):
+        self.app = app
+        self.store = store or TTLCache(
+            "idempotency", settings.IDEMPOTENCY_MAX_ENTRIES, settings.IDEMPOTENCY_TTL
+        )
+        self.routes = routes
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+
+    def _applies(self, scope) -> bool:
+        return scope["type"] == "http" and any(
+            scope["method"] == method and pattern.match(scope["path"])
+            for method, pattern in self.routes
+        )
+
+    async def __call__(self, scope, receive, send):
+        idempotency_key = None
+        if self._applies(scope):
+            for name, value in scope["headers"]:
+                if name == b"idempotency-key":
+                    idempotency_key = value
+                    break
+        if not idempotency_key:
+            await self.app(scope, receive, send)
+            return
+        if len(idempotency_key) > MAX_KEY_LENGTH:
+            await _send_json(send, 400, b'{"detail":"Idempotency-Key is too long"}')
+            return
+
+        body = await self._read_body(receive)
+        fingerprint = hashlib.blake2b(
+            b"%s %s\n%s" % (scope["method"].encode(), scope["path"].encode(), body),
+            digest_size=16,
+        ).hexdigest()
+        key = (client_key(scope), idempotency_key)
+
+        while True:
+            stored = self.store.get(key)
+            if stored is None and key in self._in_flight:
+                # Coalesce with the running request; None means it failed
+                stored = await asyncio.shield(self._in_flight[key])
+                if stored is None:
+                    continue
+            if stored is not None:
+                await self._replay(stored, fingerprint, send)
+                return
+            break
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        stored = None
+        try:
+            stored = await self._execute(scope, body, receive, send, fingerprint)
+        finally:
+            del self._in_flight[key]
+            future.set_result(stored)
+        if stored is not None:
+            self.store.set(key, stored)
+
+    @staticmethod
+    async def _read_body(receive) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    async def _execute(self, scope, body, receive, send, fingerprint):
+        """Run the request and capture its response, None when it is 5xx."""
+        body_sent = False
+        start = None
+        chunks = []
+
+        async def replay_receive():
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        async def capture_send(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, replay_receive, capture_send)
+        if start is None or start["status"] >= 500:
+            return None
+        return StoredResponse(
+            fingerprint=fingerprint,
+            status=start["status"],
+            headers=list(start.get("headers", [])),
+            body=b"".join(chunks),
+        )
+
+    @staticmethod
+    async def _replay(stored: StoredResponse, fingerprint: str, send) -> None:
+        if stored.fingerprint != fingerprint:
+            await _send_json(
+                send,
+                422,
+                b'{"detail":"Idempotency-Key was already used for a different request"}',
+            )
+            return
+        await send(
+            {
+                "type": "http.response.start",
+                "status": stored.status,
+                "headers": stored.headers + [(b"idempotent-replayed", b"true")],
+            }
+        )
+        await send({"type": "http.response.body", "body": stored.body})
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from typing import Callable
+
+from app.core.rabbitmq import RabbitMQConnection, get_rabbitmq_connection
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Fanout exchange every worker binds a private queue to
+INVALIDATION_EXCHANGE = "cache_invalidations"
+
+# Called with the id and version of the changed entity
+Handler = Callable[[object, object], None]
+
+
+class InvalidationBus:
+    """Tell the other workers which cached entities a committed write changed.
+
+    Caches register a handler per entity name. After committing, a writer
+    drops its own entries and publishes `(entity, id, version)` to a fanout
+    exchange; every worker with the bus enabled consumes it in its lifespan
+    and runs the handlers of that entity. `version` is None for entities
+    without one. Delivery is best effort, so caches keep their TTL as the
+    bound on staleness when a message is lost.
+    """
+
+    def __init__(self, exchange: str = INVALIDATION_EXCHANGE):
+        self.exchange = exchange
+        # Lets a worker skip its own messages, it has invalidated already
+        self.origin = uuid.uuid4().hex
+        self._handlers: dict[str, list[Handler]] = defaultdict(list)
+        self._consumer: asyncio.Task | None = None
+
+    def register(self, entity: str, handler: Handler) -> None:
+        """Run `handler(id, version)` for every invalidation of `entity`."""
+        self._handlers[entity].append(handler)
+
+    def dispatch(self, message: dict) -> None:
+        """Run the handlers of a received invalidation."""
+        for handler in self._handlers.get(message.get("entity"), ()):
+            try:
+                handler(message.get("id"), message.get("version"))
+            except Exception:
+                logger.exception("Invalidation handler failed for %s", message)
+
+    async def publish(self, entity: str, id, version=None) -> None:
+        """Broadcast an invalidation to the other workers (best effort)."""
+        if not settings.INVALIDATION_BUS_ENABLED:
+            return
+        message = {"entity": entity, "id": id, "version": version}
+        rabbitmq = await get_rabbitmq_connection()
+        try:
+            await rabbitmq.publish(
+                exchange_name=self.exchange,
+                message_body={**message, "origin": self.origin},
+            )
+        except Exception:
+            # The write is committed, the TTL covers the other workers
+            logger.exception("Failed to publish invalidation %s", message)
+
+    def start(self) -> None:
+        """Start consuming invalidations, when the bus is enabled."""
+        if settings.INVALIDATION_BUS_ENABLED and self._consumer is None:
+            self._consumer = asyncio.create_task(self._consume())
+
+    async def close(self) -> None:
+        """Stop the broker consumer."""
+        if self._consumer is not None:
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+
+    async def _consume(self) -> None:
+        """Consume the exchange, reconnecting on broker failures."""
+        while True:
+            try:
+                async for message in RabbitMQConnection().subscribe(self.exchange):
+                    if message.get("origin") != self.origin:
+                        self.dispatch(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Invalidation consumer failed, reconnecting")
+            await asyncio.sleep(1)
+
+
+# The invalidation bus of this worker process, consumed from the app lifespan
+invalidation_bus = InvalidationBus()
@@ -0,0 +1,228 @@
+import asyncio
+import logging
+import uuid
+import zlib
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from sqlalchemy import Column, DateTime, Integer, String, Text, delete, func, select
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.base import Base
+from app.core.database import AsyncSessionLocal
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Job:
+    """A background task started by a request, polled through /jobs/{id}."""
+
+    kind: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = "pending"
+    progress: dict = field(default_factory=dict)
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: Optional[datetime] = None
+    # Who may read the job besides admins, None for admins only
+    started_by: Optional[int] = None
+
+    @classmethod
+    def from_record(cls, record: "JobRecord") -> "Job":
+        return cls(
+            kind=record.kind,
+            id=record.id,
+            status=record.status,
+            progress=record.progress,
+            error=record.error,
+            created_at=record.created_at,
+            finished_at=record.finished_at,
+            started_by=record.started_by,
+        )
+
+    def snapshot(self) -> dict:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": dict(self.progress),
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at and self.finished_at.isoformat(),
+        }
+
+
+class JobRecord(Base):
+    """The last recorded state of a job, readable from every worker."""
+
+    __tablename__ = "jobs"
+
+    id = Column(String(32), primary_key=True)
+    kind = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False)
+    progress = Column(JSONB, nullable=False)
+    error = Column(Text, nullable=True)
+    started_by = Column(Integer, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=True, index=True)
+
+
+class JobRegistry:
+    """Runs jobs as asyncio tasks of this worker and remembers their outcome.
+
+    Jobs run in the worker that started them and stop with the process, so
+    every job must be safe to start again (see app.projects.jobs for how
+    deletions resume). With `persist`, their state is also recorded in the
+    jobs table when they start and finish and every JOB_PROGRESS_INTERVAL
+    seconds in between, so any worker can report it; records are kept for
+    JOB_HISTORY_DAYS. Jobs open their sessions through `session_factory`,
+    which tests point at their own engine.
+    """
+
+    def __init__(
+        self,
+        history: int = 1000,
+        session_factory: sessionmaker = AsyncSessionLocal,
+        persist: bool = False,
+    ):
+        self.history = history
+        self.session_factory = session_factory
+        self.persist = persist
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    async def start(
+        self,
+        kind: str,
+        func: Callable[..., Awaitable],
+        *args,
+        started_by: Optional[int] = None,
+    ) -> Job:
+        """Run `func(job, *args)` in the background and return its job."""
+        job = Job(kind=kind, started_by=started_by)
+        self._jobs[job.id] = job
+        while len(self._jobs) > self.history:
+            oldest = next(iter(self._jobs))
+            if oldest in self._tasks:
+                break
+            del self._jobs[oldest]
+        # Recorded before its id is handed out, for polls reaching other workers
+        await self._save(job, prune=True)
+        self._tasks[job.id] = asyncio.create_task(self._run(job, func, args))
+        return job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        """A job of this worker, or the recorded state of another worker's job."""
+        job = self._jobs.get(job_id)
+        if job is None and self.persist:
+            async with self.session_factory() as session:
+                record = await session.get(JobRecord, job_id)
+            if record is not None:
+                job = Job.from_record(record)
+        return job
+
+    @asynccontextmanager
+    async def exclusive(self, kind: str, key: int) -> AsyncIterator[bool]:
+        """Try to take the lock on (`kind`, `key`) across all workers for the block.
+
+        Yields whether it was taken. The transaction-scoped advisory lock is
+        held by a session of its own, so the job commits freely meanwhile;
+        it goes away when the block exits or the worker dies.
+        """
+        namespace = zlib.crc32(kind.encode()) & 0x7FFFFFFF
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(func.pg_try_advisory_xact_lock(namespace, key))
+            )
+            yield result.scalar_one()
+
+    async def _run(self, job: Job, func, args) -> None:
+        job.status = "running"
+        work = asyncio.ensure_future(func(job, *args))
+        try:
+            await self._save(job)
+            while not work.done():
+                await asyncio.wait([work], timeout=settings.JOB_PROGRESS_INTERVAL)
+                if not work.done():
+                    await self._save(job)
+            work.result()
+            job.status = "succeeded"
+        except asyncio.CancelledError:
+            work.cancel()
+            await asyncio.gather(work, return_exceptions=True)
+            job.status = "cancelled"
+            raise
+        except Exception as exc:
+            logger.exception("Job %s (%s) failed", job.id, job.kind)
+            job.status = "failed"
+            job.error = str(exc)
+        finally:
+            job.finished_at = datetime.now(timezone.utc)
+            await self._save(job)
+            self._tasks.pop(job.id, None)
+
+    async def _save(self, job: Job, prune: bool = False) -> None:
+        """Record the state of a job; a failure only delays what others see."""
+        if not self.persist:
+            return
+        values = {
+            "kind": job.kind,
+            "status": job.status,
+            "progress": dict(job.progress),
+            "error": job.error,
+            "started_by": job.started_by,
+            "created_at": job.created_at,
+            "finished_at": job.finished_at,
+        }
+        try:
+            async with self.session_factory() as session:
+                await session.execute(
+                    insert(JobRecord)
+                    .values(id=job.id, **values)
+                    .on_conflict_do_update(index_elements=[JobRecord.id], set_=values)
+                )
+                if prune:
+                    expired = datetime.now(timezone.utc) - timedelta(
+                        days=settings.JOB_HISTORY_DAYS
+                    )
+                    await session.execute(
+                        delete(JobRecord).where(JobRecord.finished_at < expired)
+                    )
+                await session.commit()
+        except Exception as exc:
+            logger.warning("Could not record job %s (%s): %s", job.id, job.kind, exc)
+
+    async def close(self) -> None:
+        """Cancel the running jobs, on shutdown."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def drain(
+    batch: Callable[[], Awaitable], remaining: Callable[[], Awaitable[bool]]
+) -> AsyncIterator:
+    """Run `batch()` until `remaining()` is false, yielding its non-empty results.
+
+    Batches skip the rows other transactions hold locked, so an empty batch
+    only means done once `remaining()` agrees; until then wait and retry.
+    """
+    while True:
+        result = await batch()
+        if result:
+            yield result
+        elif await remaining():
+            await asyncio.sleep(settings.JOB_LOCKED_ROWS_BACKOFF)
+        else:
+            return
+
+
+# The jobs of this worker process, recorded for every worker
+job_registry = JobRegistry(persist=True)
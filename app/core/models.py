@@ -1,4 +1,10 @@
 from app.core.base import Base
+from app.core.jobs import JobRecord
 from app.users.models import User
 from app.projects.models import Project, ProjectMember
-from app.tickets.models import Ticket, TicketExecutor
+from app.tickets.models import (
+    ArchivedTicket,
+    ArchivedTicketExecutor,
+    Ticket,
+    TicketExecutor,
+)
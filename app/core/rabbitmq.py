@@ -1,30 +1,119 @@
-import aio_pika
-from aio_pika import Message
+import asyncio
 import json
+import logging
+
 from app.core.settings import settings
 
+# aio_pika is imported on first use: web workers only need it once they publish
+
+logger = logging.getLogger(__name__)
+
 
 class RabbitMQConnection:
-    """Class to handle RabbitMQ connection and messaging."""
+    """Class to handle RabbitMQ connection and messaging.
+
+    After open() every publish reuses one robust connection and channel of
+    the process; without it each publish opens its own short connection.
+    close() waits for in-flight publishes before closing the connection.
+    """
 
     def __init__(self, rabbitmq_url: str = None):
         self.rabbitmq_url = rabbitmq_url or settings.RABBITMQ_URL
+        self._connection = None
+        self._channel = None
+        self._exchanges = {}
+        self._in_flight = 0
+        self._drained = asyncio.Event()
+        self._drained.set()
 
     async def connect(self):
         """Connect to RabbitMQ server."""
+        import aio_pika
+
         return await aio_pika.connect_robust(self.rabbitmq_url)
 
+    async def open(self) -> None:
+        """Open the process-wide connection and channel used for publishing."""
+        self._connection = await self.connect()
+        self._channel = await self._connection.channel()
+
+    async def close(self, timeout: float = settings.GRACEFUL_SHUTDOWN_TIMEOUT):
+        """Wait for in-flight publishes, then close the shared connection."""
+        try:
+            await asyncio.wait_for(self._drained.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Closing RabbitMQ with %s unsent messages", self._in_flight)
+        if self._connection is not None:
+            await self._connection.close()
+        self._connection = self._channel = None
+        self._exchanges.clear()
+
+    async def _publish(self, exchange_name: str, routing_key: str, body: dict):
+        import aio_pika
+
+        message = aio_pika.Message(body=json.dumps(body).encode())
+        self._in_flight += 1
+        self._drained.clear()
+        try:
+            if self._channel is not None:
+                await self._publish_on(
+                    self._channel, exchange_name, message, routing_key
+                )
+                return
+            connection = await self.connect()
+            async with connection:
+                channel = await connection.channel()
+                await self._publish_on(channel, exchange_name, message, routing_key)
+        finally:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._drained.set()
+
+    async def _publish_on(self, channel, exchange_name, message, routing_key):
+        if not exchange_name:
+            await channel.default_exchange.publish(message, routing_key=routing_key)
+            return
+        exchange = await self.declare_fanout(channel, exchange_name)
+        await exchange.publish(message, routing_key=routing_key)
+
+    async def declare_fanout(self, channel, exchange_name: str):
+        """Declare a durable fanout exchange, once per shared channel."""
+        import aio_pika
+
+        if channel is self._channel and exchange_name in self._exchanges:
+            return self._exchanges[exchange_name]
+        exchange = await channel.declare_exchange(
+            exchange_name, aio_pika.ExchangeType.FANOUT, durable=True
+        )
+        if channel is self._channel:
+            self._exchanges[exchange_name] = exchange
+        return exchange
+
     async def send_message(self, queue_name: str, message_body: dict):
         """Send a message to the RabbitMQ queue."""
+        await self._publish("", queue_name, message_body)
+
+    async def publish(self, exchange_name: str, message_body: dict):
+        """Publish a message to every queue bound to a fanout exchange."""
+        await self._publish(exchange_name, "", message_body)
+
+    async def subscribe(self, exchange_name: str):
+        """Yield decoded messages from a private queue bound to a fanout exchange."""
         connection = await self.connect()
         async with connection:
             channel = await connection.channel()
-            await channel.default_exchange.publish(
-                Message(body=json.dumps(message_body).encode()),
-                routing_key=queue_name,
-            )
+            exchange = await self.declare_fanout(channel, exchange_name)
+            queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+            await queue.bind(exchange)
+            async with queue.iterator(no_ack=True) as messages:
+                async for message in messages:
+                    yield json.loads(message.body)
+
+
+# The publishing connection of this process, opened and drained by the app lifespan
+rabbitmq_connection = RabbitMQConnection()
 
 
 # Dependency to inject RabbitMQ connection where needed
 async def get_rabbitmq_connection():
-    return RabbitMQConnection(settings.RABBITMQ_URL)
+    return rabbitmq_connection
@@ -0,0 +1,208 @@
+import logging
+import math
+import time
+
+from sqlalchemy import Float, bindparam, text
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Token cost of a request by path prefix, first match wins, everything else costs 1
+ROUTE_COSTS = (
+    ("/tickets/list/", 10),
+    ("/users/login", 5),
+    ("/users/signup", 5),
+)
+
+# Probes, metrics and docs are never limited
+EXEMPT_PATHS = frozenset(
+    {"/", "/ready", "/metrics", "/docs", "/redoc", "/openapi.json"}
+)
+
+
+def client_key(scope) -> str:
+    """Rate limit key of a request: the JWT `id` claim, or the client address.
+
+    Tokens are verified through decode_access_token, whose cache keeps the
+    claims of valid tokens until they expire.
+    """
+    from jose.exceptions import JWTError
+
+    from app.users.utils import decode_access_token
+
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                try:
+                    payload = decode_access_token(token)
+                except JWTError:
+                    break
+                if (
+                    payload.get("id") is not None
+                    and payload.get("exp", math.inf) > time.time()
+                ):
+                    return f"user:{payload['id']}"
+            break
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+def route_cost(path: str, costs=ROUTE_COSTS) -> int:
+    for prefix, cost in costs:
+        if path.startswith(prefix):
+            return cost
+    return 1
+
+
+class InMemoryBucketStore:
+    """Token buckets held by this process only.
+
+    Each key maps to [tokens, last_refill]. With several workers every
+    process keeps its own buckets, so a client gets up to WORKERS times
+    the configured rate; use PostgresBucketStore when that matters.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float, max_keys: int = 100_000):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.max_keys = max_keys
+        self._buckets: dict[str, list[float]] = {}
+
+    async def take(self, key: str, cost: float) -> float:
+        """Spend `cost` tokens; return 0 when allowed, else seconds to wait."""
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                self._prune(now)
+            bucket = self._buckets[key] = [self.capacity, now]
+        tokens = min(self.capacity, bucket[0] + (now - bucket[1]) * self.refill_rate)
+        bucket[1] = now
+        if tokens >= cost:
+            bucket[0] = tokens - cost
+            return 0.0
+        bucket[0] = tokens
+        return (cost - tokens) / self.refill_rate
+
+    def _prune(self, now: float) -> None:
+        """Drop buckets that have refilled completely, they equal a new bucket."""
+        full_after = self.capacity / self.refill_rate
+        self._buckets = {
+            key: bucket
+            for key, bucket in self._buckets.items()
+            if now - bucket[1] < full_after
+        }
+
+
+class PostgresBucketStore:
+    """Token buckets shared by every worker in the UNLOGGED rate_limit_buckets table.
+
+    One upsert per request refills and spends the bucket atomically, using
+    the database clock so workers on different hosts agree on elapsed time.
+    The table is unlogged: buckets are lost on a crash, which only resets
+    the limits.
+    """
+
+    TAKE = text(
+        """
+        INSERT INTO rate_limit_buckets AS b (key, tokens, updated_at, allowed)
+        VALUES (:key, :capacity - :cost, extract(epoch FROM statement_timestamp()), true)
+        ON CONFLICT (key) DO UPDATE SET
+            allowed = least(:capacity, b.tokens
+                + (extract(epoch FROM statement_timestamp()) - b.updated_at) * :rate)
+                >= :cost,
+            tokens = least(:capacity, b.tokens
+                + (extract(epoch FROM statement_timestamp()) - b.updated_at) * :rate)
+                - CASE WHEN least(:capacity, b.tokens
+                    + (extract(epoch FROM statement_timestamp()) - b.updated_at) * :rate)
+                    >= :cost THEN :cost ELSE 0 END,
+            updated_at = extract(epoch FROM statement_timestamp())
+        RETURNING tokens, allowed
+        """
+    ).bindparams(
+        # Typed, or Postgres cannot resolve `:capacity - :cost` on unknowns
+        bindparam("capacity", type_=Float),
+        bindparam("cost", type_=Float),
+        bindparam("rate", type_=Float),
+    )
+
+    def __init__(self, engine, capacity: float, refill_rate: float):
+        self.engine = engine
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+
+    async def take(self, key: str, cost: float) -> float:
+        """Spend `cost` tokens; return 0 when allowed, else seconds to wait."""
+        try:
+            async with self.engine.begin() as connection:
+                result = await connection.execute(
+                    self.TAKE,
+                    {
+                        "key": key,
+                        "cost": cost,
+                        "capacity": self.capacity,
+                        "rate": self.refill_rate,
+                    },
+                )
+                tokens, allowed = result.one()
+        except Exception as exc:
+            # Fail open: an unavailable limiter must not take the API down
+            logger.warning("Rate limit backend unavailable: %s", exc)
+            return 0.0
+        return 0.0 if allowed else (cost - tokens) / self.refill_rate
+
+
+def build_store():
+    """The bucket store selected by RATE_LIMIT_BACKEND."""
+    if settings.RATE_LIMIT_BACKEND == "postgres":
+        from app.core.database import engine
+
+        return PostgresBucketStore(
+            engine, settings.RATE_LIMIT_CAPACITY, settings.RATE_LIMIT_REFILL_RATE
+        )
+    return InMemoryBucketStore(
+        settings.RATE_LIMIT_CAPACITY, settings.RATE_LIMIT_REFILL_RATE
+    )
+
+
+class RateLimitMiddleware:
+    """Per-client token bucket limiting as a pure ASGI middleware.
+
+    Requests are keyed by the `id` claim of their bearer token (verified
+    once per token and cached) or by client address when anonymous, and
+    spend the cost of their route. Over the limit the request is answered
+    with 429 and a Retry-After header without reaching the app.
+    """
+
+    def __init__(self, app, store=None, costs=ROUTE_COSTS, exempt=EXEMPT_PATHS):
+        self.app = app
+        self.store = store if store is not None else build_store()
+        self.costs = costs
+        self.exempt = exempt
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exempt:
+            await self.app(scope, receive, send)
+            return
+
+        cost = min(route_cost(scope["path"], self.costs), self.store.capacity)
+        wait = await self.store.take(client_key(scope), cost)
+        if not wait:
+            await self.app(scope, receive, send)
+            return
+
+        body = b'{"detail":"Rate limit exceeded"}'
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(math.ceil(wait)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
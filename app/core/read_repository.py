@@ -0,0 +1,42 @@
+from collections import namedtuple
+from functools import lru_cache
+from typing import Type
+
+from pydantic import BaseModel as Schema
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.base_model import BaseModel
+
+
+@lru_cache(maxsize=None)
+def row_type(schema: Type[Schema]) -> type:
+    """A tuple-backed DTO class with exactly the fields of a response schema."""
+    return namedtuple(f"{schema.__name__}Row", list(schema.model_fields))
+
+
+def select_for(model: Type[BaseModel], schema: Type[Schema]) -> Select:
+    """SELECT only the columns of `model` that `schema` exposes."""
+    return select(*(getattr(model, name) for name in schema.model_fields))
+
+
+class ReadRepository:
+    """Read-side queries mapping column rows straight into DTOs.
+
+    Rows selected column by column never enter the session's identity map
+    and skip attribute instrumentation, which makes them much cheaper than
+    entities for endpoints that only serialise what they read.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def fetch_one(self, schema: Type[Schema], query: Select):
+        result = await self.db_session.execute(query)
+        row = result.first()
+        return row_type(schema)._make(row) if row is not None else None
+
+    async def fetch_all(self, schema: Type[Schema], query: Select) -> list:
+        result = await self.db_session.execute(query)
+        make = row_type(schema)._make
+        return [make(row) for row in result]
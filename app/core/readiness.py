@@ -0,0 +1,55 @@
+import asyncio
+import importlib
+import logging
+import time
+
+from fastapi import FastAPI
+from sqlalchemy import text
+
+from app.core.database import engine
+from app.core.rabbitmq import rabbitmq_connection
+from app.core.settings import settings
+from app.users.role_claims import load_role_changes
+from app.users.utils import get_pwd_context
+
+logger = logging.getLogger(__name__)
+
+# Modules kept out of the import path of app.main, loaded once the server listens
+DEFERRED_MODULES = ("jose.jwt", "aio_pika")
+
+
+async def _ping_database() -> None:
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+async def warm_up(app: FastAPI, retry_interval: float = 2.0) -> None:
+    """Fill the connection pool and load deferred backends, then mark the app ready."""
+    started = time.perf_counter()
+    while True:
+        try:
+            # Concurrent checkouts force the pool to open every connection
+            await asyncio.gather(*(_ping_database() for _ in range(engine.pool.size())))
+            break
+        except Exception as exc:
+            logger.warning("Database not reachable yet (%s), retrying", exc)
+            await asyncio.sleep(retry_interval)
+
+    if settings.ROLE_CLAIMS_ENABLED:
+        # Role checks must know the recent demotions before taking traffic
+        await load_role_changes()
+
+    get_pwd_context().handler().get_backend()
+    for module in DEFERRED_MODULES:
+        importlib.import_module(module)
+
+    try:
+        await rabbitmq_connection.open()
+    except Exception as exc:
+        # Publishing falls back to one connection per message
+        logger.warning("RabbitMQ not reachable (%s), publishing without a pool", exc)
+
+    app.state.ready = True
+    logger.info(
+        "Application ready after %.0f ms", (time.perf_counter() - started) * 1000
+    )
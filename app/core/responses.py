@@ -0,0 +1,45 @@
+from functools import lru_cache
+from typing import Any, Type
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[schema])
+
+
+def dump_json(schema: Type[BaseModel], content: Any) -> bytes:
+    """Validate SQLAlchemy rows (or a list of them) into `schema` and serialise to JSON."""
+    if isinstance(content, list):
+        adapter = _list_adapter(schema)
+        return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+    return schema.model_validate(content, from_attributes=True).model_dump_json()
+
+
+def json_response(
+    body: bytes, status_code: int = 200, headers: dict | None = None
+) -> Response:
+    """Send already serialised JSON bytes as they are."""
+    return Response(
+        content=body,
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+def model_response(
+    schema: Type[BaseModel],
+    content: Any,
+    status_code: int = 200,
+    headers: dict | None = None,
+) -> Response:
+    """Validate SQLAlchemy rows into `schema` once and serialise them to JSON bytes.
+
+    Returning the Response directly skips FastAPI's second response_model
+    validation and the jsonable_encoder pass; the route's response_model is
+    still used for the OpenAPI schema.
+    """
+    return json_response(dump_json(schema, content), status_code, headers)
@@ -1,7 +1,13 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import caches
 from app.core.database import get_db
+from app.core.jobs import job_registry
+from app.users.dependencies import get_current_principal
+from app.users.models import UserRole
+from app.users.principals import Principal
 
 router = APIRouter()
 
@@ -12,6 +18,37 @@ async def read_root():
     return {"message": "Welcome to the Task Tracker API!"}
 
 
+# Readiness probe ("/ready") - 503 until the lifespan warm-up has finished
+@router.get("/ready")
+async def readiness(request: Request):
+    if getattr(request.app.state, "ready", False):
+        return {"status": "ready"}
+    return ORJSONResponse(
+        {"status": "warming up"}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+    )
+
+
+# Cache metrics ("/metrics") - size and hit rate of this worker's caches
+@router.get("/metrics")
+async def metrics():
+    return {"caches": {name: cache.snapshot() for name, cache in caches.items()}}
+
+
+# Background job status ("/jobs/{job_id}") - for admins and whoever started the job
+@router.get("/jobs/{job_id}")
+async def get_job(
+    job_id: str, current_user: Principal = Depends(get_current_principal)
+):
+    job = await job_registry.get(job_id)
+    if job is None or (
+        current_user.role != UserRole.ADMIN and job.started_by != current_user.id
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
+        )
+    return job.snapshot()
+
+
 # Database connection check ("/check_db")
 @router.get("/check_db")
 async def check_db_connection(db: AsyncSession = Depends(get_db)):
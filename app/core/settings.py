@@ -9,12 +9,70 @@ class Settings(BaseSettings):
     DB_PASSWORD: str
     DB_HOST: str
     DB_PORT: int
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_ECHO: bool = False
 
     # Application settings
     UNSEPARATED_CORS_ORIGINS: str
     HOST: str
     PORT: int
-    RELOAD: bool = True if 1 else False
+    RELOAD: bool = False
+    WORKERS: int = 1
+    GRACEFUL_SHUTDOWN_TIMEOUT: int = 30
+
+    # Rate limiting, per user (or client address when anonymous)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_CAPACITY: int = 300
+    RATE_LIMIT_REFILL_RATE: float = 5.0
+    RATE_LIMIT_BACKEND: str = "memory"
+
+    # Idempotency-Key responses kept for replay, per worker
+    IDEMPOTENCY_TTL: int = 86400
+    IDEMPOTENCY_MAX_ENTRIES: int = 10000
+
+    # Project access checks cached per (project_id, user_id), per worker
+    PROJECT_ACCESS_CACHE_SIZE: int = 10000
+    PROJECT_ACCESS_CACHE_TTL: int = 30
+
+    # Principals (id, email, role, is_active) shared by the workers of a node
+    PRINCIPAL_CACHE_ENABLED: bool = False
+    PRINCIPAL_CACHE_PATH: str = "/dev/shm/ticket_system_principals"
+    PRINCIPAL_CACHE_SLOTS: int = 65536  # a power of two
+    PRINCIPAL_CACHE_TTL: int = 300
+
+    # Role-gated routes trust the token's role claim instead of loading the user;
+    # role changes of the token lifetime are kept per worker, up to this many
+    ROLE_CLAIMS_ENABLED: bool = False
+    ROLE_CHANGES_MAX_ENTRIES: int = 100000
+    # and every worker re-reads the recently updated users this often, in seconds
+    ROLE_CHANGES_POLL_INTERVAL: float = 5
+
+    # Broadcast cache invalidations to the other workers over RabbitMQ
+    INVALIDATION_BUS_ENABLED: bool = False
+
+    # Background jobs wait this long before retrying rows locked by another transaction
+    JOB_LOCKED_ROWS_BACKOFF: float = 0.5
+    # and record their progress this often, in seconds; records are kept for days
+    JOB_PROGRESS_INTERVAL: float = 1.0
+    JOB_HISTORY_DAYS: int = 7
+
+    # Background deletion of projects
+    PROJECT_DELETE_BATCH_SIZE: int = 1000
+    PROJECT_DELETE_BATCH_PAUSE: float = 0.05
+
+    # Background deletion of users
+    USER_DELETE_BATCH_SIZE: int = 1000
+    USER_DELETE_BATCH_PAUSE: float = 0.05
+
+    # Pre-serialised ticket lists kept per worker, in bytes
+    TICKET_SNAPSHOT_CACHE_BYTES: int = 64 * 1024 * 1024
+
+    # Retention: DONE tickets and tickets of archived projects move to the archive
+    TICKET_ARCHIVE_AFTER_DAYS: int = 90
+    TICKET_ARCHIVE_INTERVAL: float = 3600  # 0 disables the schedule
+    TICKET_ARCHIVE_BATCH_SIZE: int = 1000
+    TICKET_ARCHIVE_BATCH_PAUSE: float = 0.05
 
     # RabbitMQ settings
     RABBITMQ_HOST: str
@@ -24,10 +82,41 @@ class Settings(BaseSettings):
     RABBITMQ_VHOST: str
     RABBITMQ_MANAGEMENT_PORT: int
 
+    # Ticket event stream settings
+    EVENTS_SUBSCRIBER_BUFFER: int = 100
+    EVENTS_KEEPALIVE_SECONDS: int = 15
+
+    # Notification worker settings
+    NOTIFY_PREFETCH: int = 100
+    NOTIFY_CONCURRENCY: int = 10
+    NOTIFY_BATCH_SIZE: int = 50
+    NOTIFY_BATCH_TIMEOUT: float = 1.0
+    NOTIFY_MAX_RETRIES: int = 5
+    NOTIFY_RETRY_BACKOFF: float = 2.0
+    NOTIFY_METRICS_INTERVAL: int = 60
+    NOTIFY_DIGEST_WINDOW: int = 300
+    NOTIFY_SENDER: str = "noreply@tasksystem.local"
+
+    # SMTP settings (email notifications are only logged when SMTP_HOST is empty)
+    SMTP_HOST: str = ""
+    SMTP_PORT: int = 25
+    SMTP_USER: str = ""
+    SMTP_PASSWORD: str = ""
+    SMTP_USE_TLS: bool = False
+    SMTP_POOL_SIZE: int = 4
+
     # JWT settings
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    TOKEN_CACHE_SIZE: int = 10000  # verified tokens kept per worker, 0 disables
+
+    # Password hashing: new hashes use the first scheme, the others are rehashed on login
+    PASSWORD_SCHEMES: str = "bcrypt"
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_ARGON2_TIME_COST: int = 3
+    PASSWORD_ARGON2_MEMORY_COST: int = 65536  # KiB
+    PASSWORD_ARGON2_PARALLELISM: int = 4
 
     model_config = ConfigDict(env_file=".env")
 
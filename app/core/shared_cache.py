@@ -0,0 +1,214 @@
+import fcntl
+import mmap
+import os
+import struct
+import time
+from contextlib import contextmanager
+
+from app.core.cache import CacheStats, caches
+
+MAGIC = b"TSSHM001"
+# magic, slots, slot size
+FILE_HEADER = struct.Struct("<8sQQ")
+FILE_HEADER_SIZE = 64
+
+# A slot: seq, then key, version, expires_at, value length and flags, then the value
+SEQ = struct.Struct("<Q")
+SLOT_HEADER = struct.Struct("<qqdHB")
+
+EMPTY = 0
+# An invalidation: blocks writes of older versions, reads as a miss
+FENCE = 1
+MAX_VERSION = 2**63 - 1
+
+MAX_PROBES = 8
+READ_RETRIES = 4
+
+
+class SharedMemoryCache:
+    """A fixed-size hash table of versioned byte values in a shared `mmap`.
+
+    Every worker process on a node maps the same file (under /dev/shm by
+    default), so an entry cached by one worker is a hit for all of them.
+    Keys are positive integers, placed by open addressing with linear
+    probing over at most MAX_PROBES slots; when those are full the entry
+    closest to expiry is evicted, fences last.
+
+    Reads take no lock: each slot carries a sequence number that writers
+    make odd while they write it (a seqlock), and readers retry or miss
+    when it changed under them. Writes are rare (cache fills and
+    invalidations) and serialised across processes with `flock`. A write
+    never replaces a newer version of the same key, and `invalidate`
+    leaves a fence so that a fill racing with an update cannot bring the
+    old version back.
+    """
+
+    def __init__(self, name: str, path: str, slots: int, value_size: int, ttl: float):
+        if slots & (slots - 1):
+            raise ValueError("slots must be a power of two")
+        self.name = name
+        self.path = path
+        self.slots = slots
+        self.value_size = value_size
+        self.ttl = ttl
+        # Slots are aligned to cache lines
+        self.slot_size = -(-(SEQ.size + SLOT_HEADER.size + value_size) // 64) * 64
+        self.stats = CacheStats()
+        self._mask = slots - 1
+        self._fd, self._mmap = self._open()
+        caches[name] = self
+
+    def _open(self):
+        """Map the table file, creating or resetting it when its layout differs."""
+        size = FILE_HEADER_SIZE + self.slots * self.slot_size
+        header = FILE_HEADER.pack(MAGIC, self.slots, self.slot_size)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                current = os.pread(fd, FILE_HEADER.size, 0)
+                if current != header or os.fstat(fd).st_size != size:
+                    os.ftruncate(fd, 0)
+                    os.ftruncate(fd, size)
+                    os.pwrite(fd, header, 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            return fd, mmap.mmap(fd, size)
+        except BaseException:
+            os.close(fd)
+            raise
+
+    def close(self) -> None:
+        self._mmap.close()
+        os.close(self._fd)
+        caches.pop(self.name, None)
+
+    def _offsets(self, key: int):
+        """Offsets of the slots `key` may live in, in probe order."""
+        home = ((key * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 32
+        for probe in range(MAX_PROBES):
+            yield FILE_HEADER_SIZE + ((home + probe) & self._mask) * self.slot_size
+
+    def _read_slot(self, offset: int, key: int):
+        """A consistent (key, version, expires_at, flags, payload) of a slot, or None."""
+        buffer = self._mmap
+        for _ in range(READ_RETRIES):
+            (seq,) = SEQ.unpack_from(buffer, offset)
+            if seq & 1:
+                continue
+            slot_key, version, expires_at, length, flags = SLOT_HEADER.unpack_from(
+                buffer, offset + SEQ.size
+            )
+            payload = None
+            if slot_key == key:
+                start = offset + SEQ.size + SLOT_HEADER.size
+                payload = buffer[start : start + min(length, self.value_size)]
+            if SEQ.unpack_from(buffer, offset)[0] == seq:
+                return slot_key, version, expires_at, flags, payload
+        return None
+
+    def get(self, key: int) -> tuple[int, bytes] | None:
+        """The (version, value) cached for `key`, None on a miss."""
+        now = time.time()
+        for offset in self._offsets(key):
+            slot = self._read_slot(offset, key)
+            if slot is None:
+                # Being written right now, count it as a miss
+                break
+            slot_key, version, expires_at, flags, payload = slot
+            if slot_key == EMPTY:
+                break
+            if slot_key == key:
+                if flags & FENCE or expires_at <= now:
+                    break
+                self.stats.hits += 1
+                return version, payload
+        self.stats.misses += 1
+        return None
+
+    def set(self, key: int, version: int, value: bytes) -> bool:
+        """Cache `value` unless a newer version or invalidation of `key` is cached."""
+        if len(value) > self.value_size:
+            return False
+        return self._write(key, version, value, 0)
+
+    def invalidate(self, key: int, version: int | None = None) -> None:
+        """Drop `key` and refuse values older than `version` (all of them when None)."""
+        self._write(key, MAX_VERSION if version is None else version, b"", FENCE)
+
+    def clear(self) -> None:
+        with self._locked():
+            self._mmap[FILE_HEADER_SIZE:] = bytes(len(self._mmap) - FILE_HEADER_SIZE)
+
+    @contextmanager
+    def _locked(self):
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _write(self, key: int, version: int, value: bytes, flags: int) -> bool:
+        now = time.time()
+        buffer = self._mmap
+        with self._locked():
+            target = victim = None
+            victim_rank = None
+            for offset in self._offsets(key):
+                slot_key, slot_version, expires_at, _, slot_flags = (
+                    SLOT_HEADER.unpack_from(buffer, offset + SEQ.size)
+                )
+                if slot_key == key:
+                    if slot_version > version and expires_at > now:
+                        return False
+                    target = offset
+                    break
+                free = slot_key == EMPTY or expires_at <= now
+                if free and target is None:
+                    target = offset
+                if slot_key == EMPTY:
+                    break
+                # A live fence is never evicted for a value, or its key could
+                # be filled with the old version again; a fence only replaces
+                # one when every slot holds one, the oldest going first
+                if slot_flags & FENCE and not flags & FENCE:
+                    continue
+                rank = (slot_flags & FENCE, expires_at)
+                if victim is None or rank < victim_rank:
+                    victim, victim_rank = offset, rank
+            if target is None:
+                if victim is None:
+                    return False
+                target = victim
+                self.stats.evictions += 1
+
+            (seq,) = SEQ.unpack_from(buffer, target)
+            # Odd while writing, a crashed writer may have left it odd already
+            seq |= 1
+            SEQ.pack_into(buffer, target, seq)
+            SLOT_HEADER.pack_into(
+                buffer,
+                target + SEQ.size,
+                key,
+                version,
+                now + self.ttl,
+                len(value),
+                flags,
+            )
+            start = target + SEQ.size + SLOT_HEADER.size
+            buffer[start : start + len(value)] = value
+            SEQ.pack_into(buffer, target, seq + 1)
+        return True
+
+    def snapshot(self) -> dict:
+        """Hit/miss counters of this worker, as exposed by the metrics endpoint."""
+        lookups = self.stats.hits + self.stats.misses
+        return {
+            "slots": self.slots,
+            "bytes": len(self._mmap),
+            "shared": True,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "evictions": self.stats.evictions,
+            "hit_ratio": round(self.stats.hits / lookups, 4) if lookups else None,
+        }
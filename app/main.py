@@ -1,26 +1,88 @@
+import asyncio
 from contextlib import asynccontextmanager
 
-import uvicorn
 import logging
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from fastapi.middleware.cors import CORSMiddleware
+from app.core.database import engine
+from app.core.idempotency import IdempotencyMiddleware
+from app.core.invalidation import invalidation_bus
+from app.core.jobs import job_registry
+from app.core.rabbitmq import rabbitmq_connection
+from app.core.rate_limit import RateLimitMiddleware
 from app.core.settings import settings
+from app.core.readiness import warm_up
 from app.core.router import router as api_router
 from app.tickets.routers import ticket_router
+from app.users.jobs import resume_user_deletions
 from app.users.routers import user_router
+from app.projects.jobs import resume_project_deletions
 from app.projects.routers import project_router
+from app.tickets.events import ticket_event_hub
+from app.tickets.jobs import schedule_ticket_archival
+from app.users.role_claims import poll_role_changes
 
 # Initialize logging
 logger = logging.getLogger(__name__)
 
+
+async def start_up(app: FastAPI):
+    """Warm up, resume interrupted jobs, then keep the periodic tasks running."""
+    await warm_up(app)
+    await resume_project_deletions()
+    await resume_user_deletions()
+    periodic = []
+    if settings.ROLE_CLAIMS_ENABLED:
+        periodic.append(poll_role_changes())
+    if settings.TICKET_ARCHIVE_INTERVAL:
+        periodic.append(schedule_ticket_archival())
+    await asyncio.gather(*periodic)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Per-worker startup and shutdown of the DB and broker pools.
+
+    Every uvicorn worker process runs this on its own engine and broker
+    connection. On SIGTERM uvicorn stops accepting connections and waits up
+    to GRACEFUL_SHUTDOWN_TIMEOUT for in-flight requests before the shutdown
+    half runs, which then drains unsent broker messages and closes the pools.
+    """
+    logger.info("Starting up the FastAPI application...")
+    # Serve liveness right away, /ready flips once pools and backends are warm
+    app.state.ready = False
+    invalidation_bus.start()
+    start_up_task = asyncio.create_task(start_up(app))
+    yield
+    # Shutdown logic
+    app.state.ready = False
+    start_up_task.cancel()
+    await job_registry.close()
+    await ticket_event_hub.close()
+    await invalidation_bus.close()
+    await rabbitmq_connection.close()
+    await engine.dispose()
+    logger.info("Shutting down the FastAPI application...")
+
+
 # Create the FastAPI app instance
 app = FastAPI(
     title="Ticket System",
     description="A simplified task tracker like Trello or Jira",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# Replay retried create/assign requests carrying an Idempotency-Key
+app.add_middleware(IdempotencyMiddleware)
+
+# Rate limit requests per user, inside CORS so 429 responses carry its headers
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
+
 # Add CORS Middleware
 app.add_middleware(
     CORSMiddleware,
@@ -37,14 +99,6 @@ app.include_router(project_router, prefix="/projects")
 app.include_router(ticket_router, prefix="/tickets")
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    logger.info("Starting up the FastAPI application...")
-    yield
-    # Shutdown logic
-    logger.info("Shutting down the FastAPI application...")
-
-
 # Custom logging configuration (can also be defined in a separate logging config file)
 def setup_logging():
     logging.basicConfig(
@@ -58,15 +112,26 @@ def setup_logging():
     uvicorn_log.handlers = logging.getLogger().handlers
 
 
-# Main entry point
-if __name__ == "__main__":
+def run():
+    """Launch uvicorn with the configured number of worker processes."""
+    import uvicorn
+
     setup_logging()
-    logger.info("Starting Uvicorn server...")
+    # Reload mode supports a single process only
+    workers = 1 if settings.RELOAD else settings.WORKERS
+    logger.info("Starting Uvicorn server with %s worker(s)...", workers)
 
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.RELOAD,
+        workers=workers,
+        timeout_graceful_shutdown=settings.GRACEFUL_SHUTDOWN_TIMEOUT,
         log_level="info",  # This sets the logging level for Uvicorn
     )
+
+
+# Main entry point
+if __name__ == "__main__":
+    run()
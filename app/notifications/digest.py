@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from collections import defaultdict
+from email.message import EmailMessage
+from typing import Awaitable, Callable
+
+from app.core.database import AsyncSessionLocal
+from app.core.settings import settings
+from app.tickets.repository import TicketRepository
+
+logger = logging.getLogger(__name__)
+
+RecipientResolver = Callable[[list[int]], Awaitable[dict[int, set[str]]]]
+
+# Upper bound of ticket ids sent in one recipient lookup
+RECIPIENT_CHUNK_SIZE = 500
+
+
+async def resolve_recipients(ticket_ids: list[int]) -> dict[int, set[str]]:
+    """Map ticket ids to the emails of their responsible users and executors."""
+    recipients: dict[int, set[str]] = defaultdict(set)
+    async with AsyncSessionLocal() as session:
+        repository = TicketRepository(session)
+        for start in range(0, len(ticket_ids), RECIPIENT_CHUNK_SIZE):
+            chunk = ticket_ids[start : start + RECIPIENT_CHUNK_SIZE]
+            for ticket_id, email in await repository.get_notification_recipients(chunk):
+                recipients[ticket_id].add(email)
+    return recipients
+
+
+class DigestNotifier:
+    """Coalesce ticket status changes into one email per recipient and window.
+
+    handle() is the worker's message handler and only records the latest
+    status of every ticket, so the broker message is acknowledged right
+    away; run() flushes the collected changes every `window` seconds.
+    Changes whose recipients could not be looked up, or whose digest could
+    not be sent, are kept for the next window; only a crash of the worker
+    loses the changes it holds.
+    """
+
+    def __init__(
+        self,
+        mailer,
+        resolver: RecipientResolver = resolve_recipients,
+        window: float = settings.NOTIFY_DIGEST_WINDOW,
+        sender: str = settings.NOTIFY_SENDER,
+    ):
+        self.mailer = mailer
+        self.resolver = resolver
+        self.window = window
+        self.sender = sender
+        self._pending: dict[int, dict] = {}
+        # Digests that failed to send, by recipient then ticket id
+        self._undelivered: dict[str, dict[int, dict]] = {}
+
+    async def handle(self, event: dict) -> None:
+        """Record a status change, replacing earlier changes of the same ticket."""
+        if event.get("event", "status_changed") != "status_changed":
+            return
+        previous = self._pending.get(event["ticket_id"])
+        self._pending[event["ticket_id"]] = {
+            "ticket_id": event["ticket_id"],
+            "title": (event.get("ticket") or {}).get("title"),
+            "new_status": event.get("new_status"),
+            "updated_by": event.get("updated_by"),
+            "changes": previous["changes"] + 1 if previous else 1,
+        }
+
+    async def flush(self) -> int:
+        """Send the digests of everything collected so far, returning their count."""
+        pending, self._pending = self._pending, {}
+        undelivered, self._undelivered = self._undelivered, {}
+        if not pending and not undelivered:
+            return 0
+
+        try:
+            recipients = await self.resolver(list(pending)) if pending else {}
+        except Exception:
+            # Put everything back, behind the changes recorded meanwhile
+            _add_changes(self._pending, pending.values(), older=True)
+            for email, changes in undelivered.items():
+                self._keep_undelivered(email, changes)
+            raise
+
+        digests: dict[str, dict[int, dict]] = defaultdict(dict, undelivered)
+        for ticket_id, change in pending.items():
+            for email in recipients.get(ticket_id, ()):
+                # Nobody needs an email about their own change
+                if email != change["updated_by"]:
+                    _add_changes(digests[email], [change])
+
+        results = await asyncio.gather(
+            *(
+                self.mailer.send(self.build_digest(email, list(changes.values())))
+                for email, changes in digests.items()
+            ),
+            return_exceptions=True,
+        )
+        for (email, changes), result in zip(digests.items(), results):
+            if isinstance(result, Exception):
+                logger.error("Failed to send digest to %s: %s", email, result)
+                self._keep_undelivered(email, changes)
+        return len(digests)
+
+    def _keep_undelivered(self, email: str, changes: dict[int, dict]) -> None:
+        _add_changes(
+            self._undelivered.setdefault(email, {}), changes.values(), older=True
+        )
+
+    def build_digest(self, recipient: str, changes: list[dict]) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = recipient
+        message["Subject"] = f"{len(changes)} ticket status update(s)"
+        lines = []
+        for change in sorted(changes, key=lambda change: change["ticket_id"]):
+            title = f" {change['title']}" if change["title"] else ""
+            lines.append(
+                f"- #{change['ticket_id']}{title}: now {change['new_status']}"
+                f" (last changed by {change['updated_by']},"
+                f" {change['changes']} change(s))"
+            )
+        message.set_content("\n".join(lines))
+        return message
+
+    async def run(self) -> None:
+        """Flush collected changes every window until cancelled."""
+        try:
+            while True:
+                await asyncio.sleep(self.window)
+                try:
+                    sent = await self.flush()
+                    if sent:
+                        logger.info("Sent %s notification digests", sent)
+                except Exception:
+                    logger.exception("Failed to flush notification digests")
+        finally:
+            await self.flush()
+
+
+def _add_changes(target: dict[int, dict], changes, older: bool = False) -> None:
+    """Merge ticket changes into `target`; the newer status wins, counts add up."""
+    for change in changes:
+        present = target.get(change["ticket_id"])
+        if present is not None:
+            newer = present if older else change
+            change = {**newer, "changes": present["changes"] + change["changes"]}
+        target[change["ticket_id"]] = change
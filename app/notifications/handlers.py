@@ -0,0 +1,13 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def log_notification(event: dict) -> None:
+    """Mock email delivery: log the notification a ticket change would send."""
+    logger.info(
+        "Notify: ticket %s %s by %s",
+        event.get("ticket_id"),
+        event.get("new_status") or event.get("event"),
+        event.get("updated_by"),
+    )
@@ -0,0 +1,88 @@
+import asyncio
+import logging
+import smtplib
+from email.message import EmailMessage
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SMTPPool:
+    """A bounded pool of reusable SMTP connections.
+
+    smtplib is blocking, so connections are opened and used in worker
+    threads; at most `size` messages are in flight at once and idle
+    connections are kept open for the next message.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        size: int = 4,
+        username: str = "",
+        password: str = "",
+        use_tls: bool = False,
+        timeout: float = 10.0,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(size)
+        self._idle: list[smtplib.SMTP] = []
+
+    @classmethod
+    def from_settings(cls) -> "SMTPPool":
+        return cls(
+            settings.SMTP_HOST,
+            settings.SMTP_PORT,
+            size=settings.SMTP_POOL_SIZE,
+            username=settings.SMTP_USER,
+            password=settings.SMTP_PASSWORD,
+            use_tls=settings.SMTP_USE_TLS,
+        )
+
+    def _connect(self) -> smtplib.SMTP:
+        connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            connection.starttls()
+        if self.username:
+            connection.login(self.username, self.password)
+        return connection
+
+    async def send(self, message: EmailMessage) -> None:
+        """Send a message over an idle connection, opening one if none is free."""
+        async with self._semaphore:
+            if self._idle:
+                connection = self._idle.pop()
+            else:
+                connection = await asyncio.to_thread(self._connect)
+            try:
+                await asyncio.to_thread(connection.send_message, message)
+            except smtplib.SMTPServerDisconnected:
+                # The server closed an idle connection, retry once on a fresh one
+                connection = await asyncio.to_thread(self._connect)
+                await asyncio.to_thread(connection.send_message, message)
+            except Exception:
+                await asyncio.to_thread(self._quit, connection)
+                raise
+            self._idle.append(connection)
+
+    async def close(self) -> None:
+        """Close every idle connection."""
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await asyncio.to_thread(self._quit, connection)
+
+    @staticmethod
+    def _quit(connection: smtplib.SMTP) -> None:
+        try:
+            connection.quit()
+        except smtplib.SMTPException:
+            connection.close()
+        except OSError:
+            pass
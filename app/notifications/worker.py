@@ -0,0 +1,251 @@
+import asyncio
+import json
+import logging
+import signal
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+import aio_pika
+
+from app.core.rabbitmq import RabbitMQConnection
+from app.core.settings import settings
+from app.notifications.digest import DigestNotifier
+from app.notifications.handlers import log_notification
+from app.notifications.smtp import SMTPPool
+from app.tickets.events import TICKET_UPDATES_EXCHANGE
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[dict], Awaitable[None]]
+
+
+@dataclass
+class WorkerMetrics:
+    """Counters of a worker run, logged periodically."""
+
+    started_at: float = field(default_factory=time.monotonic)
+    received: int = 0
+    processed: int = 0
+    failed: int = 0
+    retried: int = 0
+    dead_lettered: int = 0
+    batches: int = 0
+
+    def snapshot(self) -> dict:
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        return {
+            "received": self.received,
+            "processed": self.processed,
+            "failed": self.failed,
+            "retried": self.retried,
+            "dead_lettered": self.dead_lettered,
+            "batches": self.batches,
+            "avg_batch_size": self.received / self.batches if self.batches else 0.0,
+            "throughput_per_second": self.processed / elapsed,
+        }
+
+
+class TicketUpdatesWorker:
+    """Consume the ticket_updates queue in batches with bounded retries.
+
+    Messages are handled concurrently, a batch is acknowledged with a single
+    multiple-ack once every message of it was either handled or moved to a
+    retry queue. Retry queues have a TTL and dead-letter back into the main
+    queue, so the n-th retry waits retry_backoff * 2**n seconds. Messages
+    that exhaust their retries are parked in the ".dead" queue.
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        rabbitmq: RabbitMQConnection | None = None,
+        queue_name: str = TICKET_UPDATES_EXCHANGE,
+        prefetch: int = settings.NOTIFY_PREFETCH,
+        concurrency: int = settings.NOTIFY_CONCURRENCY,
+        batch_size: int = settings.NOTIFY_BATCH_SIZE,
+        batch_timeout: float = settings.NOTIFY_BATCH_TIMEOUT,
+        max_retries: int = settings.NOTIFY_MAX_RETRIES,
+        retry_backoff: float = settings.NOTIFY_RETRY_BACKOFF,
+    ):
+        self.handler = handler
+        self.rabbitmq = rabbitmq or RabbitMQConnection()
+        self.queue_name = queue_name
+        self.prefetch = prefetch
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.metrics = WorkerMetrics()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._inbox: asyncio.Queue = asyncio.Queue()
+        self._stopping = asyncio.Event()
+
+    @property
+    def dead_queue_name(self) -> str:
+        return f"{self.queue_name}.dead"
+
+    def retry_queue_name(self, attempt: int) -> str:
+        return f"{self.queue_name}.retry.{attempt}"
+
+    def retry_delay(self, attempt: int) -> float:
+        """Seconds a message waits before its attempt-th retry."""
+        return self.retry_backoff * 2**attempt
+
+    async def declare_topology(self, channel):
+        """Declare the work queue, its retry queues and the dead queue."""
+        exchange = await channel.declare_exchange(
+            TICKET_UPDATES_EXCHANGE, aio_pika.ExchangeType.FANOUT, durable=True
+        )
+        queue = await channel.declare_queue(self.queue_name, durable=True)
+        await queue.bind(exchange)
+        for attempt in range(self.max_retries):
+            await channel.declare_queue(
+                self.retry_queue_name(attempt),
+                durable=True,
+                arguments={
+                    "x-message-ttl": int(self.retry_delay(attempt) * 1000),
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": self.queue_name,
+                },
+            )
+        await channel.declare_queue(self.dead_queue_name, durable=True)
+        return queue
+
+    async def run(self) -> None:
+        """Consume until stop() is called, then finish the current batch."""
+        connection = await self.rabbitmq.connect()
+        async with connection:
+            channel = await connection.channel()
+            await channel.set_qos(prefetch_count=self.prefetch)
+            queue = await self.declare_topology(channel)
+            await queue.consume(self._inbox.put)
+            metrics_task = asyncio.create_task(self._log_metrics())
+            try:
+                while not self._stopping.is_set():
+                    batch = await self.next_batch()
+                    if batch:
+                        await self.process_batch(batch, channel.default_exchange)
+            finally:
+                metrics_task.cancel()
+                logger.info("Worker stopped: %s", self.metrics.snapshot())
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def next_batch(self) -> list:
+        """Collect up to batch_size messages, waiting at most batch_timeout."""
+        try:
+            batch = [
+                await asyncio.wait_for(self._inbox.get(), timeout=self.batch_timeout)
+            ]
+        except asyncio.TimeoutError:
+            return []
+
+        deadline = asyncio.get_running_loop().time() + self.batch_timeout
+        while len(batch) < self.batch_size:
+            if not self._inbox.empty():
+                batch.append(self._inbox.get_nowait())
+                continue
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._inbox.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def process_batch(self, messages: list, exchange) -> None:
+        """Handle a batch concurrently, reroute failures and ack it in bulk."""
+        self.metrics.batches += 1
+        self.metrics.received += len(messages)
+        results = await asyncio.gather(*(self._handle(m) for m in messages))
+
+        for message, handled in zip(messages, results):
+            if not handled:
+                await self._reroute(message, exchange, poisoned=handled is None)
+
+        last = max(messages, key=lambda message: message.delivery_tag)
+        await last.ack(multiple=True)
+
+    async def _handle(self, message) -> bool | None:
+        """Run the handler; False means retry, None means the message is unreadable."""
+        try:
+            event = json.loads(message.body)
+        except ValueError:
+            logger.error("Discarding malformed message %r", message.body[:200])
+            return None
+
+        async with self._semaphore:
+            try:
+                await self.handler(event)
+            except Exception:
+                logger.exception("Handler failed for %s", event)
+                self.metrics.failed += 1
+                return False
+        self.metrics.processed += 1
+        return True
+
+    async def _reroute(self, message, exchange, poisoned: bool = False) -> None:
+        """Move a failed message to its next retry queue or to the dead queue."""
+        headers = dict(message.headers or {})
+        attempt = int(headers.get("x-retry-count", 0))
+        if poisoned or attempt >= self.max_retries:
+            routing_key = self.dead_queue_name
+            self.metrics.dead_lettered += 1
+        else:
+            routing_key = self.retry_queue_name(attempt)
+            self.metrics.retried += 1
+
+        headers["x-retry-count"] = attempt + 1
+        await exchange.publish(
+            aio_pika.Message(
+                body=message.body,
+                headers=headers,
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            ),
+            routing_key=routing_key,
+        )
+
+    async def _log_metrics(self) -> None:
+        while True:
+            await asyncio.sleep(settings.NOTIFY_METRICS_INTERVAL)
+            logger.info("Worker metrics: %s", self.metrics.snapshot())
+
+
+async def serve(worker: TicketUpdatesWorker) -> None:
+    """Run a worker until SIGINT or SIGTERM."""
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+    await worker.run()
+
+
+async def serve_notifications() -> None:
+    """Send digest emails when SMTP is configured, otherwise only log them."""
+    if not settings.SMTP_HOST:
+        await serve(TicketUpdatesWorker(log_notification))
+        return
+
+    mailer = SMTPPool.from_settings()
+    notifier = DigestNotifier(mailer)
+    digest_task = asyncio.create_task(notifier.run())
+    try:
+        await serve(TicketUpdatesWorker(notifier.handle))
+    finally:
+        digest_task.cancel()
+        await asyncio.gather(digest_task, return_exceptions=True)
+        await mailer.close()
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    asyncio.run(serve_notifications())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+from typing import NamedTuple
+
+from app.core.cache import TTLCache
+from app.core.invalidation import invalidation_bus
+from app.core.settings import settings
+from app.users.models import User, UserRole
+
+
+class ProjectAccess(NamedTuple):
+    """What a user may do in a project: its owner and whether they are a member."""
+
+    owner_id: int
+    is_member: bool
+
+
+# Cross-request cache keyed by (project_id, user_id), per worker process; other
+# workers' changes arrive over the invalidation bus, the TTL covers lost ones
+project_access_cache = TTLCache(
+    "project_access",
+    settings.PROJECT_ACCESS_CACHE_SIZE,
+    settings.PROJECT_ACCESS_CACHE_TTL,
+)
+
+
+def may_act_on_tickets(user: User, owner_id: int, is_member: bool) -> bool:
+    """Tickets of a project can be changed by its owner, its members and admins."""
+    return user.id == owner_id or is_member or user.role == UserRole.ADMIN
+
+
+def session_memo(db_session) -> dict:
+    """Access checks already resolved with this session, i.e. by this request."""
+    return db_session.info.setdefault("project_access", {})
+
+
+def invalidate_access(
+    project_id: int, user_id: int | None = None, memo: dict | None = None
+) -> None:
+    """Forget cached access to a project, for one user or for everyone."""
+    memo = memo if memo is not None else {}
+    if user_id is not None:
+        project_access_cache.pop((project_id, user_id))
+        memo.pop((project_id, user_id), None)
+        return
+    project_access_cache.pop_where(lambda key: key[0] == project_id)
+    for key in [key for key in memo if key[0] == project_id]:
+        del memo[key]
+
+
+async def publish_access_change(
+    project_id: int, user_ids: list[int] | None = None, memo: dict | None = None
+) -> None:
+    """Forget cached access to a project on every worker, for some users or everyone.
+
+    Call it after the change is committed. Changes of several members go to
+    the other workers as one project-wide invalidation.
+    """
+    if user_ids is None:
+        invalidate_access(project_id, memo=memo)
+        await invalidation_bus.publish("project", project_id)
+        return
+    for user_id in user_ids:
+        invalidate_access(project_id, user_id, memo)
+    if len(user_ids) == 1:
+        await invalidation_bus.publish("project_member", [project_id, user_ids[0]])
+    elif user_ids:
+        await invalidation_bus.publish("project", project_id)
+
+
+invalidation_bus.register(
+    "project", lambda project_id, _: invalidate_access(project_id)
+)
+invalidation_bus.register(
+    "project_member", lambda key, _: invalidate_access(key[0], key[1])
+)
@@ -0,0 +1,82 @@
+import asyncio
+import logging
+
+from app.core.jobs import Job, drain, job_registry
+from app.core.settings import settings
+from app.projects.access import publish_access_change
+from app.projects.models import ProjectMember
+from app.projects.repository import ProjectRepository
+from app.tickets.models import ArchivedTicket, Ticket
+
+logger = logging.getLogger(__name__)
+
+
+async def delete_project_in_batches(job: Job, project_id: int) -> None:
+    """Delete a project marked as deleting, a bounded batch per transaction.
+
+    Tickets (with their executors) go first, archived ones included, then
+    memberships, then the project row. Progress is reported on the job.
+    Every step only deletes what is left, so an interrupted deletion simply
+    starts over; a step ends once no row is left, not when a batch comes
+    back empty because other transactions hold the remaining rows locked.
+    Only one worker runs the deletion of a given project at a time.
+    """
+    async with job_registry.exclusive(job.kind, project_id) as acquired:
+        if not acquired:
+            job.progress.update(project_id=project_id, running_elsewhere=True)
+            return
+        await _delete_project(job, project_id)
+
+
+async def _delete_project(job: Job, project_id: int) -> None:
+    batch_size = settings.PROJECT_DELETE_BATCH_SIZE
+    async with job_registry.session_factory() as session:
+        repository = ProjectRepository(session)
+        job.progress.update(
+            project_id=project_id,
+            tickets_total=await repository.count_tickets(project_id),
+            tickets_deleted=0,
+            members_deleted=0,
+        )
+        await session.commit()
+
+        async for deleted in drain(
+            lambda: repository.delete_ticket_batch(project_id, batch_size),
+            lambda: repository.has_rows(project_id, Ticket),
+        ):
+            job.progress["tickets_deleted"] += deleted
+            await asyncio.sleep(settings.PROJECT_DELETE_BATCH_PAUSE)
+
+        async for deleted in drain(
+            lambda: repository.delete_archived_ticket_batch(project_id, batch_size),
+            lambda: repository.has_rows(project_id, ArchivedTicket),
+        ):
+            job.progress["tickets_deleted"] += deleted
+            await asyncio.sleep(settings.PROJECT_DELETE_BATCH_PAUSE)
+
+        async for deleted in drain(
+            lambda: repository.delete_member_batch(project_id, batch_size),
+            lambda: repository.has_rows(project_id, ProjectMember),
+        ):
+            job.progress["members_deleted"] += deleted
+
+        await repository.delete(project_id)
+    await publish_access_change(project_id)
+    logger.info("Project %s deleted: %s", project_id, job.progress)
+
+
+async def start_project_deletion(
+    project_id: int, started_by: int | None = None
+) -> Job:
+    return await job_registry.start(
+        "delete_project", delete_project_in_batches, project_id, started_by=started_by
+    )
+
+
+async def resume_project_deletions() -> None:
+    """Restart the deletions interrupted by a previous shutdown."""
+    async with job_registry.session_factory() as session:
+        project_ids = await ProjectRepository(session).get_deleting_ids()
+    for project_id in project_ids:
+        logger.info("Resuming deletion of project %s", project_id)
+        await start_project_deletion(project_id)
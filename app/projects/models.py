@@ -1,5 +1,6 @@
 from sqlalchemy import (
     Column,
+    DateTime,
     String,
     Text,
     ForeignKey,
@@ -7,6 +8,7 @@ from sqlalchemy import (
     Integer,
     Table,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import relationship
 
@@ -30,7 +32,13 @@ class Project(BaseModel):
     )
 
     # Foreign key to relate projects to their owners or creators (assuming 1 owner per project)
-    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+    # Set when a background deletion starts; such projects read as gone
+    deleting_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Bumped with every change to the listed tickets, versions the list snapshots
+    tickets_version = Column(Integer, nullable=False, server_default=text("0"))
 
     # Relationship to User (owner/creator of the project)
     owner = relationship("User", back_populates="owned_projects")
@@ -50,7 +58,9 @@ class ProjectMember(BaseModel):
     id = None
 
     user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
-    project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
+    project_id = Column(
+        Integer, ForeignKey("projects.id"), primary_key=True, index=True
+    )
 
     # Relationships to User and Project models
     user = relationship(
@@ -60,7 +70,9 @@ class ProjectMember(BaseModel):
     project = relationship(
         "Project", back_populates="project_memberships", overlaps="members,projects"
     )
-    assigned_tickets = relationship("TicketExecutor", back_populates="project_member")
+    assigned_tickets = relationship(
+        "TicketExecutor", back_populates="project_member", overlaps="executors,ticket"
+    )
     __table_args__ = (
         UniqueConstraint("user_id", "project_id", name="uq_user_project"),
     )
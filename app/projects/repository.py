@@ -1,22 +1,161 @@
+from typing import Optional
+
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import delete, exists, or_, select, func, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
 from app.core.base_repository import BaseRepository
+from app.core.read_repository import ReadRepository, select_for
 from app.projects.models import Project, ProjectMember
-from app.users.models import User
+from app.projects.schemas import ProjectOut, ProjectStatus, ProjectSummaryOut
+from app.tickets.models import (
+    ArchivedTicket,
+    ArchivedTicketExecutor,
+    Ticket,
+    TicketExecutor,
+    TicketStatus,
+)
+from app.users.models import User, UserRole
+from app.users.schemas import UserOut
+
+
+def bump_tickets_version(*project_ids: int):
+    """UPDATE invalidating the ticket list snapshots of projects.
+
+    Run it in the transaction writing the tickets. Leaves updated_at (the
+    project's own ETag) alone.
+    """
+    return (
+        update(Project)
+        .where(Project.id.in_(project_ids))
+        .values(
+            tickets_version=Project.tickets_version + 1,
+            updated_at=Project.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
 
 
 class ProjectRepository(BaseRepository):
     def __init__(self, db_session: AsyncSession):
         super().__init__(Project, db_session)
 
-    async def get_projects_by_owner(self, owner_id: int):
-        """Retrieve all projects by the owner"""
-        return await self.db_session.execute(
-            self.model.query.filter_by(owner_id=owner_id)
+    async def get_by_id(self, id: int) -> Optional[Project]:
+        """Fetch a project, unless it is being deleted."""
+        query = select(Project).where(Project.id == id, Project.deleting_at.is_(None))
+        result = await self.db_session.execute(query)
+        return result.scalars().first()
+
+    async def get_version(self, id: int):
+        """Fetch the (id, updated_at) pair of a project, unless it is being deleted."""
+        query = select(Project.id, Project.updated_at).where(
+            Project.id == id, Project.deleting_at.is_(None)
+        )
+        result = await self.db_session.execute(query)
+        return result.first()
+
+    async def mark_deleting(self, project_id: int) -> None:
+        """Hide a project from every read ahead of its background deletion."""
+        await self.db_session.execute(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(deleting_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        await self.db_session.commit()
+
+    async def get_deleting_ids(self) -> list[int]:
+        """IDs of projects whose deletion has not finished."""
+        result = await self.db_session.execute(
+            select(Project.id).where(Project.deleting_at.isnot(None))
+        )
+        return list(result.scalars().all())
+
+    async def count_tickets(self, project_id: int) -> int:
+        """Count the tickets of a project, archived ones included."""
+        hot = select(func.count()).where(Ticket.project_id == project_id)
+        archived = select(func.count()).where(ArchivedTicket.project_id == project_id)
+        result = await self.db_session.execute(
+            select(hot.scalar_subquery() + archived.scalar_subquery())
+        )
+        return result.scalar_one()
+
+    async def has_rows(self, project_id: int, model) -> bool:
+        """Whether rows of `model` still belong to a project, locked ones included."""
+        result = await self.db_session.execute(
+            select(exists().where(model.project_id == project_id))
+        )
+        return result.scalar_one()
+
+    async def delete_ticket_batch(self, project_id: int, limit: int) -> int:
+        """Delete up to `limit` tickets of a project with their executors, in one transaction.
+
+        Rows locked by a concurrent deletion of the same project are skipped.
+        """
+        result = await self.db_session.execute(
+            select(Ticket.id)
+            .where(Ticket.project_id == project_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
+        ticket_ids = list(result.scalars().all())
+        if ticket_ids:
+            await self.db_session.execute(
+                delete(TicketExecutor).where(
+                    TicketExecutor.project_id == project_id,
+                    TicketExecutor.ticket_id.in_(ticket_ids),
+                )
+            )
+            await self.db_session.execute(
+                delete(Ticket)
+                .where(Ticket.project_id == project_id, Ticket.id.in_(ticket_ids))
+                .execution_options(synchronize_session=False)
+            )
+        await self.db_session.commit()
+        return len(ticket_ids)
+
+    async def delete_archived_ticket_batch(self, project_id: int, limit: int) -> int:
+        """Delete up to `limit` archived tickets of a project with their executors."""
+        result = await self.db_session.execute(
+            select(ArchivedTicket.id)
+            .where(ArchivedTicket.project_id == project_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        ticket_ids = list(result.scalars().all())
+        if ticket_ids:
+            await self.db_session.execute(
+                delete(ArchivedTicketExecutor).where(
+                    ArchivedTicketExecutor.ticket_id.in_(ticket_ids)
+                )
+            )
+            await self.db_session.execute(
+                delete(ArchivedTicket)
+                .where(ArchivedTicket.id.in_(ticket_ids))
+                .execution_options(synchronize_session=False)
+            )
+        await self.db_session.commit()
+        return len(ticket_ids)
+
+    async def delete_member_batch(self, project_id: int, limit: int) -> int:
+        """Delete up to `limit` memberships of a project."""
+        user_ids = (
+            select(ProjectMember.user_id)
+            .where(ProjectMember.project_id == project_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db_session.execute(
+            delete(ProjectMember)
+            .where(
+                ProjectMember.project_id == project_id,
+                ProjectMember.user_id.in_(user_ids),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.db_session.commit()
+        return result.rowcount
 
     async def add_member(self, project_id: int, user_id: int) -> None:
         """Add a member to a project."""
@@ -43,19 +182,94 @@ class ProjectRepository(BaseRepository):
         await self.db_session.commit()
         return await self.get_by_id(project_id)
 
-    async def get_project_members(self, project_id: int):
-        """Retrieve members of a project."""
-        project = await self.db_session.execute(
-            select(Project)
-            .options(joinedload(Project.members))  # Eagerly load members
-            .where(Project.id == project_id)
+    async def get_access(self, project_id: int, user_id: int):
+        """Fetch (owner_id, is_member) of a user in a project in one statement."""
+        is_member = (
+            exists()
+            .where(
+                ProjectMember.project_id == project_id,
+                ProjectMember.user_id == user_id,
+            )
+            .label("is_member")
         )
-        project = project.scalars().first()
-        if not project:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+        result = await self.db_session.execute(
+            select(Project.owner_id, is_member).where(
+                Project.id == project_id, Project.deleting_at.is_(None)
+            )
+        )
+        return result.first()
+
+    async def add_members(self, project_id: int, user_ids: list[int]) -> list[int]:
+        """Insert memberships, skipping existing ones; return the user IDs added."""
+        query = (
+            insert(ProjectMember)
+            .values([{"project_id": project_id, "user_id": id} for id in user_ids])
+            .on_conflict_do_nothing(index_elements=["user_id", "project_id"])
+            .returning(ProjectMember.user_id)
+        )
+        result = await self.db_session.execute(query)
+        added = list(result.scalars().all())
+        await self.db_session.commit()
+        return added
+
+    async def remove_members(
+        self, project_id: int, user_ids: list[int]
+    ) -> tuple[list[int], int]:
+        """Delete memberships and their ticket assignments in set-based statements.
+
+        Assignments to archived tickets go too. Returns the user IDs removed
+        and the number of executor rows deleted.
+        """
+        unassigned = 0
+        for model in (TicketExecutor, ArchivedTicketExecutor):
+            executors = await self.db_session.execute(
+                delete(model).where(
+                    model.project_id == project_id, model.user_id.in_(user_ids)
+                )
+            )
+            unassigned += executors.rowcount
+        result = await self.db_session.execute(
+            delete(ProjectMember)
+            .where(
+                ProjectMember.project_id == project_id,
+                ProjectMember.user_id.in_(user_ids),
+            )
+            .returning(ProjectMember.user_id)
+        )
+        removed = list(result.scalars().all())
+        await self.db_session.commit()
+        return removed, unassigned
+
+    async def get_project_version(self, project_id: int):
+        """Fetch the (id, updated_at, owner_id) version probe of a project."""
+        result = await self.db_session.execute(
+            select(Project.id, Project.updated_at, Project.owner_id).where(
+                Project.id == project_id, Project.deleting_at.is_(None)
+            )
+        )
+        return result.first()
+
+    async def get_tickets_version(self, project_id: int) -> Optional[int]:
+        """Fetch the version of a project's ticket list."""
+        result = await self.db_session.execute(
+            select(Project.tickets_version).where(
+                Project.id == project_id, Project.deleting_at.is_(None)
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_members_version(self, project_id: int):
+        """Fetch the (count, last membership change, last profile change) of a project's members."""
+        result = await self.db_session.execute(
+            select(
+                func.count(ProjectMember.user_id),
+                func.max(ProjectMember.updated_at),
+                func.max(User.updated_at),
             )
-        return project.members
+            .join(User, User.id == ProjectMember.user_id)
+            .where(ProjectMember.project_id == project_id)
+        )
+        return result.one()
 
     async def change_project_status(self, project_id: int, new_status: str) -> Project:
         """Update the status of a project."""
@@ -72,3 +286,104 @@ class ProjectRepository(BaseRepository):
             .where(ProjectMember.user_id == user_id)
         )
         return result.scalars().first()
+
+
+class ProjectReadRepository(ReadRepository):
+    """Column-projected project reads for the GET endpoints."""
+
+    async def list_for_user(
+        self,
+        user_id: int,
+        project_status: Optional[ProjectStatus] = None,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> list:
+        """Fetch a page of the projects a user owns or belongs to, with their counts.
+
+        Keyset pagination on the project id; the counts are correlated
+        subqueries, evaluated for the rows of the page only.
+        """
+        is_member = (
+            select(ProjectMember.project_id)
+            .where(ProjectMember.user_id == user_id)
+            .scalar_subquery()
+        )
+        member_count = (
+            select(func.count())
+            .where(ProjectMember.project_id == Project.id)
+            .scalar_subquery()
+        )
+        open_ticket_count = (
+            select(func.count())
+            .where(Ticket.project_id == Project.id, Ticket.status != TicketStatus.DONE)
+            .scalar_subquery()
+        )
+        columns = {
+            **{name: getattr(Project, name) for name in ProjectOut.model_fields},
+            "is_owner": Project.owner_id == user_id,
+            "member_count": member_count,
+            "open_ticket_count": open_ticket_count,
+        }
+        query = (
+            select(*(columns[name] for name in ProjectSummaryOut.model_fields))
+            .where((Project.owner_id == user_id) | Project.id.in_(is_member))
+            .where(Project.deleting_at.is_(None))
+            .order_by(Project.id)
+            .limit(limit)
+        )
+        if project_status is not None:
+            query = query.where(Project.status == project_status)
+        if after_id is not None:
+            query = query.where(Project.id > after_id)
+        return await self.fetch_all(ProjectSummaryOut, query)
+
+    @staticmethod
+    def _member_filters(
+        project_id: int, role: Optional[UserRole], name: Optional[str]
+    ) -> list:
+        conditions = [ProjectMember.project_id == project_id]
+        if role is not None:
+            conditions.append(User.role == role)
+        if name:
+            conditions.append(
+                or_(
+                    User.name.icontains(name, autoescape=True),
+                    User.surname.icontains(name, autoescape=True),
+                )
+            )
+        return conditions
+
+    async def list_members(
+        self,
+        project_id: int,
+        role: Optional[UserRole] = None,
+        name: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> list:
+        """Fetch a page of the UserOut columns of a project's members, by user id."""
+        query = (
+            select_for(User, UserOut)
+            .join(ProjectMember, ProjectMember.user_id == User.id)
+            .where(*self._member_filters(project_id, role, name))
+            .order_by(User.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            query = query.where(User.id > after_id)
+        return await self.fetch_all(UserOut, query)
+
+    async def count_members(
+        self,
+        project_id: int,
+        role: Optional[UserRole] = None,
+        name: Optional[str] = None,
+    ) -> int:
+        """Count the members of a project matching the filters."""
+        query = select(func.count()).select_from(ProjectMember)
+        if role is not None or name:
+            query = query.join(User, User.id == ProjectMember.user_id)
+        result = await self.db_session.execute(
+            query.where(*self._member_filters(project_id, role, name))
+        )
+        return result.scalar_one()
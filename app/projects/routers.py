@@ -1,16 +1,30 @@
-from fastapi import APIRouter, Depends
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.etag import make_etag, etag_matches
+from app.core.responses import model_response
 from app.projects.schemas import (
     ProjectCreate,
     ProjectUpdate,
     ProjectOut,
+    ProjectStatus,
+    ProjectSummaryOut,
     ChangeStatusSchema,
     AddMemberRequest,
+    BatchMembersRequest,
+    BatchMembersResult,
 )
 from app.projects.services import ProjectService
 from app.core.database import get_db
-from app.users.models import User
-from app.users.dependencies import get_current_user
+from app.core.settings import settings
+from app.tickets.events import ticket_event_hub, format_sse
+from app.users.models import UserRole
+from app.users.dependencies import get_current_principal
+from app.users.principals import Principal
 from app.users.schemas import UserOut
 
 project_router = APIRouter()
@@ -37,9 +51,9 @@ class ProjectRouter:
         )
         project_router.add_api_route(
             "/",
-            self.get_projects_by_owner,
+            self.list_projects,
             methods=["GET"],
-            response_model=list[ProjectOut],
+            response_model=list[ProjectSummaryOut],
             tags=["Projects"],
         )
         project_router.add_api_route(
@@ -50,7 +64,11 @@ class ProjectRouter:
             tags=["Projects"],
         )
         project_router.add_api_route(
-            "/{project_id}", self.delete_project, methods=["DELETE"], tags=["Projects"]
+            "/{project_id}",
+            self.delete_project,
+            methods=["DELETE"],
+            status_code=status.HTTP_202_ACCEPTED,
+            tags=["Projects"],
         )
         project_router.add_api_route(
             "/{project_id}/members",
@@ -59,6 +77,20 @@ class ProjectRouter:
             response_model=ProjectOut,
             tags=["Project Members"],
         )
+        project_router.add_api_route(
+            "/{project_id}/members:batch",
+            self.add_members,
+            methods=["POST"],
+            response_model=BatchMembersResult,
+            tags=["Project Members"],
+        )
+        project_router.add_api_route(
+            "/{project_id}/members:batch",
+            self.remove_members,
+            methods=["DELETE"],
+            response_model=BatchMembersResult,
+            tags=["Project Members"],
+        )
         project_router.add_api_route(
             "/{project_id}/members/{user_id}",
             self.remove_member,
@@ -79,12 +111,19 @@ class ProjectRouter:
             methods=["PUT"],
             tags=["Projects"],
         )
+        project_router.add_api_route(
+            "/{project_id}/events",
+            self.stream_events,
+            methods=["GET"],
+            response_class=StreamingResponse,
+            tags=["Projects"],
+        )
 
     async def create_project(
         self,
         project_data: ProjectCreate,
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
         """Create a new project."""
         service = ProjectService(db)
@@ -93,28 +132,51 @@ class ProjectRouter:
     async def get_project(
         self,
         project_id: int,
+        request: Request,
+        response: Response,
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
-        """Retrieve a specific project by ID."""
+        """Retrieve a specific project by ID, honouring If-None-Match."""
         service = ProjectService(db)
-        return await service.get_project_by_id(project_id, current_user)
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match:
+            etag = await service.get_project_etag(project_id, current_user)
+            if etag_matches(if_none_match, etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+                )
+
+        project = await service.get_project_by_id(project_id, current_user)
+        response.headers["ETag"] = make_etag(project.id, project.updated_at)
+        return project
 
-    async def get_projects_by_owner(
+    async def list_projects(
         self,
+        project_status: Optional[ProjectStatus] = Query(None, alias="status"),
+        cursor: Optional[int] = None,
+        limit: int = Query(50, ge=1, le=200),
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
-        """Retrieve all projects owned by the current user."""
+        """List the projects the current user owns or is a member of.
+
+        Pages are ordered by project id; pass the X-Next-Cursor header of a
+        page as `cursor` to fetch the next one.
+        """
         service = ProjectService(db)
-        return await service.get_projects_by_owner(current_user.id)
+        projects, next_cursor = await service.list_my_projects(
+            current_user, project_status, cursor, limit
+        )
+        headers = {"X-Next-Cursor": str(next_cursor)} if next_cursor else None
+        return model_response(ProjectSummaryOut, projects, headers=headers)
 
     async def update_project(
         self,
         project_id: int,
         project_data: ProjectUpdate,
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
         """Update an existing project."""
         service = ProjectService(db)
@@ -124,11 +186,16 @@ class ProjectRouter:
         self,
         project_id: int,
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
-        """Delete a project."""
+        """Start deleting a project; poll the returned job for progress."""
         service = ProjectService(db)
-        return await service.delete_project(project_id, current_user)
+        job = await service.delete_project(project_id, current_user)
+        return ORJSONResponse(
+            {"message": "Project deletion started", "job_id": job.id},
+            status_code=status.HTTP_202_ACCEPTED,
+            headers={"Location": f"/jobs/{job.id}"},
+        )
 
     # Member handlers
     async def add_member(
@@ -136,18 +203,40 @@ class ProjectRouter:
         project_id: int,
         add_member_data: AddMemberRequest,
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
         """Add a member to a project."""
         service = ProjectService(db)
         return await service.add_member(project_id, add_member_data, current_user)
 
+    async def add_members(
+        self,
+        project_id: int,
+        batch: BatchMembersRequest,
+        db: AsyncSession = Depends(get_db),
+        current_user: Principal = Depends(get_current_principal),
+    ):
+        """Add several members to a project in one request."""
+        service = ProjectService(db)
+        return await service.add_members(project_id, batch.user_ids, current_user)
+
+    async def remove_members(
+        self,
+        project_id: int,
+        batch: BatchMembersRequest,
+        db: AsyncSession = Depends(get_db),
+        current_user: Principal = Depends(get_current_principal),
+    ):
+        """Remove several members, and their ticket assignments, in one request."""
+        service = ProjectService(db)
+        return await service.remove_members(project_id, batch.user_ids, current_user)
+
     async def remove_member(
         self,
         project_id: int,
         user_id: int,
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
         """Remove a member from a project."""
         service = ProjectService(db)
@@ -157,19 +246,46 @@ class ProjectRouter:
     async def list_members(
         self,
         project_id: int,
+        request: Request,
+        role: Optional[UserRole] = None,
+        name: Optional[str] = Query(None, max_length=100),
+        cursor: Optional[int] = None,
+        limit: int = Query(100, ge=1, le=1000),
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
-        """List all members of a project."""
+        """List a page of a project's members, honouring If-None-Match.
+
+        `role` and `name` (a substring of the name or surname) filter the
+        members; X-Total-Count counts every matching member and
+        X-Next-Cursor, when present, is the `cursor` of the next page.
+        """
         service = ProjectService(db)
-        return await service.list_members(project_id)
+        etag, total = await service.get_members_etag(
+            project_id, role, name, cursor, limit
+        )
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
+        members, next_cursor = await service.list_members(
+            project_id, role, name, cursor, limit
+        )
+        if role is not None or name:
+            # The version probe only counts the unfiltered member list
+            total = await service.count_members(project_id, role, name)
+        headers = {"ETag": etag, "X-Total-Count": str(total)}
+        if next_cursor:
+            headers["X-Next-Cursor"] = str(next_cursor)
+        return model_response(UserOut, members, headers=headers)
 
     async def change_status(
         self,
         project_id: int,
         status_data: ChangeStatusSchema,
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
         """Change the status of a project."""
         service = ProjectService(db)
@@ -177,6 +293,46 @@ class ProjectRouter:
             project_id, status_data.new_status, current_user
         )
 
+    async def stream_events(
+        self,
+        project_id: int,
+        request: Request,
+        db: AsyncSession = Depends(get_db),
+        current_user: Principal = Depends(get_current_principal),
+    ):
+        """Stream ticket changes of a project as server-sent events."""
+        service = ProjectService(db)
+        await service.check_access(project_id, current_user)
+        # Release the pooled connection, the stream may stay open for hours
+        await db.close()
+
+        subscription = ticket_event_hub.subscribe(project_id)
+
+        async def event_stream():
+            try:
+                while not await request.is_disconnected():
+                    try:
+                        event = await asyncio.wait_for(
+                            subscription.get(),
+                            timeout=settings.EVENTS_KEEPALIVE_SECONDS,
+                        )
+                    except asyncio.TimeoutError:
+                        yield ": keepalive\n\n"
+                        continue
+                    if event is None:
+                        # Too slow to keep up: the client has to reconnect and resync
+                        yield format_sse({"event": "overflow"})
+                        break
+                    yield format_sse(event)
+            finally:
+                ticket_event_hub.unsubscribe(subscription)
+
+        return StreamingResponse(
+            event_stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
 
 # Initialize project router
 ProjectRouter()
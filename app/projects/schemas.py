@@ -48,6 +48,33 @@ class ProjectOut(ProjectBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ProjectSummaryOut(ProjectOut):
+    """A project in the caller's project list, with its counts."""
+
+    is_owner: bool
+    member_count: int
+    open_ticket_count: int
+
+
+class BatchMembersRequest(BaseModel):
+    user_ids: list[int] = Field(..., min_length=1, max_length=1000)
+
+
+class BatchMembersResult(BaseModel):
+    """Outcome of a batch membership change."""
+
+    project_id: int
+    changed_user_ids: list[int] = Field(
+        ..., description="Users actually added or removed by this request"
+    )
+    unchanged_user_ids: list[int] = Field(
+        ..., description="Users that already were (or were not) members"
+    )
+    unassigned_executor_count: int = Field(
+        0, description="Ticket executor assignments dropped with removed members"
+    )
+
+
 class ChangeStatusSchema(BaseModel):
     new_status: ProjectStatus
 
@@ -1,16 +1,29 @@
+from typing import Optional
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
-from app.projects.repository import ProjectRepository
+from app.core.etag import make_etag
+from app.core.jobs import Job
+from app.projects.access import (
+    ProjectAccess,
+    may_act_on_tickets,
+    project_access_cache,
+    publish_access_change,
+    session_memo,
+)
+from app.projects.jobs import start_project_deletion
+from app.projects.repository import ProjectRepository, ProjectReadRepository
 from app.projects.schemas import (
     ProjectCreate,
     ProjectUpdate,
     ProjectOut,
     ProjectStatus,
     AddMemberRequest,
+    BatchMembersResult,
 )
-from app.users.models import User
-from app.users.schemas import UserOut
+from app.users.models import User, UserRole
+from app.users.principals import Principal
 from app.users.services import UserService
 
 
@@ -18,8 +31,9 @@ class ProjectService:
     def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
         self.repository = ProjectRepository(db_session)
+        self.read_repository = ProjectReadRepository(db_session)
 
-    async def create_project(self, project_data: ProjectCreate, owner: User):
+    async def create_project(self, project_data: ProjectCreate, owner: Principal):
         """Create a new project with the current user as the owner."""
         project_data = project_data.model_dump()
         project_data["owner_id"] = owner.id
@@ -27,7 +41,7 @@ class ProjectService:
         return new_project
 
     async def update_project(
-        self, project_id: int, project_data: ProjectUpdate, current_user: User
+        self, project_id: int, project_data: ProjectUpdate, current_user: Principal
     ):
         """Update an existing project if the current user is the owner."""
         project = await self.repository.get_by_id(project_id)
@@ -46,8 +60,12 @@ class ProjectService:
         )
         return updated_project
 
-    async def delete_project(self, project_id: int, current_user: User):
-        """Delete a project if the current user is the owner."""
+    async def delete_project(self, project_id: int, current_user: Principal) -> Job:
+        """Start deleting a project if the current user is the owner.
+
+        The project reads as gone right away; its rows are removed by a
+        background job, returned for progress polling.
+        """
         project = await self.repository.get_by_id(project_id)
         if not project:
             raise HTTPException(
@@ -60,29 +78,127 @@ class ProjectService:
                 detail="Not allowed to delete this project",
             )
 
-        await self.repository.delete(project_id)
-        return {"message": "Project deleted successfully"}
+        await self.repository.mark_deleting(project_id)
+        await publish_access_change(project_id, memo=session_memo(self.db_session))
+        return await start_project_deletion(project_id, current_user.id)
+
+    async def get_access(self, project_id: int, user_id: int) -> ProjectAccess | None:
+        """A user's access to a project, None when the project does not exist.
+
+        Looked up once per request and cached across requests for
+        PROJECT_ACCESS_CACHE_TTL seconds.
+        """
+        key = (project_id, user_id)
+        memo = session_memo(self.db_session)
+        if key in memo:
+            return memo[key]
+        access = project_access_cache.get(key)
+        if access is None:
+            row = await self.repository.get_access(project_id, user_id)
+            if row is not None:
+                access = ProjectAccess(*row)
+                project_access_cache.set(key, access)
+        memo[key] = access
+        return access
+
+    async def check_access(
+        self, project_id: int, current_user: Principal
+    ) -> ProjectAccess:
+        """Raise 404/403 unless the current user owns the project."""
+        access = await self.get_access(project_id, current_user.id)
+        if access is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+            )
 
-    async def get_project_by_id(self, project_id: int, current_user: User):
+        # Check if current_user is either the owner
+        if access.owner_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not allowed to access this project",
+            )
+        return access
+
+    async def check_ticket_access(
+        self, project_id: int, current_user: Principal
+    ) -> ProjectAccess:
+        """Raise 404/403 unless the current user may work on the project's tickets."""
+        access = await self.get_access(project_id, current_user.id)
+        if access is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+            )
+        if not may_act_on_tickets(current_user, access.owner_id, access.is_member):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not allowed to access tickets of this project",
+            )
+        return access
+
+    async def get_tickets_version(self, project_id: int) -> int:
+        """The version of a project's ticket list, bumped by every ticket write."""
+        version = await self.repository.get_tickets_version(project_id)
+        if version is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+            )
+        return version
+
+    async def get_project_by_id(self, project_id: int, current_user: Principal):
         """Retrieve a project by ID if the current user is the owner."""
+        await self.check_access(project_id, current_user)
         project = await self.repository.get_by_id(project_id)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
             )
+        return project
 
-        # Check if current_user is either the owner
-        if project.owner_id != current_user.id:
+    async def get_project_etag(self, project_id: int, current_user: Principal) -> str:
+        """Compute a project's ETag from a version probe, applying the same access rules."""
+        version = await self.repository.get_project_version(project_id)
+        if not version:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+            )
+        if version.owner_id != current_user.id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not allowed to access this project",
             )
+        return make_etag(version.id, version.updated_at)
 
-        return project
+    async def get_members_etag(self, project_id: int, *params) -> tuple[str, int]:
+        """Compute the ETag of a member page and the total member count.
+
+        Neither loads any member; `params` are the filters and page of the
+        request, which are part of the ETag.
+        """
+        project = await self.repository.get_version(project_id)
+        if not project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+            )
+        count, members_changed, users_changed = (
+            await self.repository.get_members_version(project_id)
+        )
+        etag = make_etag(project.id, count, members_changed, users_changed, *params)
+        return etag, count
 
-    async def get_projects_by_owner(self, owner_id: int):
-        """Get all projects by a specific owner."""
-        return await self.repository.get_projects_by_owner(owner_id)
+    async def list_my_projects(
+        self,
+        current_user: Principal,
+        project_status: Optional[ProjectStatus] = None,
+        cursor: Optional[int] = None,
+        limit: int = 50,
+    ) -> tuple[list, Optional[int]]:
+        """A page of the projects the user owns or belongs to, and the next cursor."""
+        projects = await self.read_repository.list_for_user(
+            current_user.id, project_status, cursor, limit + 1
+        )
+        if len(projects) > limit:
+            return projects[:limit], projects[limit - 1].id
+        return projects, None
 
     async def get_member(self, user_id: int) -> User:
         """Fetch a user by ID using the UserService."""
@@ -95,7 +211,10 @@ class ProjectService:
         return member
 
     async def add_member(
-        self, project_id: int, add_member_data: AddMemberRequest, current_user: User
+        self,
+        project_id: int,
+        add_member_data: AddMemberRequest,
+        current_user: Principal,
     ) -> ProjectOut:
         """Add a member to a project."""
 
@@ -115,10 +234,54 @@ class ProjectService:
             )
 
         # Add the member to the project
-        return await self.repository.add_member(project_id, member.id)
+        project = await self.repository.add_member(project_id, member.id)
+        await publish_access_change(
+            project_id, [member.id], session_memo(self.db_session)
+        )
+        return project
+
+    async def add_members(
+        self, project_id: int, user_ids: list[int], current_user: Principal
+    ) -> BatchMembersResult:
+        """Add several members to a project; existing members are left as they are."""
+        await self.check_access(project_id, current_user)
+        user_ids = list(dict.fromkeys(user_ids))
+
+        missing = await UserService(self.db_session).get_missing_ids(user_ids)
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Users not found: {missing}",
+            )
+
+        added = await self.repository.add_members(project_id, user_ids)
+        added_ids = set(added)
+        await publish_access_change(project_id, added, session_memo(self.db_session))
+        return BatchMembersResult(
+            project_id=project_id,
+            changed_user_ids=added,
+            unchanged_user_ids=[id for id in user_ids if id not in added_ids],
+        )
+
+    async def remove_members(
+        self, project_id: int, user_ids: list[int], current_user: Principal
+    ) -> BatchMembersResult:
+        """Remove several members from a project, with their ticket assignments."""
+        await self.check_access(project_id, current_user)
+        user_ids = list(dict.fromkeys(user_ids))
+
+        removed, unassigned = await self.repository.remove_members(project_id, user_ids)
+        removed_ids = set(removed)
+        await publish_access_change(project_id, removed, session_memo(self.db_session))
+        return BatchMembersResult(
+            project_id=project_id,
+            changed_user_ids=removed,
+            unchanged_user_ids=[id for id in user_ids if id not in removed_ids],
+            unassigned_executor_count=unassigned,
+        )
 
     async def remove_member(
-        self, project_id: int, member: User, current_user: User
+        self, project_id: int, member: User, current_user: Principal
     ) -> ProjectOut:
         """Remove a member from a project."""
         project = await self.repository.get_by_id(project_id)
@@ -130,15 +293,36 @@ class ProjectService:
             )
 
         await self.repository.remove_member(project_id, member.id)
+        await publish_access_change(
+            project_id, [member.id], session_memo(self.db_session)
+        )
         await self.db_session.refresh(project)
         return project
 
-    async def list_members(self, project_id: int) -> list[UserOut]:
-        """List all members of a project."""
-        return await self.repository.get_project_members(project_id)
+    async def list_members(
+        self,
+        project_id: int,
+        role: Optional[UserRole] = None,
+        name: Optional[str] = None,
+        cursor: Optional[int] = None,
+        limit: int = 100,
+    ) -> tuple[list, Optional[int]]:
+        """A page of a project's members as column rows, and the next cursor."""
+        members = await self.read_repository.list_members(
+            project_id, role, name, cursor, limit + 1
+        )
+        if len(members) > limit:
+            return members[:limit], members[limit - 1].id
+        return members, None
+
+    async def count_members(
+        self, project_id: int, role: Optional[UserRole], name: Optional[str]
+    ) -> int:
+        """Count a project's members matching the filters."""
+        return await self.read_repository.count_members(project_id, role, name)
 
     async def change_status(
-        self, project_id: int, new_status: ProjectStatus, current_user: User
+        self, project_id: int, new_status: ProjectStatus, current_user: Principal
     ) -> ProjectOut:
         """Change the status of a project."""
         project = await self.repository.get_by_id(project_id)
@@ -156,5 +340,5 @@ class ProjectService:
 
     async def is_user_member_of_project(self, project_id: int, user_id: int) -> bool:
         """Check if the user is a member of the given project."""
-        project_member = await self.repository.get_project_member(project_id, user_id)
-        return project_member is not None
+        access = await self.get_access(project_id, user_id)
+        return access is not None and access.is_member
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime
+
+from app.core.rabbitmq import RabbitMQConnection, get_rabbitmq_connection
+from app.core.settings import settings
+from app.tickets.schemas import TicketOut
+from app.users.principals import Principal
+
+logger = logging.getLogger(__name__)
+
+# Fanout exchange every ticket change is published to
+TICKET_UPDATES_EXCHANGE = "ticket_updates"
+
+
+async def publish_ticket_event(event: str, ticket, actor: Principal, **extra) -> None:
+    """Publish a ticket change to the ticket_updates exchange (best effort).
+
+    `ticket` is a Ticket entity or a TicketOut row.
+    """
+    message_body = {
+        "event": event,
+        "ticket_id": ticket.id,
+        "project_id": ticket.project_id,
+        "updated_by": actor.email,
+        "timestamp": str(datetime.now()),
+        **extra,
+    }
+    if event != "deleted":
+        message_body["ticket"] = TicketOut.model_validate(ticket).model_dump(
+            mode="json"
+        )
+
+    rabbitmq = await get_rabbitmq_connection()
+    try:
+        await rabbitmq.publish(
+            exchange_name=TICKET_UPDATES_EXCHANGE, message_body=message_body
+        )
+    except Exception:
+        # The change is already committed, a lost event must not fail the request
+        logger.exception("Failed to publish %s event for ticket %s", event, ticket.id)
+
+
+class Subscription:
+    """A single client's bounded buffer of events for one project."""
+
+    def __init__(self, project_id: int, buffer_size: int):
+        self.project_id = project_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self.dropped = False
+
+    async def get(self) -> dict | None:
+        """Wait for the next event; None means the subscription was dropped."""
+        return await self.queue.get()
+
+
+class TicketEventHub:
+    """Fan out ticket events from one broker consumer to per-project subscribers."""
+
+    def __init__(self, buffer_size: int):
+        self.buffer_size = buffer_size
+        self._topics: dict[int, set[Subscription]] = defaultdict(set)
+        self._consumer: asyncio.Task | None = None
+
+    def subscribe(self, project_id: int) -> Subscription:
+        """Register a subscriber for a project, starting the consumer if needed."""
+        subscription = Subscription(project_id, self.buffer_size)
+        self._topics[project_id].add(subscription)
+        if self._consumer is None or self._consumer.done():
+            self._consumer = asyncio.create_task(self._consume())
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber, dropping the project topic once it is empty."""
+        topic = self._topics.get(subscription.project_id)
+        if topic is None:
+            return
+        topic.discard(subscription)
+        if not topic:
+            del self._topics[subscription.project_id]
+
+    def dispatch(self, event: dict) -> None:
+        """Deliver an event to every subscriber of its project without waiting."""
+        for subscription in list(self._topics.get(event.get("project_id"), ())):
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._drop(subscription)
+
+    def _drop(self, subscription: Subscription) -> None:
+        """Disconnect a subscriber that fell behind instead of blocking the others."""
+        self.unsubscribe(subscription)
+        subscription.dropped = True
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+        logger.warning(
+            "Dropped slow event subscriber of project %s", subscription.project_id
+        )
+
+    async def close(self) -> None:
+        """Stop the broker consumer."""
+        if self._consumer is not None:
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+
+    async def _consume(self) -> None:
+        """Consume the ticket_updates exchange, reconnecting on broker failures."""
+        while True:
+            try:
+                async for event in RabbitMQConnection().subscribe(
+                    TICKET_UPDATES_EXCHANGE
+                ):
+                    self.dispatch(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Ticket event consumer failed, reconnecting")
+            await asyncio.sleep(1)
+
+
+def format_sse(event: dict) -> str:
+    """Render an event in the text/event-stream wire format."""
+    return f"event: {event.get('event', 'message')}\ndata: {json.dumps(event)}\n\n"
+
+
+ticket_event_hub = TicketEventHub(settings.EVENTS_SUBSCRIBER_BUFFER)
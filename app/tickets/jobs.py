@@ -0,0 +1,47 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from app.core.jobs import Job, job_registry
+from app.core.settings import settings
+from app.tickets.repository import TicketRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def archive_tickets_in_batches(job: Job) -> None:
+    """Move tickets due for archival to the archive tables, a bounded batch per transaction.
+
+    Due are DONE tickets untouched for TICKET_ARCHIVE_AFTER_DAYS and every
+    ticket of an archived project. Progress is reported on the job.
+    """
+    done_before = datetime.now(timezone.utc) - timedelta(
+        days=settings.TICKET_ARCHIVE_AFTER_DAYS
+    )
+    job.progress.update(done_before=done_before.isoformat(), tickets_archived=0)
+    async with job_registry.session_factory() as session:
+        repository = TicketRepository(session)
+        while archived := await repository.archive_batch(
+            done_before, settings.TICKET_ARCHIVE_BATCH_SIZE
+        ):
+            job.progress["tickets_archived"] += archived
+            await asyncio.sleep(settings.TICKET_ARCHIVE_BATCH_PAUSE)
+    if job.progress["tickets_archived"]:
+        logger.info("Archived %s tickets", job.progress["tickets_archived"])
+
+
+async def start_ticket_archival() -> Job:
+    return await job_registry.start("archive_tickets", archive_tickets_in_batches)
+
+
+async def schedule_ticket_archival() -> None:
+    """Start an archival run every TICKET_ARCHIVE_INTERVAL seconds, until cancelled.
+
+    Every worker runs its own schedule; concurrent runs skip each other's
+    locked rows, so they split the work instead of repeating it.
+    """
+    job = None
+    while True:
+        if job is None or job.finished_at is not None:
+            job = await start_ticket_archival()
+        await asyncio.sleep(settings.TICKET_ARCHIVE_INTERVAL)
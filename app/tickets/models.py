@@ -9,6 +9,11 @@ from sqlalchemy import (
     Enum as SqlEnum,
     CheckConstraint,
     ForeignKeyConstraint,
+    Index,
+    DDL,
+    Sequence,
+    event,
+    text,
 )
 from sqlalchemy.orm import relationship
 from app.core.base_model import BaseModel
@@ -22,32 +27,50 @@ class TicketStatus(str, Enum):
     DONE = "done"
 
 
+# Hash partitions of tickets and ticket_executors by project_id, changing it needs a migration
+TICKET_PARTITIONS = 16
+
+
 # Class-based model for the many-to-many relationship between tickets and executors
 class TicketExecutor(BaseModel):
     __tablename__ = "ticket_executors"
 
-    ticket_id = Column(
-        Integer, ForeignKey("tickets.id", ondelete="CASCADE"), nullable=False
-    )
+    # Partitioned by project: the key includes project_id
+    id = Column(Integer, Sequence("ticket_executors_id_seq"), primary_key=True)
+    ticket_id = Column(Integer, nullable=False)
     user_id = Column(Integer, nullable=False)
-    project_id = Column(Integer, nullable=False)
+    project_id = Column(Integer, primary_key=True)
 
     __table_args__ = (
+        ForeignKeyConstraint(
+            ["ticket_id", "project_id"],
+            ["tickets.id", "tickets.project_id"],
+            ondelete="CASCADE",
+        ),
         ForeignKeyConstraint(
             ["user_id", "project_id"],
             ["project_members.user_id", "project_members.project_id"],
             ondelete="CASCADE",
         ),
+        Index("ix_ticket_executors_ticket_id", "ticket_id"),
+        {"postgresql_partition_by": "HASH (project_id)"},
     )
 
     # Relationships
-    ticket = relationship("Ticket", back_populates="executors")
-    project_member = relationship("ProjectMember", back_populates="assigned_tickets")
+    ticket = relationship(
+        "Ticket", back_populates="executors", overlaps="project_member"
+    )
+    project_member = relationship(
+        "ProjectMember", back_populates="assigned_tickets", overlaps="ticket"
+    )
 
 
 class Ticket(BaseModel):
     __tablename__ = "tickets"
 
+    # Partitioned by project: the key includes project_id
+    id = Column(Integer, Sequence("tickets_id_seq"), primary_key=True)
+
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
 
@@ -59,7 +82,10 @@ class Ticket(BaseModel):
 
     # Many-to-many relationship with executors (Users)
     executors = relationship(
-        "TicketExecutor", back_populates="ticket", cascade="all, delete-orphan"
+        "TicketExecutor",
+        back_populates="ticket",
+        cascade="all, delete-orphan",
+        overlaps="assigned_tickets,project_member",
     )
 
     # Status and priority
@@ -67,9 +93,61 @@ class Ticket(BaseModel):
     priority = Column(Integer, nullable=False, default=3)
 
     # Each ticket belongs to a project
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
     project = relationship("Project", back_populates="tickets")
 
     __table_args__ = (
         CheckConstraint("priority >= 1 AND priority <= 5", name="priority_check"),
+        # Project ticket lists and open-ticket counts
+        Index("ix_tickets_project_id_status", "project_id", "status"),
+        # Finds DONE tickets due for archival; archival keeps it small
+        Index(
+            "ix_tickets_done_updated_at",
+            "updated_at",
+            postgresql_where=text("status = 'DONE'"),
+        ),
+        {"postgresql_partition_by": "HASH (project_id)"},
+    )
+
+
+# Cold storage for tickets moved out by the retention job (app.tickets.jobs).
+# Read-only copies of the hot rows, without foreign keys, keeping their ids.
+class ArchivedTicket(BaseModel):
+    __tablename__ = "tickets_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    title = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    responsible_user_id = Column(Integer, nullable=False)
+    status = Column(SqlEnum(TicketStatus), nullable=False)
+    priority = Column(Integer, nullable=False)
+    project_id = Column(Integer, nullable=False, index=True)
+    archived_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+
+
+class ArchivedTicketExecutor(BaseModel):
+    __tablename__ = "ticket_executors_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    ticket_id = Column(Integer, nullable=False, index=True)
+    user_id = Column(Integer, nullable=False)
+    project_id = Column(Integer, nullable=False)
+
+
+def _create_hash_partitions(table) -> None:
+    """Create the TICKET_PARTITIONS partitions of a table right after the table."""
+    for remainder in range(TICKET_PARTITIONS):
+        event.listen(
+            table,
+            "after_create",
+            DDL(
+                f"CREATE TABLE {table.name}_p{remainder} PARTITION OF {table.name} "
+                f"FOR VALUES WITH (MODULUS {TICKET_PARTITIONS}, REMAINDER {remainder})"
+            ).execute_if(dialect="postgresql"),
+        )
+
+
+_create_hash_partitions(Ticket.__table__)
+_create_hash_partitions(TicketExecutor.__table__)
@@ -1,20 +1,130 @@
-from typing import Optional
+from datetime import datetime
+from typing import NamedTuple, Optional
 
-from sqlalchemy import update, delete
+from sqlalchemy import (
+    and_,
+    delete,
+    exists,
+    false,
+    insert,
+    or_,
+    tuple_,
+    union,
+    union_all,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
-from app.tickets.models import Ticket, TicketExecutor
+from app.tickets.models import (
+    ArchivedTicket,
+    ArchivedTicketExecutor,
+    Ticket,
+    TicketExecutor,
+    TicketStatus,
+)
 from app.core.base_repository import BaseRepository
+from app.core.read_repository import ReadRepository, row_type, select_for
+from app.projects.models import Project, ProjectMember, ProjectStatus
+from app.projects.repository import bump_tickets_version
+from app.tickets.schemas import TicketOut
 from sqlalchemy.future import select
 
 from app.users.models import User
 
 
+class TicketAccess(NamedTuple):
+    """A ticket (as TicketOut row) with what its caller and target user may do."""
+
+    ticket: tuple
+    owner_id: int
+    caller_is_member: bool
+    target_exists: bool
+    target_is_member: bool
+    archived: bool = False
+
+
+# Columns copied from the hot tables into the archive
+_TICKET_COLUMNS = [column.name for column in Ticket.__table__.columns]
+_EXECUTOR_COLUMNS = [column.name for column in TicketExecutor.__table__.columns]
+
+
 class TicketRepository(BaseRepository[Ticket]):
     def __init__(self, db_session: AsyncSession):
         super().__init__(Ticket, db_session)
 
+    async def get_version(self, id: int):
+        """Fetch the (id, updated_at) pair of a ticket of a project not being deleted.
+
+        Tickets moved out by the retention job are looked up in the archive.
+        """
+        for model in (Ticket, ArchivedTicket):
+            query = (
+                select(model.id, model.updated_at)
+                .join(Project, Project.id == model.project_id)
+                .where(model.id == id, Project.deleting_at.is_(None))
+            )
+            result = await self.db_session.execute(query)
+            version = result.first()
+            if version is not None:
+                return version
+        return None
+
+    async def archive_batch(self, done_before: datetime, limit: int) -> int:
+        """Move up to `limit` tickets and their executors to the archive, in one transaction.
+
+        Due are DONE tickets last updated before `done_before` and every
+        ticket of an archived project. Rows locked by a concurrent archival
+        are skipped.
+        """
+        archived_projects = select(Project.id).where(
+            Project.status == ProjectStatus.ARCHIVED
+        )
+        result = await self.db_session.execute(
+            select(Ticket.id, Ticket.project_id)
+            .where(
+                or_(
+                    and_(
+                        Ticket.status == TicketStatus.DONE,
+                        Ticket.updated_at < done_before,
+                    ),
+                    Ticket.project_id.in_(archived_projects),
+                )
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        keys = [tuple(row) for row in result.all()]
+        if keys:
+            ticket_keys = tuple_(Ticket.id, Ticket.project_id).in_(keys)
+            executor_keys = tuple_(
+                TicketExecutor.ticket_id, TicketExecutor.project_id
+            ).in_(keys)
+            await self.db_session.execute(
+                insert(ArchivedTicketExecutor).from_select(
+                    _EXECUTOR_COLUMNS,
+                    select(*TicketExecutor.__table__.columns).where(executor_keys),
+                )
+            )
+            await self.db_session.execute(
+                insert(ArchivedTicket).from_select(
+                    _TICKET_COLUMNS,
+                    select(*Ticket.__table__.columns).where(ticket_keys),
+                )
+            )
+            await self.db_session.execute(
+                delete(TicketExecutor)
+                .where(executor_keys)
+                .execution_options(synchronize_session=False)
+            )
+            await self.db_session.execute(
+                delete(Ticket)
+                .where(ticket_keys)
+                .execution_options(synchronize_session=False)
+            )
+        await self.db_session.commit()
+        return len(keys)
+
     async def add_executor(self, ticket_id: int, project_id: int, user_id: int) -> None:
         """Add an executor (user) to a ticket."""
         ticket_executor = TicketExecutor(
@@ -23,11 +133,54 @@ class TicketRepository(BaseRepository[Ticket]):
         self.db_session.add(ticket_executor)
         await self.db_session.commit()
 
-    async def remove_executor(self, ticket_id: int, user_id: int) -> None:
+    async def create(self, obj_in: dict) -> Ticket:
+        """Create a ticket and bump its project's tickets version, in one transaction."""
+        ticket = Ticket(**obj_in)
+        self.db_session.add(ticket)
+        await self.db_session.execute(bump_tickets_version(ticket.project_id))
+        await self.db_session.commit()
+        await self.db_session.refresh(ticket)
+        return ticket
+
+    async def delete(self, id: int, project_id: Optional[int] = None) -> None:
+        """Delete a ticket, in its project's partition only when the project is known."""
+        query = delete(Ticket).where(Ticket.id == id)
+        if project_id is not None:
+            query = query.where(Ticket.project_id == project_id)
+        result = await self.db_session.execute(
+            query.returning(Ticket.project_id).execution_options(
+                synchronize_session="fetch"
+            )
+        )
+        deleted_from = result.scalars().all()
+        if deleted_from:
+            await self.db_session.execute(bump_tickets_version(*deleted_from))
+        await self.db_session.commit()
+
+    async def update_returning(self, ticket_id: int, project_id: int, values: dict):
+        """Update a ticket and return its TicketOut row from the same statement."""
+        query = (
+            update(Ticket)
+            .where(Ticket.id == ticket_id, Ticket.project_id == project_id)
+            .values(**values)
+            .returning(*(getattr(Ticket, name) for name in TicketOut.model_fields))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db_session.execute(query)
+        row = result.first()
+        if row is not None:
+            await self.db_session.execute(bump_tickets_version(project_id))
+        await self.db_session.commit()
+        return row_type(TicketOut)._make(row) if row is not None else None
+
+    async def remove_executor(
+        self, ticket_id: int, project_id: int, user_id: int
+    ) -> None:
         """Remove an executor (user) from a ticket."""
         query = (
             delete(TicketExecutor)
             .where(TicketExecutor.ticket_id == ticket_id)
+            .where(TicketExecutor.project_id == project_id)
             .where(TicketExecutor.user_id == user_id)
             .execution_options(synchronize_session="fetch")
         )
@@ -60,11 +213,122 @@ class TicketRepository(BaseRepository[Ticket]):
         await self.db_session.commit()
         return await self.get_by_id(ticket_id)
 
-    async def get_ticket_executors(self, ticket_id: int) -> list[User]:
+    async def get_ticket_executors(
+        self, ticket_id: int, project_id: int, archived: bool = False
+    ) -> list[User]:
         """Retrieve all executors for a given ticket."""
+        model = ArchivedTicketExecutor if archived else TicketExecutor
         result = await self.db_session.execute(
             select(User)
-            .join(TicketExecutor, TicketExecutor.user_id == User.id)
-            .where(TicketExecutor.ticket_id == ticket_id)
+            .join(model, model.user_id == User.id)
+            .where(model.ticket_id == ticket_id, model.project_id == project_id)
         )
         return result.scalars().all()
+
+    async def get_notification_recipients(
+        self, ticket_ids: list[int]
+    ) -> list[tuple[int, str]]:
+        """Fetch (ticket_id, email) of the active responsible users and executors of tickets."""
+        responsible = (
+            select(Ticket.id.label("ticket_id"), User.email)
+            .join(User, User.id == Ticket.responsible_user_id)
+            .where(Ticket.id.in_(ticket_ids), User.is_active.isnot(False))
+        )
+        executors = (
+            select(TicketExecutor.ticket_id, User.email)
+            .join(User, User.id == TicketExecutor.user_id)
+            .where(
+                TicketExecutor.ticket_id.in_(ticket_ids), User.is_active.isnot(False)
+            )
+        )
+        result = await self.db_session.execute(union(responsible, executors))
+        return result.all()
+
+
+class TicketReadRepository(ReadRepository):
+    """Column-projected ticket reads for the GET endpoints."""
+
+    async def get_ticket(self, ticket_id: int):
+        """Fetch the TicketOut columns of a ticket of a project not being deleted.
+
+        Tickets moved out by the retention job are read from the archive.
+        """
+        for model in (Ticket, ArchivedTicket):
+            ticket = await self.fetch_one(
+                TicketOut,
+                select_for(model, TicketOut)
+                .join(Project, Project.id == model.project_id)
+                .where(model.id == ticket_id, Project.deleting_at.is_(None)),
+            )
+            if ticket is not None:
+                return ticket
+        return None
+
+    async def is_archived(self, ticket_id: int) -> bool:
+        """Whether a ticket of a project not being deleted is in the archive."""
+        query = select(
+            exists()
+            .where(ArchivedTicket.id == ticket_id)
+            .where(Project.id == ArchivedTicket.project_id)
+            .where(Project.deleting_at.is_(None))
+        )
+        result = await self.db_session.execute(query)
+        return result.scalar_one()
+
+    async def get_for_action(
+        self,
+        ticket_id: int,
+        user_id: int,
+        target_user_id: Optional[int] = None,
+        archived: bool = False,
+    ) -> Optional[TicketAccess]:
+        """Fetch a ticket and every fact needed to authorise an action on it.
+
+        One statement returns the TicketOut columns, the project owner,
+        whether the caller is a project member and, for executor changes,
+        whether the target user exists and is a project member. With
+        `archived` the ticket is looked up in the archive instead.
+        """
+        model = ArchivedTicket if archived else Ticket
+
+        def is_member(member_id: int):
+            return exists().where(
+                ProjectMember.project_id == model.project_id,
+                ProjectMember.user_id == member_id,
+            )
+
+        if target_user_id is None:
+            target_exists = target_is_member = false()
+        else:
+            target_exists = exists().where(
+                User.id == target_user_id, User.deleting_at.is_(None)
+            )
+            target_is_member = is_member(target_user_id)
+
+        query = (
+            select_for(model, TicketOut)
+            .add_columns(
+                Project.owner_id,
+                is_member(user_id),
+                target_exists,
+                target_is_member,
+            )
+            .join(Project, Project.id == model.project_id)
+            .where(model.id == ticket_id, Project.deleting_at.is_(None))
+        )
+        result = await self.db_session.execute(query)
+        row = result.first()
+        if row is None:
+            return None
+        fields = len(TicketOut.model_fields)
+        return TicketAccess(
+            row_type(TicketOut)._make(row[:fields]), *row[fields:], archived=archived
+        )
+
+    async def list_by_project(self, project_id: int) -> list:
+        """Fetch the TicketOut columns of every ticket of a project, archived ones included."""
+        hot = select_for(Ticket, TicketOut).where(Ticket.project_id == project_id)
+        archived = select_for(ArchivedTicket, TicketOut).where(
+            ArchivedTicket.project_id == project_id
+        )
+        return await self.fetch_all(TicketOut, union_all(hot, archived).order_by("id"))
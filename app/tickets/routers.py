@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.etag import make_etag, etag_matches
+from app.core.responses import json_response, model_response
+
 from app.tickets.schemas import (
     TicketCreate,
     TicketUpdate,
@@ -9,7 +12,8 @@ from app.tickets.schemas import (
     TicketStatusUpdate,
 )
 from app.tickets.services import TicketService
-from app.users.dependencies import get_current_user, roles_required
+from app.users.dependencies import get_current_principal, roles_required
+from app.users.principals import Principal
 from app.core.database import get_db
 
 # Create the router instance
@@ -52,18 +56,21 @@ class TicketRouter:
             "/{ticket_id}/executors",
             self.add_executor,
             methods=["POST"],
+            response_model=TicketOut,
             tags=["Tickets"],
         )
         ticket_router.add_api_route(
             "/{ticket_id}/executors/{executor_id}",
             self.remove_executor,
             methods=["DELETE"],
+            response_model=TicketOut,
             tags=["Tickets"],
         )
         ticket_router.add_api_route(
             "/{ticket_id}/status",
             self.change_status,
             methods=["PUT"],
+            response_model=TicketOut,
             tags=["Tickets"],
         )
         ticket_router.add_api_route(
@@ -85,23 +92,41 @@ class TicketRouter:
         self,
         ticket_data: TicketCreate,
         db: AsyncSession = Depends(get_db),
-        current_user: dict = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
         """Create a new ticket."""
         service = TicketService(db)
         return await service.create_ticket(ticket_data, current_user)
 
-    async def get_ticket(self, ticket_id: int, db: AsyncSession = Depends(get_db)):
-        """Retrieve a specific ticket by ID."""
+    async def get_ticket(
+        self,
+        ticket_id: int,
+        request: Request,
+        db: AsyncSession = Depends(get_db),
+    ):
+        """Retrieve a specific ticket by ID, honouring If-None-Match."""
         service = TicketService(db)
-        return await service.get_ticket_by_id(ticket_id)
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match:
+            etag = await service.get_ticket_etag(ticket_id)
+            if etag_matches(if_none_match, etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+                )
+
+        ticket = await service.get_ticket(ticket_id)
+        return model_response(
+            TicketOut,
+            ticket,
+            headers={"ETag": make_etag(ticket.id, ticket.updated_at)},
+        )
 
     async def update_ticket(
         self,
         ticket_id: int,
         ticket_data: TicketUpdate,
         db: AsyncSession = Depends(get_db),
-        current_user: dict = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
         """Update a specific ticket by ID."""
         service = TicketService(db)
@@ -111,7 +136,7 @@ class TicketRouter:
         self,
         ticket_id: int,
         db: AsyncSession = Depends(get_db),
-        current_user: dict = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
         """Delete a specific ticket by ID."""
         service = TicketService(db)
@@ -122,7 +147,7 @@ class TicketRouter:
         ticket_id: int,
         executor_data: ExecutorAssign,
         db: AsyncSession = Depends(get_db),
-        current_user: dict = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
         """Add an executor to the ticket."""
         service = TicketService(db)
@@ -133,7 +158,7 @@ class TicketRouter:
         ticket_id: int,
         executor_id: int,
         db: AsyncSession = Depends(get_db),
-        current_user: dict = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
         """Remove an executor from the ticket."""
         service = TicketService(db)
@@ -145,7 +170,7 @@ class TicketRouter:
         ticket_id: int,
         status_data: TicketStatusUpdate,
         db: AsyncSession = Depends(get_db),
-        current_user: dict = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
         """Change the status of a specific ticket."""
         service = TicketService(db)
@@ -154,22 +179,31 @@ class TicketRouter:
     async def list_tickets(
         self,
         project_id: int,
+        request: Request,
         db: AsyncSession = Depends(get_db),
-        current_user: dict = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_principal),
     ):
-        """List all tickets for a project."""
+        """List all tickets for a project, honouring If-None-Match."""
         service = TicketService(db)
-        return await service.list_tickets(project_id, current_user)
+        version = await service.get_ticket_list_version(project_id, current_user)
+        etag = make_etag(project_id, version)
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+        body = await service.get_ticket_list_json(project_id, version)
+        return json_response(body, headers={"ETag": etag})
 
     async def list_executors(
         self,
         ticket_id: int,
         db: AsyncSession = Depends(get_db),
-        current_user: dict = Depends(get_current_user),
-    ) -> list[UserOut]:
+        current_user: Principal = Depends(get_current_principal),
+    ):
         """List all executors of a specific ticket."""
         service = TicketService(db)
-        return await service.list_executors(ticket_id, current_user)
+        executors = await service.list_executors(ticket_id, current_user)
+        return model_response(UserOut, executors)
 
 
 # Initialize the ticket router
@@ -1,28 +1,37 @@
-from datetime import datetime
 from typing import Optional
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.rabbitmq import get_rabbitmq_connection
+from app.core.etag import make_etag
+from app.core.responses import dump_json
+from app.tickets.events import publish_ticket_event
 from app.tickets.models import Ticket, TicketExecutor
-from app.tickets.repository import TicketRepository
+from app.projects.access import may_act_on_tickets
+from app.tickets.repository import (
+    TicketAccess,
+    TicketRepository,
+    TicketReadRepository,
+)
+from app.tickets.snapshots import ticket_list_snapshots
 from app.tickets.schemas import (
     TicketCreate,
+    TicketOut,
     TicketUpdate,
     ExecutorAssign,
     TicketStatus,
     TicketStatusUpdate,
 )
-from app.users.schemas import UserOut
 from app.users.services import UserService
 from app.projects.services import ProjectService
 from app.users.models import User
+from app.users.principals import Principal
 
 
 class TicketService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.ticket_repository = TicketRepository(db)
+        self.read_repository = TicketReadRepository(db)
         self.user_service = UserService(db)
         self.project_service = ProjectService(db)
 
@@ -38,17 +47,72 @@ class TicketService:
 
         return ticket
 
+    async def get_ticket(self, ticket_id: int):
+        """Read a ticket's response columns without loading the entity."""
+        ticket = await self.read_repository.get_ticket(ticket_id)
+        if not ticket:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found."
+            )
+        return ticket
+
+    async def get_ticket_etag(self, ticket_id: int) -> str:
+        """Compute a ticket's ETag from its (id, updated_at) version probe."""
+        version = await self.ticket_repository.get_version(ticket_id)
+        if not version:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found."
+            )
+        return make_etag(version.id, version.updated_at)
+
+    async def authorize(
+        self,
+        ticket_id: int,
+        current_user: Principal,
+        target_user_id: Optional[int] = None,
+        allow_archived: bool = False,
+    ) -> TicketAccess:
+        """Load a ticket and check the caller may act on it, in one statement.
+
+        Archived tickets are read-only: they are only found for reads
+        (`allow_archived`), other actions on them are a 409.
+        """
+        access = await self.read_repository.get_for_action(
+            ticket_id, current_user.id, target_user_id
+        )
+        if access is None and allow_archived:
+            access = await self.read_repository.get_for_action(
+                ticket_id, current_user.id, target_user_id, archived=True
+            )
+        if access is None:
+            if not allow_archived and await self.read_repository.is_archived(ticket_id):
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Archived tickets cannot be changed.",
+                )
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found."
+            )
+        if not may_act_on_tickets(
+            current_user, access.owner_id, access.caller_is_member
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not allowed to access tickets of this project",
+            )
+        if target_user_id is not None and not access.target_exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+        return access
+
     async def create_ticket(
-        self, ticket_data: TicketCreate, current_user: User
+        self, ticket_data: TicketCreate, current_user: Principal
     ) -> Ticket:
-        # Verify the project exists
-        project = await self.project_service.get_project_by_id(
+        # Verify the project exists and the user may add tickets to it
+        await self.project_service.check_ticket_access(
             ticket_data.project_id, current_user
         )
-        if not project:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
-            )
 
         # Create the ticket
         ticket_obj = await self.ticket_repository.create(
@@ -61,125 +125,127 @@ class TicketService:
                 "responsible_user_id": current_user.id,  # Assign current user as responsible user
             }
         )
+        await publish_ticket_event("created", ticket_obj, current_user)
 
         return ticket_obj
 
     async def update_ticket(
-        self, ticket_id: int, ticket_data: TicketUpdate, current_user: User
-    ) -> Ticket:
-        ticket = await self.get_ticket_by_id(ticket_id)
-        if not ticket:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found"
-            )
+        self, ticket_id: int, ticket_data: TicketUpdate, current_user: Principal
+    ):
+        access = await self.authorize(ticket_id, current_user)
 
         # Update ticket data
         updated_data = ticket_data.model_dump(exclude_unset=True)
-        updated_ticket = await self.ticket_repository.update(ticket_id, updated_data)
+        updated_ticket = await self.ticket_repository.update_returning(
+            ticket_id, access.ticket.project_id, updated_data
+        )
+        await publish_ticket_event("updated", updated_ticket, current_user)
 
         return updated_ticket
 
-    async def delete_ticket(self, ticket_id: int, current_user: User) -> None:
-        ticket = await self.get_ticket_by_id(ticket_id)
-        if not ticket:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found"
-            )
-        await self.ticket_repository.delete(ticket_id)
+    async def delete_ticket(self, ticket_id: int, current_user: Principal) -> None:
+        access = await self.authorize(ticket_id, current_user)
+        await self.ticket_repository.delete(ticket_id, access.ticket.project_id)
+        await publish_ticket_event("deleted", access.ticket, current_user)
 
     async def add_executor(
-        self, ticket_id: int, executor_data: ExecutorAssign, current_user: User
-    ) -> Ticket:
-        ticket = await self.get_ticket_by_id(ticket_id)
+        self, ticket_id: int, executor_data: ExecutorAssign, current_user: Principal
+    ):
+        access = await self.authorize(ticket_id, current_user, executor_data.user_id)
 
-        # Verify the user exists
-        executor = await self.user_service.get_user_by_id(executor_data.user_id)
-        if not executor:
+        # Executors are picked among the project members
+        if not access.target_is_member:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User is not a member of this project",
             )
 
         # Add executor to ticket
         await self.ticket_repository.add_executor(
-            ticket_id, ticket.project_id, executor.id
+            ticket_id, access.ticket.project_id, executor_data.user_id
+        )
+        await publish_ticket_event(
+            "executor_added", access.ticket, current_user, user_id=executor_data.user_id
         )
 
-        return ticket
+        return access.ticket
 
     async def remove_executor(
-        self, ticket_id: int, executor_data: ExecutorAssign, current_user: User
-    ) -> Ticket:
-        ticket = await self.get_ticket_by_id(ticket_id)
-
-        # Verify the user exists
-        executor = await self.user_service.get_user_by_id(executor_data.user_id)
-        if not executor:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-            )
+        self, ticket_id: int, executor_data: ExecutorAssign, current_user: Principal
+    ):
+        access = await self.authorize(ticket_id, current_user, executor_data.user_id)
 
         # Remove executor from ticket
-        await self.ticket_repository.remove_executor(ticket_id, executor.id)
+        await self.ticket_repository.remove_executor(
+            ticket_id, access.ticket.project_id, executor_data.user_id
+        )
+        await publish_ticket_event(
+            "executor_removed",
+            access.ticket,
+            current_user,
+            user_id=executor_data.user_id,
+        )
 
-        return ticket
+        return access.ticket
 
-    async def list_tickets(self, project_id: int, current_user: User) -> list[Ticket]:
-        project = await self.project_service.get_project_by_id(project_id, current_user)
-        if not project:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
-            )
+    async def get_ticket_list_version(
+        self, project_id: int, current_user: Principal
+    ) -> int:
+        """Check the caller may list a project's tickets and return the list's version."""
+        await self.project_service.check_ticket_access(project_id, current_user)
+        return await self.project_service.get_tickets_version(project_id)
 
-        return await self.ticket_repository.get_all()
+    async def get_ticket_list_json(self, project_id: int, version: int) -> bytes:
+        """The serialised ticket list of a project at `version`.
 
-    async def change_ticket_status(
-        self, ticket_id: int, status_data: TicketStatusUpdate, current_user: User
-    ) -> Ticket:
-        ticket = await self.get_ticket_by_id(ticket_id)
+        Served from the per-project snapshot while no ticket write has bumped
+        the version; otherwise read, serialised once and cached again.
+        """
+        body = ticket_list_snapshots.get(project_id, version)
+        if body is None:
+            tickets = await self.read_repository.list_by_project(project_id)
+            body = dump_json(TicketOut, tickets)
+            ticket_list_snapshots.set(project_id, version, body)
+        return body
 
+    async def change_ticket_status(
+        self, ticket_id: int, status_data: TicketStatusUpdate, current_user: Principal
+    ):
         # Validate the new status
         if status_data.new_status not in ["todo", "in_progress", "done"]:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid status"
             )
 
+        access = await self.authorize(ticket_id, current_user)
+
         # Change the ticket status
-        updated_ticket = await self.ticket_repository.update(
-            ticket_id, {"status": status_data.new_status}
+        updated_ticket = await self.ticket_repository.update_returning(
+            ticket_id, access.ticket.project_id, {"status": status_data.new_status}
         )
-        rabbitmq = await get_rabbitmq_connection()
-
-        # Prepare RabbitMQ message
-        message_body = {
-            "ticket_id": ticket.id,
-            "new_status": status_data.new_status,
-            "updated_by": current_user.email,
-            "timestamp": str(datetime.now()),
-        }
-
-        # Send RabbitMQ message
-        await rabbitmq.send_message(
-            queue_name="ticket_updates", message_body=message_body
+        await publish_ticket_event(
+            "status_changed",
+            updated_ticket,
+            current_user,
+            new_status=status_data.new_status,
         )
 
         return updated_ticket
 
-    async def list_executors(self, ticket_id: int, current_user: User) -> list[UserOut]:
+    async def list_executors(
+        self, ticket_id: int, current_user: Principal
+    ) -> list[User]:
         """List all executors of a ticket."""
-        # Retrieve the ticket
-        ticket = await self.get_ticket_by_id(ticket_id)
-        if not ticket:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found."
-            )
+        access = await self.authorize(ticket_id, current_user, allow_archived=True)
 
         # Retrieve executors from the repository
-        executors = await self.ticket_repository.get_ticket_executors(ticket_id)
+        executors = await self.ticket_repository.get_ticket_executors(
+            ticket_id, access.ticket.project_id, archived=access.archived
+        )
         if not executors:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No executors found for this ticket.",
             )
 
-        # Convert executors to UserOut schema
-        return [UserOut.model_validate(executor) for executor in executors]
+        return executors
@@ -0,0 +1,7 @@
+from app.core.cache import SnapshotCache
+from app.core.settings import settings
+
+# Pre-serialised ticket lists by project id, versioned by projects.tickets_version
+ticket_list_snapshots = SnapshotCache(
+    "ticket_list_snapshots", settings.TICKET_SNAPSHOT_CACHE_BYTES
+)
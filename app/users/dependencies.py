@@ -1,12 +1,14 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from multipart.exceptions import DecodeError
+from jose.exceptions import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.core.settings import settings
 from app.users.models import User
-from app.users.utils import verify_access_token
+from app.users.principals import Principal, get_principal_cache
+from app.users.repository import UserRepository
+from app.users.role_claims import claimed_role
+from app.users.utils import verify_access_token, decode_access_token
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
@@ -20,37 +22,65 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 #     return verify_access_token(token)
 
 
-async def get_current_user(
-    db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme)
-):
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=401,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
 
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        user_id: str = payload.get("id")
-        if user_id is None:
-            raise credentials_exception
-        token_data = {
-            "id": user_id,
-            "role": payload.get("role"),
-        }  # Add other fields if necessary
+
+def _token_claims(token: str) -> dict:
+    """The claims of a valid access token, 401 otherwise."""
+    try:
+        claims = decode_access_token(token)
     except JWTError:
-        raise credentials_exception
+        raise _credentials_exception()
+    if claims.get("id") is None:
+        raise _credentials_exception()
+    return claims
+
 
-    user = await db.get(User, int(token_data["id"]))
-    if user is None:
-        raise credentials_exception
+def _token_user_id(token: str) -> int:
+    """The user ID of a valid access token, 401 otherwise."""
+    return int(_token_claims(token)["id"])
+
+
+async def get_current_user(
+    db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme)
+):
+    user = await db.get(User, _token_user_id(token))
+    if user is None or user.deleting_at is not None:
+        raise _credentials_exception()
 
     return user
 
 
+async def get_current_principal(
+    db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme)
+) -> Principal:
+    """The current user's id, email, role and is_active, for routes needing no more.
+
+    Served from the node's shared principal cache when it is enabled, so a
+    hit does not touch the database.
+    """
+    user_id = _token_user_id(token)
+    cache = get_principal_cache()
+    principal = cache.get(user_id) if cache is not None else None
+    if principal is None:
+        user = await UserRepository(db).get_by_id(user_id)
+        if user is None:
+            raise _credentials_exception()
+        principal = Principal.from_user(user)
+        if cache is not None:
+            cache.set(principal)
+    return principal
+
+
 def roles_required(*required_roles: str):
+    if settings.ROLE_CLAIMS_ENABLED:
+        return _claims_role_checker(required_roles)
+
     def role_checker(current_user: dict = Depends(get_current_user)):
         user_role = current_user.role
         if user_role not in required_roles:
@@ -60,3 +90,24 @@ def roles_required(*required_roles: str):
         return current_user
 
     return role_checker
+
+
+def _claims_role_checker(required_roles: tuple[str, ...]):
+    """Check the role claim of the token instead of loading the user.
+
+    Tokens issued before the user's role changed or they were deleted are
+    refused (see app.users.role_claims).
+    """
+
+    async def role_checker(token: str = Depends(oauth2_scheme)) -> dict:
+        claims = _token_claims(token)
+        role = claimed_role(claims)
+        if role is None:
+            raise _credentials_exception()
+        if role not in required_roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions"
+            )
+        return claims
+
+    return role_checker
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+
+from app.core.jobs import Job, drain, job_registry
+from app.core.settings import settings
+from app.projects.access import publish_access_change
+from app.projects.models import Project, ProjectMember
+from app.tickets.models import (
+    ArchivedTicket,
+    ArchivedTicketExecutor,
+    Ticket,
+    TicketExecutor,
+)
+from app.users.repository import UserRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def delete_user_in_batches(job: Job, user_id: int, successor_id: int) -> None:
+    """Delete a user marked as deleting, a bounded batch per transaction.
+
+    Their tickets (archived ones included) and owned projects are handed to
+    the successor first, then their ticket assignments and memberships are
+    purged, then the user row.
+    Progress is reported on the job. Every step only touches what is left,
+    so an interrupted deletion simply starts over; a step ends once no row
+    references the user, not when a batch comes back empty because other
+    transactions hold the remaining rows locked.
+    Only one worker runs the deletion of a given user at a time.
+    """
+    async with job_registry.exclusive(job.kind, user_id) as acquired:
+        if not acquired:
+            job.progress.update(user_id=user_id, running_elsewhere=True)
+            return
+        await _delete_user(job, user_id, successor_id)
+
+
+async def _delete_user(job: Job, user_id: int, successor_id: int) -> None:
+    batch_size = settings.USER_DELETE_BATCH_SIZE
+    pause = settings.USER_DELETE_BATCH_PAUSE
+    async with job_registry.session_factory() as session:
+        repository = UserRepository(session)
+        job.progress.update(
+            user_id=user_id,
+            successor_id=successor_id,
+            **await repository.count_references(user_id),
+            tickets_reassigned=0,
+            projects_reassigned=0,
+            executors_deleted=0,
+            memberships_deleted=0,
+        )
+        await session.commit()
+
+        for model in (Ticket, ArchivedTicket):
+            async for reassigned in drain(
+                lambda: repository.reassign_ticket_batch(
+                    user_id, successor_id, batch_size, model
+                ),
+                lambda: repository.has_references(user_id, model.responsible_user_id),
+            ):
+                job.progress["tickets_reassigned"] += reassigned
+                await asyncio.sleep(pause)
+
+        async for project_ids in drain(
+            lambda: repository.reassign_project_batch(
+                user_id, successor_id, batch_size
+            ),
+            lambda: repository.has_references(user_id, Project.owner_id),
+        ):
+            for project_id in project_ids:
+                await publish_access_change(project_id)
+            job.progress["projects_reassigned"] += len(project_ids)
+            await asyncio.sleep(pause)
+
+        for model in (TicketExecutor, ArchivedTicketExecutor):
+            async for deleted in drain(
+                lambda: repository.delete_executor_batch(user_id, batch_size, model),
+                lambda: repository.has_references(user_id, model.user_id),
+            ):
+                job.progress["executors_deleted"] += deleted
+                await asyncio.sleep(pause)
+
+        async for project_ids in drain(
+            lambda: repository.delete_membership_batch(user_id, batch_size),
+            lambda: repository.has_references(user_id, ProjectMember.user_id),
+        ):
+            for project_id in project_ids:
+                await publish_access_change(project_id, [user_id])
+            job.progress["memberships_deleted"] += len(project_ids)
+
+        await repository.delete(user_id)
+    logger.info("User %s deleted: %s", user_id, job.progress)
+
+
+async def start_user_deletion(user_id: int, successor_id: int) -> Job:
+    return await job_registry.start(
+        "delete_user", delete_user_in_batches, user_id, successor_id
+    )
+
+
+async def resume_user_deletions() -> None:
+    """Restart the deletions interrupted by a previous shutdown."""
+    async with job_registry.session_factory() as session:
+        deleting = await UserRepository(session).get_deleting()
+    for user_id, successor_id in deleting:
+        logger.info("Resuming deletion of user %s", user_id)
+        await start_user_deletion(user_id, successor_id)
@@ -1,4 +1,12 @@
-from sqlalchemy import Column, String, Boolean, Enum as SqlEnum
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Boolean,
+    Enum as SqlEnum,
+)
 from sqlalchemy.orm import relationship
 
 from app.core.base_model import BaseModel
@@ -23,6 +31,11 @@ class User(BaseModel):
     is_active = Column(Boolean, default=True)
     role = Column(SqlEnum(UserRole), nullable=False, default=UserRole.USER)
 
+    # Set when a background deletion starts, with the user inheriting
+    # their tickets and projects; such users read as gone
+    deleting_at = Column(DateTime(timezone=True), nullable=True)
+    successor_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+
     # Relationship with projects (as owner)
     owned_projects = relationship(
         "Project", back_populates="owner", cascade="all, delete-orphan"
@@ -0,0 +1,107 @@
+import logging
+from datetime import datetime
+from functools import lru_cache
+from typing import NamedTuple
+
+from app.core.invalidation import invalidation_bus
+from app.core.settings import settings
+from app.users.models import User, UserRole
+
+logger = logging.getLogger(__name__)
+
+ROLES = list(UserRole)
+# Room for the role, is_active and the email, longer emails are not cached
+PRINCIPAL_VALUE_SIZE = 192
+
+
+class Principal(NamedTuple):
+    """The part of a user that authorisation needs, cheap to cache and share."""
+
+    id: int
+    email: str
+    role: UserRole
+    is_active: bool
+    version: int
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            user.id,
+            user.email,
+            user.role,
+            bool(user.is_active),
+            user_version(user.updated_at),
+        )
+
+
+def user_version(updated_at: datetime) -> int:
+    """A user's version: their updated_at in microseconds."""
+    return int(updated_at.timestamp() * 1_000_000)
+
+
+class PrincipalCache:
+    """Principals of every worker on a node, in a SharedMemoryCache."""
+
+    def __init__(self, table):
+        self.table = table
+
+    def get(self, user_id: int) -> Principal | None:
+        entry = self.table.get(user_id)
+        if entry is None:
+            return None
+        version, value = entry
+        role, is_active = value[0], value[1]
+        return Principal(
+            user_id, value[2:].decode(), ROLES[role], bool(is_active), version
+        )
+
+    def set(self, principal: Principal) -> None:
+        value = (
+            bytes((ROLES.index(principal.role), principal.is_active))
+            + principal.email.encode()
+        )
+        self.table.set(principal.id, principal.version, value)
+
+    def invalidate(self, user_id: int, version: int | None = None) -> None:
+        self.table.invalidate(user_id, version)
+
+
+@lru_cache(maxsize=None)
+def get_principal_cache() -> PrincipalCache | None:
+    """Map the node's principal cache on first use, None when it is disabled."""
+    if not settings.PRINCIPAL_CACHE_ENABLED:
+        return None
+    from app.core.shared_cache import SharedMemoryCache
+
+    try:
+        table = SharedMemoryCache(
+            "principals",
+            settings.PRINCIPAL_CACHE_PATH,
+            settings.PRINCIPAL_CACHE_SLOTS,
+            PRINCIPAL_VALUE_SIZE,
+            settings.PRINCIPAL_CACHE_TTL,
+        )
+    except OSError:
+        logger.exception("Principal cache unavailable, reading users from the DB")
+        return None
+    return PrincipalCache(table)
+
+
+async def publish_user_change(user_id: int, version: int | None = None) -> None:
+    """Drop a user's cached principal on every node, after the change is committed.
+
+    `version` is the user's new version, None when they are being deleted.
+    """
+    cache = get_principal_cache()
+    if cache is not None:
+        cache.invalidate(user_id, version)
+    await invalidation_bus.publish("user", user_id, version)
+
+
+def _on_user_change(user_id: int, version: int | None) -> None:
+    cache = get_principal_cache()
+    if cache is not None:
+        cache.invalidate(user_id, version)
+
+
+invalidation_bus.register("user", _on_user_change)
@@ -1,5 +1,16 @@
+from typing import Optional
+
+from sqlalchemy import delete, exists, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from app.projects.models import Project, ProjectMember
+from app.projects.repository import bump_tickets_version
+from app.tickets.models import (
+    ArchivedTicket,
+    ArchivedTicketExecutor,
+    Ticket,
+    TicketExecutor,
+)
 from app.users.models import User
 from app.core.base_repository import BaseRepository
 
@@ -8,16 +19,190 @@ class UserRepository(BaseRepository[User]):
     def __init__(self, db_session: AsyncSession):
         super().__init__(User, db_session)
 
+    async def get_by_id(self, id: int) -> Optional[User]:
+        """Fetch a user, unless they are being deleted."""
+        query = select(User).where(User.id == id, User.deleting_at.is_(None))
+        result = await self.db_session.execute(query)
+        return result.scalars().first()
+
     async def get_user_by_email(self, email: str) -> User | None:
         """Fetch a user by their email."""
-        query = select(User).where(User.email == email)
+        query = select(User).where(User.email == email, User.deleting_at.is_(None))
         result = await self.db_session.execute(query)
         return result.scalars().first()
 
     async def get_user_by_role(self, role: str) -> list[User]:
         """Fetch users by their role (e.g., admin, manager)."""
-        query = select(User).where(User.role == role)
+        query = select(User).where(User.role == role, User.deleting_at.is_(None))
         result = await self.db_session.execute(query)
         return result.scalars().all()
 
-    # You can add more user-specific methods here as needed
+    async def get_existing_ids(self, user_ids: list[int]) -> set[int]:
+        """Return which of the given user IDs exist, in one IN query."""
+        query = select(User.id).where(User.id.in_(user_ids), User.deleting_at.is_(None))
+        result = await self.db_session.execute(query)
+        return set(result.scalars().all())
+
+    async def set_password_hash(self, user_id: int, hashed_password: str) -> None:
+        """Store an upgraded hash of the same password; updated_at is left alone."""
+        await self.db_session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(hashed_password=hashed_password, updated_at=User.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db_session.commit()
+
+    async def get_updated_since(self, since) -> list[tuple]:
+        """(id, role, is_active, deleting_at) of the users updated after `since`."""
+        query = select(User.id, User.role, User.is_active, User.deleting_at).where(
+            User.updated_at > since
+        )
+        result = await self.db_session.execute(query)
+        return [tuple(row) for row in result.all()]
+
+    # Background deletion
+
+    async def mark_deleting(self, user_id: int, successor_id: int) -> None:
+        """Hide a user from every read ahead of their background deletion."""
+        await self.db_session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(deleting_at=func.now(), successor_id=successor_id)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db_session.commit()
+
+    async def get_deleting(self) -> list[tuple[int, int]]:
+        """(user_id, successor_id) of users whose deletion has not finished."""
+        result = await self.db_session.execute(
+            select(User.id, User.successor_id).where(User.deleting_at.isnot(None))
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def is_pending_successor(self, user_id: int) -> bool:
+        """Whether a running deletion still hands its data over to this user."""
+        query = select(
+            exists().where(User.successor_id == user_id, User.deleting_at.isnot(None))
+        )
+        result = await self.db_session.execute(query)
+        return result.scalar_one()
+
+    async def count_references(self, user_id: int) -> dict[str, int]:
+        """How many rows the deletion of a user has to reassign or purge, in one query."""
+
+        def count(column):
+            return select(func.count()).where(column == user_id).scalar_subquery()
+
+        result = await self.db_session.execute(
+            select(
+                (
+                    count(Ticket.responsible_user_id)
+                    + count(ArchivedTicket.responsible_user_id)
+                ).label("tickets_total"),
+                count(Project.owner_id).label("projects_total"),
+                (
+                    count(TicketExecutor.user_id)
+                    + count(ArchivedTicketExecutor.user_id)
+                ).label("executors_total"),
+                count(ProjectMember.user_id).label("memberships_total"),
+            )
+        )
+        return dict(result.one()._mapping)
+
+    async def has_references(self, user_id: int, column) -> bool:
+        """Whether rows still reference a user through `column`, locked ones included."""
+        result = await self.db_session.execute(
+            select(exists().where(column == user_id))
+        )
+        return result.scalar_one()
+
+    async def reassign_ticket_batch(
+        self, user_id: int, successor_id: int, limit: int, model=Ticket
+    ) -> int:
+        """Hand up to `limit` tickets a user is responsible for to their successor.
+
+        `model` is Ticket or ArchivedTicket. The projects' ticket list
+        snapshots are invalidated in the same transaction.
+        """
+        ticket_ids = (
+            select(model.id)
+            .where(model.responsible_user_id == user_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db_session.execute(
+            update(model)
+            .where(model.id.in_(ticket_ids))
+            .values(responsible_user_id=successor_id)
+            .returning(model.project_id)
+            .execution_options(synchronize_session=False)
+        )
+        project_ids = result.scalars().all()
+        if project_ids:
+            await self.db_session.execute(bump_tickets_version(*set(project_ids)))
+        await self.db_session.commit()
+        return len(project_ids)
+
+    async def reassign_project_batch(
+        self, user_id: int, successor_id: int, limit: int
+    ) -> list[int]:
+        """Hand up to `limit` projects a user owns to their successor; return their IDs."""
+        project_ids = (
+            select(Project.id)
+            .where(Project.owner_id == user_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db_session.execute(
+            update(Project)
+            .where(Project.id.in_(project_ids))
+            .values(owner_id=successor_id)
+            .returning(Project.id)
+            .execution_options(synchronize_session=False)
+        )
+        reassigned = list(result.scalars().all())
+        await self.db_session.commit()
+        return reassigned
+
+    async def delete_executor_batch(
+        self, user_id: int, limit: int, model=TicketExecutor
+    ) -> int:
+        """Unassign a user from up to `limit` tickets.
+
+        `model` is TicketExecutor or ArchivedTicketExecutor.
+        """
+        executor_ids = (
+            select(model.id)
+            .where(model.user_id == user_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db_session.execute(
+            delete(model)
+            .where(model.id.in_(executor_ids))
+            .execution_options(synchronize_session=False)
+        )
+        await self.db_session.commit()
+        return result.rowcount
+
+    async def delete_membership_batch(self, user_id: int, limit: int) -> list[int]:
+        """Remove a user from up to `limit` projects; return the project IDs."""
+        project_ids = (
+            select(ProjectMember.project_id)
+            .where(ProjectMember.user_id == user_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db_session.execute(
+            delete(ProjectMember)
+            .where(
+                ProjectMember.user_id == user_id,
+                ProjectMember.project_id.in_(project_ids),
+            )
+            .returning(ProjectMember.project_id)
+            .execution_options(synchronize_session=False)
+        )
+        removed = list(result.scalars().all())
+        await self.db_session.commit()
+        return removed
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from app.core.cache import TTLCache
+from app.core.database import AsyncSessionLocal
+from app.core.invalidation import invalidation_bus
+from app.core.settings import settings
+from app.users.repository import UserRepository
+
+logger = logging.getLogger(__name__)
+
+# Recorded for users who were deleted or deactivated
+REVOKED = ""
+
+# The current role of users whose role or access changed while tokens issued
+# before the change may still be valid; older entries cannot matter anymore
+role_changes = TTLCache(
+    "role_changes",
+    settings.ROLE_CHANGES_MAX_ENTRIES,
+    settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+
+def record_role_change(user_id: int, role: str | None) -> None:
+    """Remember a user's new role, None when they lost access altogether."""
+    role_changes.set(user_id, REVOKED if role is None else role)
+
+
+def claimed_role(claims: dict) -> str | None:
+    """The role of a verified token, None when it was revoked by a later change."""
+    role = claims.get("role")
+    current = role_changes.get(int(claims["id"]))
+    if current is not None and current != role:
+        return None
+    return role
+
+
+async def publish_role_change(user_id: int, role: str | None) -> None:
+    """Record a role change on this worker and the others, after it is committed."""
+    role = getattr(role, "value", role)
+    record_role_change(user_id, role)
+    await invalidation_bus.publish("user_role", [user_id, role])
+
+
+async def load_role_changes(
+    lookback: timedelta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+) -> None:
+    """Record the current role of every user updated within `lookback`.
+
+    Run on worker start-up with the token lifetime: a worker started after a
+    demotion never saw its message.
+    """
+    since = datetime.now(timezone.utc) - lookback
+    async with AsyncSessionLocal() as session:
+        users = await UserRepository(session).get_updated_since(since)
+    for user_id, role, is_active, deleting_at in users:
+        has_access = is_active is not False and deleting_at is None
+        record_role_change(user_id, role.value if has_access else None)
+
+
+async def poll_role_changes() -> None:
+    """Re-read the recently updated users every ROLE_CHANGES_POLL_INTERVAL seconds.
+
+    The invalidation bus is optional and loses messages while reconnecting,
+    so polling is what bounds how long another worker's demotion goes
+    unnoticed here. Each read looks a minute further back than the previous
+    one, for transactions that committed after it. Runs until cancelled.
+    """
+    interval = settings.ROLE_CHANGES_POLL_INTERVAL
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await load_role_changes(timedelta(seconds=interval + 60))
+        except Exception as exc:
+            logger.warning("Could not read role changes: %s", exc)
+
+
+invalidation_bus.register(
+    "user_role", lambda key, _: record_role_change(key[0], key[1])
+)
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.security import OAuth2PasswordRequestForm
+from app.users.models import User
 from app.users.schemas import UserCreate, UserOut, UserUpdate
 from app.users.services import UserService
 from app.users.dependencies import get_current_user, roles_required
 from app.users.utils import create_access_token
 from app.core.database import get_db
+from app.core.responses import model_response
 
 # Create the router instance
 user_router = APIRouter()
@@ -61,6 +64,7 @@ class UserRouter:
             self.delete_user,
             methods=["DELETE"],
             dependencies=[Depends(roles_required("admin"))],
+            status_code=status.HTTP_202_ACCEPTED,
             tags=["Users"],
         )
 
@@ -110,20 +114,35 @@ class UserRouter:
     async def get_users(self, db: AsyncSession = Depends(get_db)):
         """Admin or Manager: Get a list of all users."""
         service = UserService(db)
-        return await service.get_users_by_role(
+        users = await service.get_users_by_role(
             "admin"
         ) + await service.get_users_by_role("manager")
+        return model_response(UserOut, users)
 
     async def get_user_by_id(self, user_id: int, db: AsyncSession = Depends(get_db)):
         """Admin or Manager: Get a user by their ID."""
         service = UserService(db)
         return await service.get_user_by_id(user_id)
 
-    async def delete_user(self, user_id: int, db: AsyncSession = Depends(get_db)):
-        """Admin-only: Delete a user by ID."""
+    async def delete_user(
+        self,
+        user_id: int,
+        reassign_to: int | None = None,
+        current_user: User = Depends(get_current_user),
+        db: AsyncSession = Depends(get_db),
+    ):
+        """Admin-only: Start deleting a user by ID; poll the returned job for progress.
+
+        Their tickets and projects go to `reassign_to`, by default the admin.
+        """
         service = UserService(db)
-        await service.delete_user(user_id)
-        return {"message": "User deleted successfully"}
+        successor_id = current_user.id if reassign_to is None else reassign_to
+        job = await service.delete_user(user_id, successor_id)
+        return ORJSONResponse(
+            {"message": "User deletion started", "job_id": job.id},
+            status_code=status.HTTP_202_ACCEPTED,
+            headers={"Location": f"/jobs/{job.id}"},
+        )
 
 
 UserRouter()
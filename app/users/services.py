@@ -1,8 +1,14 @@
+import asyncio
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.users.repository import UserRepository
-from app.users.utils import hash_password, verify_password
+from app.users.utils import hash_password, verify_and_update_password
 from app.users.schemas import UserCreate, UserOut, UserUpdate
 from app.users.models import User
+from app.users.principals import publish_user_change, user_version
+from app.users.role_claims import publish_role_change
+from app.core.jobs import Job
+from app.users.jobs import start_user_deletion
 from fastapi import HTTPException, status
 
 
@@ -20,8 +26,8 @@ class UserService:
                 detail="A user with this email already exists.",
             )
 
-        # Hash the user's password
-        hashed_password = hash_password(user_data.password)
+        # Hash the user's password, off the event loop
+        hashed_password = await asyncio.to_thread(hash_password, user_data.password)
         user_dict = user_data.model_dump()
         user_dict["hashed_password"] = hashed_password
         del user_dict["password"]  # Remove raw password after hashing
@@ -31,14 +37,29 @@ class UserService:
         return UserOut.model_validate(new_user)
 
     async def authenticate_user(self, email: str, password: str) -> User | None:
-        """Authenticate a user by verifying email and password."""
+        """Authenticate a user by verifying email and password.
+
+        Verifying, and rehashing an outdated hash, costs tens to hundreds of
+        milliseconds of CPU, so both run in a worker thread rather than
+        stalling every other request of the event loop.
+        """
         user = await self.repository.get_user_by_email(email)
-        if not user or not verify_password(password, user.hashed_password):
+        verified, new_hash = (
+            await asyncio.to_thread(
+                verify_and_update_password, password, user.hashed_password
+            )
+            if user
+            else (False, None)
+        )
+        if not verified:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password.",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        if new_hash:
+            # Hashed with a deprecated scheme or a lower cost than configured
+            await self.repository.set_password_hash(user.id, new_hash)
         return user
 
     async def get_user_by_id(self, user_id: int) -> UserOut:
@@ -50,10 +71,14 @@ class UserService:
             )
         return UserOut.model_validate(user)
 
-    async def get_users_by_role(self, role: str) -> list[UserOut]:
+    async def get_missing_ids(self, user_ids: list[int]) -> list[int]:
+        """Return the given user IDs that do not exist."""
+        existing = await self.repository.get_existing_ids(user_ids)
+        return [user_id for user_id in user_ids if user_id not in existing]
+
+    async def get_users_by_role(self, role: str) -> list[User]:
         """Fetch a list of users by their role."""
-        users = await self.repository.get_user_by_role(role)
-        return [UserOut.model_validate(user) for user in users]
+        return await self.repository.get_user_by_role(role)
 
     async def update_user(self, user_id: int, user_update_data: UserUpdate) -> UserOut:
         """Update an existing user's details."""
@@ -68,20 +93,50 @@ class UserService:
             exclude_unset=True
         )  # Only update fields that are provided
         if update_data.get("password"):
-            update_data["hashed_password"] = hash_password(update_data.pop("password"))
+            update_data["hashed_password"] = await asyncio.to_thread(
+                hash_password, update_data.pop("password")
+            )
 
+        role = update_data.get("role", user.role)
+        is_active = update_data.get("is_active", user.is_active)
+        access_changed = (role, is_active) != (user.role, user.is_active)
         updated_user = await self.repository.update(user_id, update_data)
+        # The identity map may still hold the old updated_at
+        version = await self.repository.get_version(user_id)
+        await publish_user_change(user_id, user_version(version.updated_at))
+        if access_changed:
+            await publish_role_change(user_id, role if is_active is not False else None)
         return UserOut.model_validate(updated_user)
 
-    async def delete_user(self, user_id: int) -> None:
-        """Delete a user by their ID."""
+    async def delete_user(self, user_id: int, successor_id: int) -> Job:
+        """Start deleting a user, handing their tickets and projects to a successor.
+
+        The user reads as gone right away; their rows are reassigned and
+        purged by a background job, returned for progress polling.
+        """
         user = await self.repository.get_by_id(user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User not found."
             )
 
-        await self.repository.delete(user_id)
-        return (
-            None  # Returning None for consistency, could also return an empty response
-        )
+        if successor_id == user_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="A user cannot inherit their own data.",
+            )
+        if not await self.repository.get_by_id(successor_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Successor user not found.",
+            )
+        if await self.repository.is_pending_successor(user_id):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="User is inheriting data from another deletion in progress.",
+            )
+
+        await self.repository.mark_deleting(user_id, successor_id)
+        await publish_user_change(user_id)
+        await publish_role_change(user_id, None)
+        return await start_user_deletion(user_id, successor_id)
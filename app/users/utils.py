@@ -1,20 +1,51 @@
+import hashlib
+import time
 from datetime import timedelta, datetime
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import HTTPException, status
-from jose import jwt, JWTError
-from passlib.context import CryptContext
+from jose.exceptions import JWTError
 
+from app.core.cache import TTLCache
 from app.core.settings import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = settings.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
+# Claims of verified tokens by token digest, each kept until the token expires
+verified_tokens = TTLCache(
+    "verified_tokens", settings.TOKEN_CACHE_SIZE, ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+
+
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    """Build the password hashing context on first use, loading its backend.
+
+    New passwords are hashed with the first of PASSWORD_SCHEMES at the
+    configured cost. Hashes of the other schemes, or with a lower cost,
+    still verify and are replaced on the next login.
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(
+        schemes=[scheme.strip() for scheme in settings.PASSWORD_SCHEMES.split(",")],
+        deprecated="auto",
+        bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+        bcrypt__min_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+        argon2__type="ID",
+        argon2__rounds=settings.PASSWORD_ARGON2_TIME_COST,
+        argon2__min_rounds=settings.PASSWORD_ARGON2_TIME_COST,
+        argon2__memory_cost=settings.PASSWORD_ARGON2_MEMORY_COST,
+        argon2__parallelism=settings.PASSWORD_ARGON2_PARALLELISM,
+    )
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    from jose import jwt
+
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -32,7 +63,7 @@ def verify_access_token(token: str):
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_access_token(token)
         email: str = payload.get("sub")
         role: str = payload.get("role")
         if email is None or role is None:
@@ -42,11 +73,42 @@ def verify_access_token(token: str):
         raise credentials_exception
 
 
+def decode_access_token(token: str) -> dict:
+    """Verify a JWT and return its claims, raising JWTError when it is invalid.
+
+    Clients send the same token with every request until it expires, so the
+    claims of valid tokens are kept in `verified_tokens` until their `exp`;
+    the returned dict is shared and must not be changed.
+    """
+    if not settings.TOKEN_CACHE_SIZE:
+        return _verify_access_token(token)
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    claims = verified_tokens.get(key)
+    if claims is None:
+        claims = _verify_access_token(token)
+        if "exp" in claims:
+            verified_tokens.set(key, claims, ttl=claims["exp"] - time.time())
+    return claims
+
+
+def _verify_access_token(token: str) -> dict:
+    from jose import jwt
+
+    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+
 def hash_password(password: str) -> str:
-    """Hashes the provided password using bcrypt."""
-    return pwd_context.hash(password)
+    """Hashes the provided password with the configured scheme."""
+    return get_pwd_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifies that the provided plain password matches the hashed password."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verify a password; also return a new hash when the stored one is outdated."""
+    return get_pwd_context().verify_and_update(plain_password, hashed_password)
@@ -0,0 +1,106 @@
+"""Per-request cost of verifying the bearer token, with and without the token cache.
+
+Times what every authenticated request pays before touching the database:
+the claims check of the auth dependencies (`decode_access_token` plus the
+`id` check) with the verified-token cache, and the same with every request
+verifying the signature. It then compares JWT decoders on the same HS256
+token: python-jose (what the app uses), python-jwt (`jwt`, already in
+requirements.txt) and a bare hmac/json decoder, which is only a lower bound
+on the cost, not a candidate:
+
+    python -m benchmarks.bench_auth [--requests 100000]
+"""
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import time
+
+from app.core.settings import settings
+from app.users import dependencies, utils
+
+
+def per_call_us(call, token: str, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        call(token)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+def jose_decoder():
+    from jose import jwt
+
+    return lambda token: jwt.decode(
+        token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+    )
+
+
+def python_jwt_decoder():
+    from jwt import JWT
+    from jwt.jwk import OctetJWK
+
+    instance, key = JWT(), OctetJWK(settings.SECRET_KEY.encode())
+    return lambda token: instance.decode(token, key, algorithms={settings.ALGORITHM})
+
+
+def hmac_decoder():
+    key = settings.SECRET_KEY.encode()
+
+    def b64decode(part: str) -> bytes:
+        return base64.urlsafe_b64decode(part + "=" * (-len(part) % 4))
+
+    def decode(token: str) -> dict:
+        signing_input, _, signature = token.rpartition(".")
+        expected = hmac.new(key, signing_input.encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, b64decode(signature)):
+            raise ValueError("bad signature")
+        claims = json.loads(b64decode(signing_input.partition(".")[2]))
+        if claims["exp"] <= time.time():
+            raise ValueError("expired")
+        return claims
+
+    return decode
+
+
+def main(args) -> None:
+    token = utils.create_access_token(
+        {"sub": "bench@example.com", "id": 1, "role": "user"}
+    )
+    claims = dependencies._token_claims
+
+    cached = per_call_us(claims, token, args.requests)
+    size, settings.TOKEN_CACHE_SIZE = settings.TOKEN_CACHE_SIZE, 0
+    try:
+        uncached = per_call_us(claims, token, args.requests)
+    finally:
+        settings.TOKEN_CACHE_SIZE = size
+
+    print(f"Auth claims check, {args.requests} requests with one token")
+    print(f"  {'verify every request':<22} {uncached:8.2f} us/request")
+    print(
+        f"  {'verified-token cache':<22} {cached:8.2f} us/request "
+        f"({uncached / cached:.0f}x)"
+    )
+
+    print("\nHS256 decoders, signature and exp checked")
+    for name, factory in (
+        ("python-jose", jose_decoder),
+        ("python-jwt", python_jwt_decoder),
+        ("hmac + json", hmac_decoder),
+    ):
+        try:
+            decode = factory()
+        except ImportError:
+            print(f"  {name:<22} not installed")
+            continue
+        print(
+            f"  {name:<22} {per_call_us(decode, token, args.requests):8.2f} us/decode"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100_000)
+    main(parser.parse_args())
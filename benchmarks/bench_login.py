@@ -0,0 +1,145 @@
+"""Login throughput and event-loop stalls for candidate password-hashing parameters.
+
+A login's CPU is almost all password verification, so this drives
+`UserService.authenticate_user` (with the user lookup stubbed out) from
+--concurrency logins at once on one event loop, as a uvicorn worker would
+serve them, for several bcrypt and argon2id costs. It reports milliseconds
+per login, logins per second, and the longest stall of a ticker coroutine
+sharing the loop, which is what every other request on the worker waits for
+while logins run. Half the stored hashes are made with a lower cost, so
+those logins also pay for the rehash. Pick the highest cost whose peak-hour
+logins per second still fit the cores you have; argon2 also needs
+memory_cost KiB per concurrent login:
+
+    python -m benchmarks.bench_login [--seconds 2] [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from passlib.context import CryptContext
+
+from app.core.settings import settings
+from app.users.services import UserService
+from app.users.utils import get_pwd_context
+
+CANDIDATES = [
+    *(
+        (
+            f"bcrypt rounds={rounds}",
+            {"PASSWORD_SCHEMES": "bcrypt", "PASSWORD_BCRYPT_ROUNDS": rounds},
+        )
+        for rounds in (10, 11, 12, 13)
+    ),
+    *(
+        (
+            f"argon2id t={time_cost} m={memory_cost // 1024}MiB p={parallelism}",
+            {
+                "PASSWORD_SCHEMES": "argon2",
+                "PASSWORD_ARGON2_TIME_COST": time_cost,
+                "PASSWORD_ARGON2_MEMORY_COST": memory_cost,
+                "PASSWORD_ARGON2_PARALLELISM": parallelism,
+            },
+        )
+        for time_cost, memory_cost, parallelism in (
+            (2, 19456, 1),
+            (3, 65536, 1),
+            (3, 65536, 4),
+            (4, 131072, 4),
+        )
+    ),
+]
+
+PASSWORD = "correct horse battery staple"
+TICK = 0.005
+
+
+class StoredUsers:
+    """Stands in for UserRepository: hands out one user per stored hash."""
+
+    def __init__(self, hashes: list[str]):
+        self.hashes = hashes
+        self.lookups = 0
+
+    async def get_user_by_email(self, email: str):
+        self.lookups += 1
+        return SimpleNamespace(
+            id=1, hashed_password=self.hashes[self.lookups % len(self.hashes)]
+        )
+
+    async def set_password_hash(self, user_id: int, new_hash: str) -> None:
+        pass
+
+
+def stored_hashes(overrides: dict) -> list[str]:
+    """A current hash and one made with a lower cost, which gets upgraded."""
+    current = get_pwd_context().hash(PASSWORD)
+    if overrides["PASSWORD_SCHEMES"] == "bcrypt":
+        outdated = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+    else:
+        outdated = CryptContext(
+            schemes=["argon2"], argon2__rounds=1, argon2__memory_cost=1024
+        )
+    return [current, outdated.hash(PASSWORD)]
+
+
+async def run_logins(overrides: dict, seconds: float, concurrency: int):
+    """Log in from `concurrency` clients until the time is up.
+
+    Returns (logins, elapsed, longest loop stall in ms).
+    """
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    get_pwd_context.cache_clear()
+    service = UserService(None)
+    service.repository = StoredUsers(stored_hashes(overrides))
+
+    done = 0
+    deadline = time.perf_counter() + seconds
+
+    async def client() -> None:
+        nonlocal done
+        while time.perf_counter() < deadline:
+            await service.authenticate_user("bench@example.com", PASSWORD)
+            done += 1
+
+    stall = 0.0
+
+    async def ticker() -> None:
+        nonlocal stall
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            await asyncio.sleep(TICK)
+            stall = max(stall, time.perf_counter() - started - TICK)
+
+    started = time.perf_counter()
+    await asyncio.gather(ticker(), *(client() for _ in range(concurrency)))
+    return done, time.perf_counter() - started, stall * 1000
+
+
+async def main(args) -> None:
+    print(
+        f"{'parameters':<32} {'ms/login':>9} {'logins/s':>9} {'max stall ms':>13}"
+    )
+    for name, overrides in CANDIDATES:
+        try:
+            done, elapsed, stall = await run_logins(
+                overrides, args.seconds, args.concurrency
+            )
+        except Exception as exc:  # a missing backend (bcrypt, argon2-cffi)
+            print(f"{name:<32} unavailable: {exc}")
+            continue
+        print(
+            f"{name:<32} {elapsed / done * 1000:9.1f} {done / elapsed:9.1f} "
+            f"{stall:13.1f}"
+        )
+    get_pwd_context.cache_clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,205 @@
+"""Per-project ticket reads on a plain vs a hash-partitioned tickets table.
+
+Builds both layouts side by side in the schemas `bench_plain` and
+`bench_partitioned` of the configured Postgres database, fills them with the
+same synthetic tickets spread over many projects, then times the real
+repository queries against each: `TicketRepository.get_by_project` (ORM
+entities), `TicketReadRepository.list_by_project` (projected rows) and a
+single-ticket `get_ticket` by id, which cannot be pruned and shows the cost
+of probing every partition. Both layouts get the same empty archive table,
+which the read repository consults too. Seeding 50M rows takes a while and about 10 GB;
+--keep and --reuse let several runs share one dataset:
+
+    python -m benchmarks.bench_partitioning [--rows 50000000] [--projects 20000]
+        [--samples 200] [--keep] [--reuse]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core import models  # noqa: F401  registers every table
+from app.core.settings import settings
+from app.tickets.models import TICKET_PARTITIONS
+from app.tickets.repository import TicketReadRepository, TicketRepository
+
+SCHEMAS = {"plain": "bench_plain", "partitioned": "bench_partitioned"}
+CHUNK = 1_000_000
+
+COLUMNS = """
+    id integer NOT NULL,
+    title varchar(255) NOT NULL,
+    description text,
+    responsible_user_id integer NOT NULL,
+    status ticketstatus NOT NULL,
+    priority integer NOT NULL,
+    project_id integer NOT NULL,
+    created_at timestamptz NOT NULL DEFAULT now(),
+    updated_at timestamptz NOT NULL DEFAULT now()
+"""
+
+# Tickets and project joins need a projects table for get_ticket
+PROJECTS = """
+    CREATE TABLE projects (id integer PRIMARY KEY, deleting_at timestamptz)
+"""
+
+# The reads fall back to (or union in) the archive, kept empty so both
+# layouts time the hot table alone
+ARCHIVE = [
+    f"""
+    CREATE TABLE tickets_archive ({COLUMNS},
+        archived_at timestamptz NOT NULL DEFAULT now(), PRIMARY KEY (id))
+    """,
+    "CREATE INDEX ix_tickets_archive_project_id ON tickets_archive (project_id)",
+]
+
+
+def layout_ddl(layout: str) -> list[str]:
+    if layout == "plain":
+        tables = [f"CREATE TABLE tickets ({COLUMNS}, PRIMARY KEY (id))"]
+    else:
+        tables = [
+            f"CREATE TABLE tickets ({COLUMNS}, PRIMARY KEY (id, project_id)) "
+            "PARTITION BY HASH (project_id)"
+        ] + [
+            f"CREATE TABLE tickets_p{remainder} PARTITION OF tickets "
+            f"FOR VALUES WITH (MODULUS {TICKET_PARTITIONS}, REMAINDER {remainder})"
+            for remainder in range(TICKET_PARTITIONS)
+        ]
+    return [
+        "CREATE TYPE ticketstatus AS ENUM ('TODO', 'IN_PROGRESS', 'DONE')",
+        PROJECTS,
+        *tables,
+        *ARCHIVE,
+    ]
+
+
+async def seed(engine, layout: str, rows: int, projects: int) -> None:
+    schema = SCHEMAS[layout]
+    async with engine.begin() as connection:
+        await connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        await connection.execute(text(f"CREATE SCHEMA {schema}"))
+        await connection.execute(text(f"SET search_path TO {schema}"))
+        for statement in layout_ddl(layout):
+            await connection.execute(text(statement))
+        await connection.execute(
+            text("INSERT INTO projects (id) SELECT generate_series(1, :projects)"),
+            {"projects": projects},
+        )
+
+    # One transaction per chunk keeps WAL and memory bounded
+    for start in range(1, rows + 1, CHUNK):
+        stop = min(start + CHUNK - 1, rows)
+        async with engine.begin() as connection:
+            await connection.execute(text(f"SET search_path TO {schema}"))
+            await connection.execute(
+                text(
+                    """
+                    INSERT INTO tickets (id, title, description,
+                        responsible_user_id, status, priority, project_id)
+                    SELECT i, 'Ticket ' || i, 'Synthetic ticket',
+                        1 + i % 1000,
+                        (ARRAY['TODO', 'IN_PROGRESS', 'DONE'])[1 + i % 3]::ticketstatus,
+                        1 + i % 5,
+                        1 + (hashint4(i) & 2147483647) % :projects
+                    FROM generate_series(:start, :stop) AS i
+                    """
+                ),
+                {"start": start, "stop": stop, "projects": projects},
+            )
+        print(f"  {layout}: {stop:,} / {rows:,} rows", flush=True)
+
+    async with engine.begin() as connection:
+        await connection.execute(text(f"SET search_path TO {schema}"))
+        await connection.execute(
+            text(
+                "CREATE INDEX ix_tickets_project_id_status ON tickets (project_id, status)"
+            )
+        )
+    # VACUUM cannot run in a transaction block
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.execute(text(f"VACUUM ANALYZE {schema}.tickets"))
+
+
+async def time_queries(engine, samples: int, projects: int, rows: int) -> dict:
+    rng = random.Random(42)
+    project_ids = [rng.randint(1, projects) for _ in range(samples)]
+    ticket_ids = [rng.randint(1, rows) for _ in range(samples)]
+    timings = {"get_by_project": [], "list_by_project": [], "get_ticket": []}
+
+    async with AsyncSession(engine) as session:
+        tickets = TicketRepository(session)
+        reads = TicketReadRepository(session)
+        # Warm the plan cache and the buffer pool for the index roots
+        await reads.list_by_project(project_ids[0])
+
+        for project_id, ticket_id in zip(project_ids, ticket_ids):
+            for name, call in (
+                ("get_by_project", lambda: tickets.get_by_project(project_id)),
+                ("list_by_project", lambda: reads.list_by_project(project_id)),
+                ("get_ticket", lambda: reads.get_ticket(ticket_id)),
+            ):
+                started = time.perf_counter()
+                await call()
+                timings[name].append((time.perf_counter() - started) * 1000)
+            session.expunge_all()
+    return timings
+
+
+def engine_for(layout: str):
+    return create_async_engine(
+        settings.DATABASE_URL,
+        connect_args={"server_settings": {"search_path": SCHEMAS[layout]}},
+    )
+
+
+async def main(args) -> None:
+    results = {}
+    for layout in SCHEMAS:
+        engine = engine_for(layout)
+        try:
+            if not args.reuse:
+                print(f"Seeding {args.rows:,} {layout} tickets")
+                await seed(engine, layout, args.rows, args.projects)
+            results[layout] = await time_queries(
+                engine, args.samples, args.projects, args.rows
+            )
+            if not args.keep:
+                async with engine.begin() as connection:
+                    await connection.execute(
+                        text(f"DROP SCHEMA {SCHEMAS[layout]} CASCADE")
+                    )
+        finally:
+            await engine.dispose()
+
+    print(
+        f"\n{args.rows:,} tickets over {args.projects:,} projects, "
+        f"{TICKET_PARTITIONS} partitions, {args.samples} samples (ms)"
+    )
+    print(f"  {'query':<16} {'layout':<12} {'p50':>8} {'p95':>8} {'mean':>8}")
+    for name in results["plain"]:
+        for layout, timings in results.items():
+            values = sorted(timings[name])
+            p95 = values[int(len(values) * 0.95) - 1]
+            print(
+                f"  {name:<16} {layout:<12} {statistics.median(values):8.2f} "
+                f"{p95:8.2f} {statistics.fmean(values):8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000_000)
+    parser.add_argument("--projects", type=int, default=20_000)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--keep", action="store_true", help="keep the bench schemas")
+    parser.add_argument(
+        "--reuse", action="store_true", help="skip seeding, use kept schemas"
+    )
+    asyncio.run(main(parser.parse_args()))
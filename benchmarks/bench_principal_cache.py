@@ -0,0 +1,166 @@
+"""Current-user lookups: a DB read per request vs the shared-memory principal cache.
+
+The baseline is what get_current_user costs per request: a pooled session
+loading the user by primary key, timed against users seeded into the
+`bench_principals` schema of the configured Postgres database. The cache
+side fills a SharedMemoryCache with the same users, then reads it from 1..N
+processes at once, as the uvicorn workers of a node would: reads take no
+lock, so the aggregate rate grows with the processes up to the number of
+CPU cores. --skip-db runs the cache side only:
+
+    python -m benchmarks.bench_principal_cache [--users 10000] [--lookups 200000]
+        [--db-lookups 2000] [--max-processes 4] [--skip-db]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.base import Base
+from app.core import models  # noqa: F401  registers every table
+from app.core.settings import settings
+from app.core.shared_cache import SharedMemoryCache
+from app.users.models import User, UserRole
+from app.users.principals import PRINCIPAL_VALUE_SIZE, Principal, PrincipalCache
+from app.users.repository import UserRepository
+
+SCHEMA = "bench_principals"
+
+
+async def db_lookups(users: int, lookups: int) -> list[float]:
+    """Per-lookup latencies (us) of loading a user in a fresh session."""
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        connect_args={"server_settings": {"search_path": SCHEMA}},
+    )
+    try:
+        async with engine.begin() as connection:
+            await connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            await connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            await connection.run_sync(Base.metadata.create_all, tables=[User.__table__])
+            await connection.execute(
+                insert(User),
+                [
+                    {
+                        "email": f"user{i}@example.com",
+                        "hashed_password": "x",
+                        "name": "Bench",
+                        "surname": "User",
+                        "role": UserRole.USER,
+                    }
+                    for i in range(users)
+                ],
+            )
+
+        rng = random.Random(42)
+        timings = []
+        for _ in range(lookups):
+            user_id = rng.randint(1, users)
+            started = time.perf_counter()
+            async with AsyncSession(engine) as session:
+                await UserRepository(session).get_by_id(user_id)
+            timings.append((time.perf_counter() - started) * 1e6)
+
+        async with engine.begin() as connection:
+            await connection.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+        return timings
+    finally:
+        await engine.dispose()
+
+
+def open_cache(path: str) -> PrincipalCache:
+    return PrincipalCache(
+        SharedMemoryCache(
+            f"bench-{os.getpid()}", path, 65536, PRINCIPAL_VALUE_SIZE, ttl=3600
+        )
+    )
+
+
+def reader(path: str, users: int, lookups: int, start, results) -> None:
+    cache = open_cache(path)
+    rng = random.Random(os.getpid())
+    user_ids = [rng.randint(1, users) for _ in range(lookups)]
+    start.wait()
+    started = time.perf_counter()
+    for user_id in user_ids:
+        cache.get(user_id)
+    results.put((time.perf_counter() - started, cache.table.stats.hits))
+
+
+def cache_lookups(path: str, users: int, lookups: int, processes: int):
+    """Aggregate lookups per second and hit ratio of `processes` concurrent readers."""
+    start = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(
+            target=reader, args=(path, users, lookups, start, results)
+        )
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    start.set()
+    outcomes = [results.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    slowest = max(elapsed for elapsed, _ in outcomes)
+    hits = sum(hit for _, hit in outcomes)
+    return processes * lookups / slowest, hits / (processes * lookups)
+
+
+def main(args) -> None:
+    if not args.skip_db:
+        timings = asyncio.run(db_lookups(args.users, args.db_lookups))
+        values = sorted(timings)
+        print(f"DB per request, {args.db_lookups} lookups over {args.users} users")
+        print(
+            f"  p50 {statistics.median(values):8.1f} us   "
+            f"p95 {values[int(len(values) * 0.95) - 1]:8.1f} us   "
+            f"{1e6 / statistics.fmean(values):10,.0f} lookups/s"
+        )
+
+    with tempfile.TemporaryDirectory(
+        dir="/dev/shm" if os.path.isdir("/dev/shm") else None
+    ) as directory:
+        path = os.path.join(directory, "principals")
+        cache = open_cache(path)
+        version = int(datetime.now(timezone.utc).timestamp() * 1_000_000)
+        for user_id in range(1, args.users + 1):
+            cache.set(
+                Principal(
+                    user_id, f"user{user_id}@example.com", UserRole.USER, True, version
+                )
+            )
+
+        started = time.perf_counter()
+        for user_id in range(1, args.lookups + 1):
+            cache.get(user_id % args.users + 1)
+        single = (time.perf_counter() - started) / args.lookups * 1e6
+
+        print(
+            f"\nShared-memory cache, {args.users} users, {args.lookups} lookups per process"
+        )
+        print(f"  one lookup: {single:.2f} us (decoding included)")
+        print(f"  {'processes':>9} {'lookups/s':>14} {'hit ratio':>10}")
+        for processes in range(1, args.max_processes + 1):
+            rate, hit_ratio = cache_lookups(path, args.users, args.lookups, processes)
+            print(f"  {processes:>9} {rate:14,.0f} {hit_ratio:10.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=200_000)
+    parser.add_argument("--db-lookups", type=int, default=2_000)
+    parser.add_argument("--max-processes", type=int, default=4)
+    parser.add_argument("--skip-db", action="store_true", help="cache side only")
+    main(parser.parse_args())
@@ -0,0 +1,77 @@
+"""Per-request overhead of RateLimitMiddleware with the in-memory bucket store.
+
+Drives a no-op ASGI app directly, with and without the middleware in front,
+for an authenticated client whose token is already verified (the steady
+state) and for anonymous clients. Exits non-zero when the authenticated
+overhead exceeds the budget:
+
+    python -m benchmarks.bench_rate_limit [--budget-us 5] [--requests 100000]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from app.core.rate_limit import InMemoryBucketStore, RateLimitMiddleware
+from app.users.utils import create_access_token
+
+
+async def noop_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+
+
+async def noop_send(message):
+    pass
+
+
+async def per_request_us(app, scope, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(scope, None, noop_send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def run(requests: int) -> dict[str, float]:
+    token = create_access_token({"sub": "bench@example.com", "id": 1, "role": "user"})
+    # Never exhausted, so every request takes the allowed path
+    store = InMemoryBucketStore(capacity=10**12, refill_rate=1)
+    limited = RateLimitMiddleware(noop_app, store=store)
+    headers = [
+        (b"host", b"localhost"),
+        (b"user-agent", b"bench"),
+        (b"authorization", f"Bearer {token}".encode()),
+    ]
+    authenticated = {
+        "type": "http",
+        "path": "/tickets/list/1",
+        "headers": headers,
+        "client": ("127.0.0.1", 5000),
+    }
+    anonymous = {**authenticated, "headers": headers[:2]}
+
+    bare = await per_request_us(noop_app, authenticated, requests)
+    return {
+        "bare app": bare,
+        "authenticated": await per_request_us(limited, authenticated, requests) - bare,
+        "anonymous": await per_request_us(limited, anonymous, requests) - bare,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-us", type=float, default=5.0)
+    parser.add_argument("--requests", type=int, default=100_000)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.requests))
+    print(f"{args.requests} requests, in-memory store")
+    print(f"  {'bare app':<14} {results['bare app']:6.2f} us/request")
+    for name in ("authenticated", "anonymous"):
+        print(f"  {name:<14} +{results[name]:5.2f} us/request overhead")
+    print(f"budget: {args.budget_us:.1f} us")
+    return 0 if results["authenticated"] <= args.budget_us else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
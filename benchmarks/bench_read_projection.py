@@ -0,0 +1,113 @@
+"""CPU and memory of reading 10k tickets as ORM entities vs column-projected DTOs.
+
+Both paths end in TicketOut models. The data lives in an in-memory SQLite
+database, so the numbers isolate the ORM-side cost (identity map,
+instrumentation) from network and server time.
+
+    python -m benchmarks.bench_read_projection
+"""
+
+import time
+import tracemalloc
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session
+
+from app.core import models  # noqa: F401  registers every table
+from app.core.base import Base
+from app.core.read_repository import row_type, select_for
+from app.projects.models import Project
+from app.tickets.models import Ticket
+from app.tickets.schemas import TicketOut
+from app.users.models import User
+
+ROWS = 10_000
+REPEAT = 5
+
+
+def seed(engine) -> None:
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.execute(
+            insert(User),
+            [
+                {
+                    "email": "u@example.com",
+                    "hashed_password": "x",
+                    "name": "U",
+                    "surname": "S",
+                }
+            ],
+        )
+        session.execute(insert(Project), [{"title": "Bench", "owner_id": 1}])
+        session.execute(
+            insert(Ticket),
+            [
+                {
+                    "id": i + 1,
+                    "title": f"Ticket {i}",
+                    "description": "Lorem ipsum dolor sit amet " * 4,
+                    "priority": i % 5 + 1,
+                    "project_id": 1,
+                    "responsible_user_id": 1,
+                }
+                for i in range(ROWS)
+            ],
+        )
+        session.commit()
+
+
+def read_entities(engine) -> list[TicketOut]:
+    with Session(engine) as session:
+        tickets = (
+            session.execute(select(Ticket).where(Ticket.project_id == 1))
+            .scalars()
+            .all()
+        )
+        return [TicketOut.model_validate(ticket) for ticket in tickets]
+
+
+def read_projected(engine) -> list[TicketOut]:
+    with Session(engine) as session:
+        make = row_type(TicketOut)._make
+        rows = [
+            make(row)
+            for row in session.execute(
+                select_for(Ticket, TicketOut).where(Ticket.project_id == 1)
+            )
+        ]
+        return [TicketOut.model_validate(row, from_attributes=True) for row in rows]
+
+
+def measure(fn, engine) -> tuple[float, float]:
+    best = min(_timed(fn, engine) for _ in range(REPEAT))
+    tracemalloc.start()
+    fn(engine)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / 1024 / 1024
+
+
+def _timed(fn, engine) -> float:
+    start = time.perf_counter()
+    fn(engine)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    seed(engine)
+    assert read_entities(engine) == read_projected(engine)
+
+    print(f"Reading {ROWS} tickets, best of {REPEAT} runs")
+    for name, fn in (
+        ("ORM entities", read_entities),
+        ("projected DTOs", read_projected),
+    ):
+        seconds, peak = measure(fn, engine)
+        print(f"  {name:<16} {seconds * 1000:8.1f} ms  peak {peak:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Serialisation cost of 1k tickets: FastAPI response_model path vs model_response.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_serialization
+"""
+
+import asyncio
+import json
+import timeit
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import orjson
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.core.responses import model_response
+from app.tickets.schemas import TicketOut
+
+ROWS = 1000
+REPEAT = 20
+
+
+def make_rows(count: int) -> list[SimpleNamespace]:
+    """Attribute objects standing in for loaded Ticket rows."""
+    now = datetime.now(timezone.utc)
+    return [
+        SimpleNamespace(
+            id=i,
+            title=f"Ticket {i}",
+            description="Lorem ipsum dolor sit amet " * 4,
+            status="in_progress",
+            priority=i % 5 + 1,
+            project_id=1,
+            responsible_user_id=7,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+async def before(rows, field) -> bytes:
+    """Service model_validate, response_model re-validation, stdlib json."""
+    content = [TicketOut.model_validate(row) for row in rows]
+    encoded = await serialize_response(field=field, response_content=content)
+    return json.dumps(
+        encoded, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode()
+
+
+async def before_orjson(rows, field) -> bytes:
+    """Same double validation, rendered with ORJSONResponse."""
+    content = [TicketOut.model_validate(row) for row in rows]
+    encoded = await serialize_response(field=field, response_content=content)
+    return orjson.dumps(encoded)
+
+
+def after(rows) -> bytes:
+    """One validation pass straight to JSON bytes."""
+    return model_response(TicketOut, rows).body
+
+
+def main() -> None:
+    rows = make_rows(ROWS)
+    field = create_model_field(
+        name="Response", type_=list[TicketOut], mode="serialization"
+    )
+    loop = asyncio.new_event_loop()
+
+    # The two paths must produce the same document
+    assert orjson.loads(loop.run_until_complete(before(rows, field))) == orjson.loads(
+        after(rows)
+    )
+
+    cases = {
+        "response_model + json": lambda: loop.run_until_complete(before(rows, field)),
+        "response_model + orjson": lambda: loop.run_until_complete(
+            before_orjson(rows, field)
+        ),
+        "model_response": lambda: after(rows),
+    }
+    print(f"Serialising {ROWS} tickets, best of {REPEAT} runs")
+    baseline = None
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=REPEAT))
+        baseline = baseline or best
+        print(f"  {name:<26} {best * 1000:8.2f} ms  x{baseline / best:.1f}")
+
+
+if __name__ == "__main__":
+    main()
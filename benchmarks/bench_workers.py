@@ -0,0 +1,100 @@
+"""Throughput of the production launcher with 1..N uvicorn worker processes.
+
+Each round starts `python -m app.main` with WORKERS set, waits until `/`
+answers, then drives it from several client processes and reports requests
+per second. The figures only scale with as many workers as there are CPU
+cores on the machine:
+
+    python -m benchmarks.bench_workers [--max-workers 4] [--clients 8] [--seconds 5]
+"""
+
+import argparse
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_up(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"{url} did not come up within {timeout:.0f}s")
+
+
+def client(url: str, seconds: float, counts) -> None:
+    """Issue sequential requests until the time is up."""
+    done = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        urllib.request.urlopen(url, timeout=5).read()
+        done += 1
+    counts.put(done)
+
+
+def measure(workers: int, clients: int, seconds: float) -> float:
+    port = free_port()
+    env = dict(
+        os.environ,
+        HOST="127.0.0.1",
+        PORT=str(port),
+        WORKERS=str(workers),
+        RELOAD="0",
+    )
+    server = subprocess.Popen(
+        [sys.executable, "-m", "app.main"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}/"
+    try:
+        wait_until_up(url)
+        counts = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=client, args=(url, seconds, counts))
+            for _ in range(clients)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        return sum(counts.get() for _ in processes) / seconds
+    finally:
+        # SIGTERM exercises the graceful shutdown path of every worker
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=60)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(f"GET / with {args.clients} clients for {args.seconds:.0f}s per round")
+    print(f"CPU cores: {os.cpu_count()}")
+    baseline = None
+    for workers in range(1, args.max_workers + 1):
+        rate = measure(workers, args.clients, args.seconds)
+        baseline = baseline or rate
+        print(f"  {workers:>2} worker(s) {rate:10.0f} req/s  x{rate / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Cold-start import budget of app.main, measured with `python -X importtime`.
+
+Each run imports app.main in a fresh interpreter. The script reports the
+median cumulative import time and the heaviest modules, and exits non-zero
+when the median exceeds the budget:
+
+    python -m benchmarks.importtime [--budget-ms 750] [--runs 5] [--top 15]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+DEFERRED = ("uvicorn", "aio_pika", "passlib", "jose.jwt")
+
+
+def import_profile() -> dict[str, tuple[int, int]]:
+    """Return {module: (self_us, cumulative_us)} of one cold `import app.main`."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True,
+        text=True,
+        env=os.environ,
+        check=True,
+    )
+    profile = {}
+    for line in completed.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            profile[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return profile
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=750.0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    profiles = [import_profile() for _ in range(args.runs)]
+    totals = [profile["app.main"][1] / 1000 for profile in profiles]
+    median = statistics.median(totals)
+    last = profiles[-1]
+
+    print(f"import app.main: median {median:.1f} ms over {args.runs} runs")
+    print(f"budget: {args.budget_ms:.1f} ms")
+    print(f"\nTop {args.top} modules by cumulative time (last run):")
+    heaviest = sorted(
+        (
+            item
+            for item in last.items()
+            if "." not in item[0] or item[0].startswith("app.")
+        ),
+        key=lambda item: item[1][1],
+        reverse=True,
+    )
+    for module, (_, cumulative) in heaviest[: args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {module}")
+
+    print("\nModules that should be deferred to first use:")
+    for module in DEFERRED:
+        state = "imported" if module in last else "deferred"
+        print(f"  {module:<10} {state}")
+
+    return 0 if median <= args.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
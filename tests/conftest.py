@@ -10,6 +10,7 @@ from app.core.base import Base
 from app.core.settings import settings
 from app.main import app
 from app.core.database import get_db
+from app.core.jobs import job_registry
 from app.tickets.schemas import TicketCreate
 from app.users.models import UserRole
 
@@ -36,6 +37,8 @@ async def override_get_db():
 async def setup_db():
     # Override the FastAPI get_db dependency with our test session
     app.dependency_overrides[get_db] = override_get_db
+    # Background jobs share the test engine rather than the app's pool
+    job_registry.session_factory = TestingSessionLocal
 
     # Create the database schema before tests
     async with engine_test.begin() as conn:
@@ -0,0 +1,60 @@
+from app.core.cache import SnapshotCache, TTLCache, caches
+
+
+def test_ttl_cache_lru_and_expiry():
+    cache = TTLCache("test-lru", maxsize=2, ttl=60)
+    assert caches["test-lru"] is cache
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    # "b" is now the least recently used entry
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    cache.set("d", 4, ttl=0)
+    assert cache.get("d") is None
+
+    snapshot = cache.snapshot()
+    assert (snapshot["hits"], snapshot["misses"]) == (2, 2)
+    assert snapshot["evictions"] == 2
+    assert snapshot["expirations"] == 1
+
+
+def test_ttl_cache_pop_where():
+    cache = TTLCache("test-pop", maxsize=10, ttl=60)
+    for project_id, user_id in [(1, 1), (1, 2), (2, 1)]:
+        cache.set((project_id, user_id), True)
+    assert cache.pop_where(lambda key: key[0] == 1) == 2
+    assert len(cache) == 1
+    assert cache.pop((2, 1)) is True
+
+
+def test_snapshot_cache_versions_and_byte_bound():
+    cache = SnapshotCache("test-snapshots", max_bytes=10)
+    assert caches["test-snapshots"] is cache
+
+    cache.set(1, 1, b"aaaa")
+    assert cache.get(1, 1) == b"aaaa"
+    # A reader at a newer version never gets the older snapshot
+    assert cache.get(1, 2) is None
+    # and a slow builder of an older version does not replace a newer one
+    cache.set(1, 2, b"bbbb")
+    cache.set(1, 1, b"aaaa")
+    assert cache.get(1, 2) == b"bbbb"
+
+    cache.set(2, 1, b"cccc")
+    cache.get(1, 2)
+    # Over 10 bytes: project 2 is the least recently used
+    cache.set(3, 1, b"dddd")
+    assert cache.get(2, 1) is None
+    assert cache.size == 8
+
+    # Bodies larger than the whole cache are not kept
+    cache.set(4, 1, b"x" * 11)
+    assert cache.get(4, 1) is None
+
+    snapshot = cache.snapshot()
+    assert snapshot["bytes"] == 8
+    assert (snapshot["stale"], snapshot["evictions"]) == (1, 1)
@@ -0,0 +1,75 @@
+import asyncio
+
+from app.core.cache import TTLCache
+from app.core.idempotency import IdempotencyMiddleware
+
+
+class CountingApp:
+    """Answers 201 after a short delay and counts executions."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, scope, receive, send):
+        self.calls += 1
+        message = await receive()
+        await asyncio.sleep(0.01)
+        await send({"type": "http.response.start", "status": 201, "headers": []})
+        await send(
+            {
+                "type": "http.response.body",
+                "body": b'{"n":%d,"echo":%s}' % (self.calls, message["body"]),
+            }
+        )
+
+
+async def call(middleware, body: bytes, key: bytes | None = b"k1", path="/tickets/"):
+    headers = [(b"idempotency-key", key)] if key else []
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": path,
+        "headers": headers,
+        "client": ("10.0.0.1", 1),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    return messages[0]["status"], dict(messages[0]["headers"]), messages[1]["body"]
+
+
+def make_middleware(app):
+    return IdempotencyMiddleware(app, store=TTLCache("test-idempotency", 10, 60))
+
+
+async def test_retry_replays_stored_response():
+    app = CountingApp()
+    middleware = make_middleware(app)
+
+    status, _, body = await call(middleware, b"1")
+    replay_status, headers, replay_body = await call(middleware, b"1")
+    assert (replay_status, replay_body) == (status, body) == (201, b'{"n":1,"echo":1}')
+    assert headers[b"idempotent-replayed"] == b"true"
+    assert app.calls == 1
+
+    # A different payload under the same key is rejected
+    assert (await call(middleware, b"2"))[0] == 422
+    # Without a key, or on other routes, requests always run
+    await call(middleware, b"1", key=None)
+    await call(middleware, b"1", path="/tickets/1/status")
+    assert app.calls == 3
+
+
+async def test_concurrent_duplicates_are_coalesced():
+    app = CountingApp()
+    middleware = make_middleware(app)
+
+    results = await asyncio.gather(*(call(middleware, b"1") for _ in range(5)))
+    assert app.calls == 1
+    assert {body for _, _, body in results} == {b'{"n":1,"echo":1}'}
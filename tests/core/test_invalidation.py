@@ -0,0 +1,32 @@
+from app.core.invalidation import InvalidationBus, invalidation_bus
+from app.projects.access import ProjectAccess, project_access_cache
+
+
+def test_invalidation_bus_dispatches_to_entity_handlers():
+    bus = InvalidationBus("test_invalidations")
+    received = []
+    bus.register("user", lambda id, version: received.append((id, version)))
+
+    def broken(id, version):
+        raise RuntimeError("boom")
+
+    bus.register("user", broken)
+    bus.register("project", lambda id, version: received.append(("project", id)))
+
+    bus.dispatch({"entity": "user", "id": 7, "version": 3})
+    bus.dispatch({"entity": "unknown", "id": 7, "version": None})
+    assert received == [(7, 3)]
+
+
+def test_project_access_follows_invalidations():
+    for key in [(1, 1), (1, 2), (2, 1)]:
+        project_access_cache.set(key, ProjectAccess(owner_id=1, is_member=True))
+
+    invalidation_bus.dispatch({"entity": "project_member", "id": [1, 2]})
+    assert project_access_cache.get((1, 2)) is None
+    assert project_access_cache.get((1, 1)) is not None
+
+    invalidation_bus.dispatch({"entity": "project", "id": 1, "version": None})
+    assert project_access_cache.get((1, 1)) is None
+    assert project_access_cache.get((2, 1)) is not None
+    project_access_cache.clear()
@@ -0,0 +1,55 @@
+import asyncio
+
+from app.core.jobs import JobRegistry
+from tests.conftest import TestingSessionLocal
+
+
+async def test_job_registry_reports_outcome():
+    registry = JobRegistry()
+
+    async def count(job, total):
+        for done in range(1, total + 1):
+            job.progress["done"] = done
+            await asyncio.sleep(0)
+
+    async def fail(job):
+        raise RuntimeError("boom")
+
+    succeeded = await registry.start("count", count, 3)
+    failed = await registry.start("fail", fail)
+    assert (await registry.get(succeeded.id)).status == "pending"
+
+    await asyncio.sleep(0.01)
+    assert succeeded.snapshot()["status"] == "succeeded"
+    assert succeeded.progress == {"done": 3}
+    assert (failed.status, failed.error) == ("failed", "boom")
+    assert await registry.get("unknown") is None
+
+
+async def test_job_registry_close_cancels_running_jobs():
+    registry = JobRegistry()
+
+    async def forever(job):
+        await asyncio.sleep(3600)
+
+    job = await registry.start("forever", forever)
+    await asyncio.sleep(0)
+    await registry.close()
+    assert job.status == "cancelled"
+
+
+async def test_job_registry_records_jobs_for_other_workers():
+    registry = JobRegistry(session_factory=TestingSessionLocal, persist=True)
+    other_worker = JobRegistry(session_factory=TestingSessionLocal, persist=True)
+
+    async def count(job):
+        job.progress["done"] = 1
+
+    job = await registry.start("count", count, started_by=7)
+    # Recorded as soon as it is started
+    assert (await other_worker.get(job.id)).status == "pending"
+
+    await asyncio.sleep(0.5)
+    recorded = await other_worker.get(job.id)
+    assert recorded.snapshot()["status"] == "succeeded"
+    assert (recorded.progress, recorded.started_by) == ({"done": 1}, 7)
@@ -0,0 +1,85 @@
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from app.core.rate_limit import (
+    InMemoryBucketStore,
+    PostgresBucketStore,
+    RateLimitMiddleware,
+    client_key,
+)
+from app.users.utils import create_access_token
+from tests.conftest import engine_test
+
+
+async def ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+def make_scope(path: str, token: str | None = None, client="10.0.0.1"):
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    return {"type": "http", "path": path, "headers": headers, "client": (client, 1)}
+
+
+async def call(middleware, scope) -> dict:
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, None, send)
+    return messages[0]
+
+
+def test_client_key_uses_jwt_id():
+    token = create_access_token({"sub": "a@example.com", "id": 42, "role": "user"})
+    assert client_key(make_scope("/tickets/1", token)) == "user:42"
+    assert client_key(make_scope("/tickets/1", "not-a-jwt")) == "ip:10.0.0.1"
+    assert client_key(make_scope("/tickets/1")) == "ip:10.0.0.1"
+
+
+async def test_rate_limit_applies_route_costs():
+    store = InMemoryBucketStore(capacity=10, refill_rate=1)
+    middleware = RateLimitMiddleware(ok_app, store=store)
+    token = create_access_token({"sub": "a@example.com", "id": 1, "role": "user"})
+
+    # A list request spends the whole bucket, a cheap one is then rejected
+    assert (await call(middleware, make_scope("/tickets/list/1", token)))[
+        "status"
+    ] == 200
+    response = await call(middleware, make_scope("/tickets/1", token))
+    assert response["status"] == 429
+    assert dict(response["headers"])[b"retry-after"] == b"1"
+
+    # Other users and exempt paths are unaffected
+    other = create_access_token({"sub": "b@example.com", "id": 2, "role": "user"})
+    assert (await call(middleware, make_scope("/tickets/1", other)))["status"] == 200
+    assert (await call(middleware, make_scope("/ready", token)))["status"] == 200
+
+
+async def test_in_memory_bucket_wait():
+    store = InMemoryBucketStore(capacity=2, refill_rate=1)
+    assert await store.take("key", 2) == 0.0
+    # A rejected request does not spend tokens
+    assert await store.take("key", 2) == pytest.approx(2.0, abs=0.01)
+    assert await store.take("key", 1) == pytest.approx(1.0, abs=0.01)
+
+
+async def test_postgres_bucket_refuses_when_empty():
+    # The table comes from a migration, not from the models
+    async with engine_test.begin() as connection:
+        await connection.execute(
+            text(
+                "CREATE UNLOGGED TABLE IF NOT EXISTS rate_limit_buckets ("
+                "key varchar(255) PRIMARY KEY, tokens double precision NOT NULL, "
+                "updated_at double precision NOT NULL, allowed boolean NOT NULL)"
+            )
+        )
+    store = PostgresBucketStore(engine_test, capacity=2, refill_rate=0.01)
+    key = f"test:{uuid.uuid4().hex}"
+
+    assert await store.take(key, 2) == 0.0
+    # The bucket is empty: the request is refused, not let through
+    assert await store.take(key, 1) == pytest.approx(100.0, rel=0.05)
@@ -0,0 +1,83 @@
+from app.core.cache import caches
+from app.core.shared_cache import MAX_PROBES, SharedMemoryCache
+from app.users.models import UserRole
+from app.users.principals import Principal, PrincipalCache
+
+
+def test_shared_cache_is_shared_and_versioned(tmp_path):
+    path = str(tmp_path / "table")
+    writer = SharedMemoryCache("test-shared", path, slots=64, value_size=32, ttl=60)
+    reader = SharedMemoryCache("test-shared-2", path, slots=64, value_size=32, ttl=60)
+    assert caches["test-shared"] is writer
+
+    assert writer.set(7, 2, b"two")
+    assert reader.get(7) == (2, b"two")
+    # An older version never replaces a newer one
+    assert not writer.set(7, 1, b"one")
+    assert reader.get(7) == (2, b"two")
+
+    # A fence drops the entry and refuses the fills older than the change
+    writer.invalidate(7, 3)
+    assert reader.get(7) is None
+    assert not reader.set(7, 2, b"two")
+    assert reader.set(7, 3, b"three")
+    assert writer.get(7) == (3, b"three")
+
+    writer.invalidate(7)
+    assert not writer.set(7, 4, b"four")
+    assert not writer.set(8, 1, b"x" * 33)
+    reader.close()
+    writer.close()
+
+
+def test_shared_cache_evicts_within_probe_window(tmp_path):
+    table = SharedMemoryCache(
+        "test-evict", str(tmp_path / "table"), slots=8, value_size=8, ttl=60
+    )
+    for key in range(1, MAX_PROBES + 2):
+        table.set(key, 1, b"%d" % key)
+    assert table.stats.evictions == 1
+    assert sum(table.get(key) is not None for key in range(1, MAX_PROBES + 2)) == 8
+
+    expired = SharedMemoryCache(
+        "test-expired", str(tmp_path / "expired"), slots=8, value_size=8, ttl=0
+    )
+    expired.set(1, 1, b"1")
+    assert expired.get(1) is None
+    table.close()
+    expired.close()
+
+
+def test_shared_cache_never_evicts_fences_for_values(tmp_path):
+    table = SharedMemoryCache(
+        "test-fences", str(tmp_path / "table"), slots=8, value_size=8, ttl=60
+    )
+    for key in range(1, MAX_PROBES + 1):
+        table.set(key, 1, b"%d" % key)
+    table.invalidate(3, 5)
+    for key in range(MAX_PROBES + 1, 2 * MAX_PROBES + 1):
+        table.set(key, 1, b"%d" % key)
+
+    # The stale fill racing with the invalidation is still refused
+    assert not table.set(3, 1, b"old")
+    assert table.get(3) is None
+
+    # Once only fences are left, values are refused rather than evicting them
+    for key in range(1, MAX_PROBES + 1):
+        table.invalidate(key, 2)
+    assert not table.set(100, 1, b"new")
+    table.close()
+
+
+def test_principal_cache_round_trip(tmp_path):
+    table = SharedMemoryCache(
+        "test-principals", str(tmp_path / "principals"), 64, 192, ttl=60
+    )
+    cache = PrincipalCache(table)
+    principal = Principal(5, "admin@example.com", UserRole.ADMIN, True, 10)
+    cache.set(principal)
+    assert cache.get(5) == principal
+
+    cache.invalidate(5, 11)
+    assert cache.get(5) is None
+    table.close()
@@ -0,0 +1,124 @@
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.notifications.digest import DigestNotifier
+from app.notifications.smtp import SMTPPool
+
+
+class CollectingHandler:
+    """aiosmtpd handler keeping every received envelope."""
+
+    def __init__(self):
+        self.envelopes = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.envelopes.append(envelope)
+        return "250 Message accepted for delivery"
+
+
+@pytest.fixture
+def smtp_server():
+    handler = CollectingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=8025)
+    controller.start()
+    yield handler
+    controller.stop()
+
+
+def status_event(ticket_id: int, new_status: str, updated_by: str) -> dict:
+    return {
+        "event": "status_changed",
+        "ticket_id": ticket_id,
+        "project_id": 1,
+        "new_status": new_status,
+        "updated_by": updated_by,
+        "ticket": {"title": f"Ticket {ticket_id}"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_digest_sends_one_email_per_recipient(smtp_server):
+    """Test that many status changes become one email per recipient."""
+    lookups = []
+
+    async def resolver(ticket_ids):
+        lookups.append(sorted(ticket_ids))
+        return {
+            ticket_id: {"owner@example.com", "executor@example.com"}
+            for ticket_id in ticket_ids
+        }
+
+    mailer = SMTPPool("127.0.0.1", 8025, size=2)
+    notifier = DigestNotifier(mailer, resolver=resolver, window=60)
+
+    for ticket_id in range(1, 51):
+        await notifier.handle(status_event(ticket_id, "in_progress", "pm@example.com"))
+        await notifier.handle(status_event(ticket_id, "done", "pm@example.com"))
+    await notifier.handle({"event": "created", "ticket_id": 99, "project_id": 1})
+
+    assert await notifier.flush() == 2
+    await mailer.close()
+
+    # One batched recipient lookup for all tickets, created events are ignored
+    assert lookups == [list(range(1, 51))]
+    assert sorted(e.rcpt_tos[0] for e in smtp_server.envelopes) == [
+        "executor@example.com",
+        "owner@example.com",
+    ]
+    body = smtp_server.envelopes[0].content.decode()
+    assert "50 ticket status update(s)" in body
+    assert "#50 Ticket 50: now done" in body
+
+
+@pytest.mark.asyncio
+async def test_digest_skips_the_author_of_the_change(smtp_server):
+    """Test that users are not notified about their own changes."""
+
+    async def resolver(ticket_ids):
+        return {ticket_id: {"owner@example.com"} for ticket_id in ticket_ids}
+
+    mailer = SMTPPool("127.0.0.1", 8025)
+    notifier = DigestNotifier(mailer, resolver=resolver)
+    await notifier.handle(status_event(1, "done", "owner@example.com"))
+
+    assert await notifier.flush() == 0
+    assert smtp_server.envelopes == []
+
+
+@pytest.mark.asyncio
+async def test_digest_keeps_changes_that_failed_to_send():
+    """Test that undelivered and unresolved changes are sent in a later window."""
+    sent = []
+
+    class FlakyMailer:
+        failures = 1
+
+        async def send(self, message):
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("SMTP down")
+            sent.append(message)
+
+    lookups = []
+
+    async def resolver(ticket_ids):
+        lookups.append(ticket_ids)
+        if len(lookups) == 2:
+            raise ConnectionError("database down")
+        return {ticket_id: {"owner@example.com"} for ticket_id in ticket_ids}
+
+    notifier = DigestNotifier(FlakyMailer(), resolver=resolver)
+    await notifier.handle(status_event(1, "in_progress", "pm@example.com"))
+    assert await notifier.flush() == 1
+    assert sent == []
+
+    # The lookup of the next window fails: nothing is dropped either
+    await notifier.handle(status_event(1, "done", "pm@example.com"))
+    with pytest.raises(ConnectionError):
+        await notifier.flush()
+
+    assert await notifier.flush() == 1
+    assert len(sent) == 1
+    body = sent[0].get_content()
+    assert "#1 Ticket 1: now done" in body
+    assert "2 change(s)" in body
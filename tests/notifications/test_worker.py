@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from app.notifications.worker import TicketUpdatesWorker
+
+
+class LocalMessage:
+    """Broker stand-in for an incoming message."""
+
+    def __init__(self, delivery_tag: int, body: dict | bytes, headers=None):
+        self.delivery_tag = delivery_tag
+        self.body = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.headers = headers or {}
+        self.acks = []
+
+    async def ack(self, multiple: bool = False):
+        self.acks.append(multiple)
+
+
+class LocalExchange:
+    """Broker stand-in for the default exchange, recording publications."""
+
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, message, routing_key: str):
+        self.published.append((routing_key, message))
+
+
+@pytest.mark.asyncio
+async def test_batch_is_acked_once_in_bulk():
+    """Test that a successful batch is acknowledged with a single multiple-ack."""
+    handled = []
+
+    async def handler(event):
+        handled.append(event["ticket_id"])
+
+    worker = TicketUpdatesWorker(handler, batch_size=10, batch_timeout=0.01)
+    messages = [LocalMessage(tag, {"ticket_id": tag}) for tag in (1, 2, 3)]
+    for message in messages:
+        await worker._inbox.put(message)
+
+    batch = await worker.next_batch()
+    await worker.process_batch(batch, LocalExchange())
+
+    assert sorted(handled) == [1, 2, 3]
+    assert messages[-1].acks == [True]
+    assert messages[0].acks == messages[1].acks == []
+    assert worker.metrics.snapshot()["processed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_message_goes_to_retry_then_dead_queue():
+    """Test that failures back off through retry queues and end up dead-lettered."""
+
+    async def handler(event):
+        raise RuntimeError("SMTP down")
+
+    worker = TicketUpdatesWorker(handler, max_retries=2)
+    exchange = LocalExchange()
+
+    await worker.process_batch([LocalMessage(1, {"ticket_id": 1})], exchange)
+    routing_key, message = exchange.published[-1]
+    assert routing_key == "ticket_updates.retry.0"
+    assert message.headers["x-retry-count"] == 1
+
+    retried = LocalMessage(2, {"ticket_id": 1}, headers={"x-retry-count": 2})
+    await worker.process_batch([retried], exchange)
+    assert exchange.published[-1][0] == "ticket_updates.dead"
+    assert retried.acks == [True]
+    assert worker.metrics.retried == 1
+    assert worker.metrics.dead_lettered == 1
+
+
+@pytest.mark.asyncio
+async def test_malformed_message_is_dead_lettered():
+    """Test that an undecodable message skips the retries."""
+
+    async def handler(event):
+        pass
+
+    worker = TicketUpdatesWorker(handler)
+    exchange = LocalExchange()
+    await worker.process_batch([LocalMessage(1, b"not json")], exchange)
+    assert exchange.published[0][0] == "ticket_updates.dead"
+
+
+def test_retry_delay_doubles():
+    """Test the exponential retry backoff."""
+
+    async def handler(event):
+        pass
+
+    worker = TicketUpdatesWorker(handler, retry_backoff=1.5)
+    assert [worker.retry_delay(n) for n in range(3)] == [1.5, 3.0, 6.0]
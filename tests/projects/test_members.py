@@ -70,3 +70,151 @@ async def test_remove_member_from_project(test_client: AsyncClient, create_proje
         headers={"Authorization": f"Bearer {token}"},
     )
     assert remove_response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_list_members_not_modified(test_client: AsyncClient, create_project):
+    """Test that the member list ETag changes only when membership changes."""
+    project_id, token = await create_project
+
+    response = await test_client.get(
+        f"/projects/{project_id}/members", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = await test_client.get(
+        f"/projects/{project_id}/members",
+        headers={"Authorization": f"Bearer {token}", "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+
+    login_response = await test_client.post(
+        "/users/login",
+        data={"username": "manager@example.com", "password": "managerpassword"},
+    )
+    manager_id = jwt.decode(
+        login_response.json()["access_token"],
+        settings.SECRET_KEY,
+        algorithms=[settings.ALGORITHM],
+    )["id"]
+    await test_client.post(
+        f"/projects/{project_id}/members",
+        json={"user_id": manager_id},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    response = await test_client.get(
+        f"/projects/{project_id}/members",
+        headers={"Authorization": f"Bearer {token}", "If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_list_members_paginated(test_client: AsyncClient, create_project):
+    """Test paging and filtering the member list."""
+    project_id, token = await create_project
+    headers = {"Authorization": f"Bearer {token}"}
+
+    member_ids = []
+    for email, password in [
+        ("manager@example.com", "managerpassword"),
+        ("user@example.com", "userpassword"),
+    ]:
+        login_response = await test_client.post(
+            "/users/login", data={"username": email, "password": password}
+        )
+        member_id = jwt.decode(
+            login_response.json()["access_token"],
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM],
+        )["id"]
+        await test_client.post(
+            f"/projects/{project_id}/members",
+            json={"user_id": member_id},
+            headers=headers,
+        )
+        member_ids.append(member_id)
+
+    response = await test_client.get(
+        f"/projects/{project_id}/members", params={"limit": 1}, headers=headers
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    assert response.headers["X-Total-Count"] == "2"
+
+    response = await test_client.get(
+        f"/projects/{project_id}/members",
+        params={"limit": 1, "cursor": response.headers["X-Next-Cursor"]},
+        headers=headers,
+    )
+    assert [member["id"] for member in response.json()] == sorted(member_ids)[1:]
+    assert "X-Next-Cursor" not in response.headers
+
+    response = await test_client.get(
+        f"/projects/{project_id}/members", params={"role": "manager"}, headers=headers
+    )
+    assert response.headers["X-Total-Count"] == "1"
+    assert [member["id"] for member in response.json()] == [member_ids[0]]
+
+
+@pytest.mark.asyncio
+async def test_batch_add_and_remove_members(test_client: AsyncClient, create_project):
+    """Test adding and removing members in bulk."""
+    project_id, token = await create_project
+    headers = {"Authorization": f"Bearer {token}"}
+
+    member_ids = []
+    for email, password in [
+        ("manager@example.com", "managerpassword"),
+        ("user@example.com", "userpassword"),
+    ]:
+        login_response = await test_client.post(
+            "/users/login", data={"username": email, "password": password}
+        )
+        member_ids.append(
+            jwt.decode(
+                login_response.json()["access_token"],
+                settings.SECRET_KEY,
+                algorithms=[settings.ALGORITHM],
+            )["id"]
+        )
+
+    response = await test_client.post(
+        f"/projects/{project_id}/members:batch",
+        json={"user_ids": member_ids},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert sorted(response.json()["changed_user_ids"]) == sorted(member_ids)
+
+    # Existing members are reported as unchanged
+    response = await test_client.post(
+        f"/projects/{project_id}/members:batch",
+        json={"user_ids": member_ids},
+        headers=headers,
+    )
+    assert response.json()["changed_user_ids"] == []
+    assert response.json()["unchanged_user_ids"] == member_ids
+
+    # Unknown users reject the whole batch
+    response = await test_client.post(
+        f"/projects/{project_id}/members:batch",
+        json={"user_ids": [10**9]},
+        headers=headers,
+    )
+    assert response.status_code == 404
+
+    response = await test_client.request(
+        "DELETE",
+        f"/projects/{project_id}/members:batch",
+        json={"user_ids": member_ids},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert sorted(response.json()["changed_user_ids"]) == sorted(member_ids)
+
+    response = await test_client.get(f"/projects/{project_id}/members", headers=headers)
+    assert response.json() == []
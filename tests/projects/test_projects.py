@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from httpx import AsyncClient
 from jose import jwt
@@ -123,12 +125,58 @@ async def test_delete_project(test_client: AsyncClient, create_users):
     assert create_response.status_code == 200
     project_id = create_response.json()["id"]
 
+    # Read it once so its access check is cached
+    response = await test_client.get(
+        f"/projects/{project_id}", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200
+
     # Delete the project
     delete_response = await test_client.delete(
         f"/projects/{project_id}", headers={"Authorization": f"Bearer {token}"}
     )
-    assert delete_response.status_code == 200
-    assert delete_response.json()["message"] == "Project deleted successfully"
+    assert delete_response.status_code == 202
+    assert delete_response.json()["message"] == "Project deletion started"
+    job_url = delete_response.headers["Location"]
+
+    # The project reads as gone while the deletion runs, and the cached access is dropped
+    response = await test_client.get(
+        f"/projects/{project_id}", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 404
+
+    for _ in range(50):
+        job = (
+            await test_client.get(
+                job_url, headers={"Authorization": f"Bearer {token}"}
+            )
+        ).json()
+        if job["status"] not in ("pending", "running"):
+            break
+        await asyncio.sleep(0.1)
+    assert job["status"] == "succeeded"
+    assert job["progress"]["project_id"] == project_id
+
+    # Nobody but admins and the user who started it can read the job
+    response = await test_client.get(job_url)
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_project_access_cache_hits(test_client: AsyncClient, create_project):
+    """Repeated access checks are served from the cache and show up in /metrics."""
+    project_id, token = await create_project
+
+    def hits(metrics):
+        return metrics.json()["caches"]["project_access"]["hits"]
+
+    before = hits(await test_client.get("/metrics"))
+    for _ in range(2):
+        response = await test_client.get(
+            f"/tickets/list/{project_id}", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 200
+    assert hits(await test_client.get("/metrics")) >= before + 1
 
 
 @pytest.mark.asyncio
@@ -160,3 +208,52 @@ async def test_change_project_status(test_client: AsyncClient, create_project):
         headers={"Authorization": f"Bearer {token}"},
     )
     assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_my_projects(test_client: AsyncClient, create_project):
+    """Owned and member projects are listed page by page with their counts."""
+    project_id, owner_token = await create_project
+
+    login_response = await test_client.post(
+        "/users/login",
+        data={"username": "user@example.com", "password": "userpassword"},
+    )
+    token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = (await test_client.get("/users/me", headers=headers)).json()["id"]
+
+    # Own one project and join another
+    response = await test_client.post(
+        "/projects/", json={"title": "Own Project"}, headers=headers
+    )
+    own_project_id = response.json()["id"]
+    response = await test_client.post(
+        f"/projects/{project_id}/members",
+        json={"user_id": user_id},
+        headers={"Authorization": f"Bearer {owner_token}"},
+    )
+    assert response.status_code == 200
+
+    # Walk the pages one project at a time
+    projects, cursor = [], None
+    while True:
+        params = {"limit": 1, **({"cursor": cursor} if cursor else {})}
+        response = await test_client.get("/projects/", params=params, headers=headers)
+        assert response.status_code == 200
+        projects += response.json()
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    by_id = {project["id"]: project for project in projects}
+    assert len(by_id) == len(projects)
+    assert by_id[own_project_id]["is_owner"] is True
+    assert by_id[project_id]["is_owner"] is False
+    assert by_id[project_id]["member_count"] >= 1
+    assert by_id[project_id]["open_ticket_count"] >= 0
+
+    response = await test_client.get(
+        "/projects/", params={"status": "archived"}, headers=headers
+    )
+    assert own_project_id not in [project["id"] for project in response.json()]
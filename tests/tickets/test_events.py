@@ -0,0 +1,52 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.tickets.events import TicketEventHub, format_sse
+
+
+@pytest.mark.asyncio
+async def test_hub_fans_out_per_project(mocker):
+    """Test that events reach only the subscribers of their project."""
+    mocker.patch.object(TicketEventHub, "_consume", new_callable=AsyncMock)
+    hub = TicketEventHub(buffer_size=10)
+
+    first = hub.subscribe(1)
+    second = hub.subscribe(1)
+    other = hub.subscribe(2)
+
+    hub.dispatch({"event": "created", "project_id": 1, "ticket_id": 10})
+
+    assert (await first.get())["ticket_id"] == 10
+    assert (await second.get())["ticket_id"] == 10
+    assert other.queue.empty()
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_hub_drops_slow_subscriber(mocker):
+    """Test that a full buffer drops its subscriber without affecting others."""
+    mocker.patch.object(TicketEventHub, "_consume", new_callable=AsyncMock)
+    hub = TicketEventHub(buffer_size=2)
+
+    slow = hub.subscribe(1)
+    fast = hub.subscribe(1)
+
+    for ticket_id in range(3):
+        hub.dispatch({"event": "updated", "project_id": 1, "ticket_id": ticket_id})
+        await fast.get()
+
+    assert slow.dropped
+    assert await slow.get() is None
+    assert not fast.dropped
+
+    hub.dispatch({"event": "updated", "project_id": 1, "ticket_id": 99})
+    assert (await fast.get())["ticket_id"] == 99
+    await hub.close()
+
+
+def test_format_sse():
+    """Test the text/event-stream framing of an event."""
+    frame = format_sse({"event": "deleted", "ticket_id": 5})
+    assert frame.startswith("event: deleted\ndata: ")
+    assert frame.endswith("\n\n")
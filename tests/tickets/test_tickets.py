@@ -8,6 +8,8 @@ from app.tickets.schemas import (
     ExecutorAssign,
     TicketStatusUpdate,
 )
+from app.core.jobs import Job
+from app.tickets.jobs import archive_tickets_in_batches
 from app.tickets.models import TicketStatus
 
 
@@ -35,6 +37,33 @@ async def test_create_ticket(test_client: AsyncClient, create_project, manager_u
     assert response.json()["title"] == "New Ticket"
 
 
+@pytest.mark.asyncio
+async def test_create_ticket_idempotent(test_client: AsyncClient, create_project):
+    """Retrying a create with the same Idempotency-Key returns the first ticket."""
+    project_id, token = await create_project
+    ticket_data = TicketCreate(
+        title="Idempotent Ticket", priority=2, status="todo", project_id=project_id
+    )
+    headers = {"Authorization": f"Bearer {token}", "Idempotency-Key": "create-1"}
+
+    first = await test_client.post(
+        "/tickets/", json=ticket_data.dict(), headers=headers
+    )
+    retry = await test_client.post(
+        "/tickets/", json=ticket_data.dict(), headers=headers
+    )
+    assert first.status_code == retry.status_code == 200
+    assert retry.json()["id"] == first.json()["id"]
+    assert retry.headers["Idempotent-Replayed"] == "true"
+
+    # The same key with another payload is rejected
+    ticket_data.title = "Other Ticket"
+    response = await test_client.post(
+        "/tickets/", json=ticket_data.dict(), headers=headers
+    )
+    assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_get_ticket(test_client: AsyncClient, create_ticket):
     """Test retrieving a ticket by its ID."""
@@ -134,9 +163,9 @@ async def test_change_ticket_status(mocker, test_client, create_ticket):
     """Test changing the status of a ticket with RabbitMQ mocked."""
     ticket_id, token = await create_ticket
 
-    # Mock RabbitMQ's send_message function
+    # Mock RabbitMQ's publish function
     mock_rabbitmq = mocker.patch(
-        "app.core.rabbitmq.RabbitMQConnection.send_message", new_callable=AsyncMock
+        "app.core.rabbitmq.RabbitMQConnection.publish", new_callable=AsyncMock
     )
 
     new_status = TicketStatusUpdate(new_status="in_progress")
@@ -153,9 +182,12 @@ async def test_change_ticket_status(mocker, test_client, create_ticket):
 
     # Ensure RabbitMQ message was called once with expected parameters
     mock_rabbitmq.assert_called_once_with(
-        queue_name="ticket_updates",
+        exchange_name="ticket_updates",
         message_body=mocker.ANY,  # Mock the message body to check if it was called
     )
+    message_body = mock_rabbitmq.call_args.kwargs["message_body"]
+    assert message_body["event"] == "status_changed"
+    assert message_body["new_status"] == "in_progress"
 
 
 @pytest.mark.asyncio
@@ -175,3 +207,157 @@ async def test_delete_ticket(test_client: AsyncClient, create_ticket):
         headers={"Authorization": f"Bearer {token}"},
     )
     assert get_response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_ticket_not_modified(test_client: AsyncClient, create_ticket):
+    """Test that a ticket GET with a matching If-None-Match returns 304."""
+    ticket_id, token = await create_ticket
+
+    response = await test_client.get(
+        f"/tickets/{ticket_id}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    response = await test_client.get(
+        f"/tickets/{ticket_id}",
+        headers={"Authorization": f"Bearer {token}", "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # Updating the ticket must produce a new ETag
+    await test_client.put(
+        f"/tickets/{ticket_id}",
+        json={"title": "Changed Ticket"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    response = await test_client.get(
+        f"/tickets/{ticket_id}",
+        headers={"Authorization": f"Bearer {token}", "If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_list_tickets_of_project(test_client: AsyncClient, create_ticket):
+    """Test that listing returns only the tickets of the requested project."""
+    ticket_id, token = await create_ticket
+
+    ticket = (
+        await test_client.get(
+            f"/tickets/{ticket_id}", headers={"Authorization": f"Bearer {token}"}
+        )
+    ).json()
+
+    response = await test_client.get(
+        f"/tickets/list/{ticket['project_id']}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    tickets = response.json()
+    assert ticket_id in [t["id"] for t in tickets]
+    assert {t["project_id"] for t in tickets} == {ticket["project_id"]}
+    assert tickets[0].keys() == ticket.keys()
+
+
+@pytest.mark.asyncio
+async def test_ticket_list_snapshot(test_client: AsyncClient, create_ticket):
+    """Listing serves the cached snapshot until a ticket write bumps its version."""
+    ticket_id, token = await create_ticket
+    headers = {"Authorization": f"Bearer {token}"}
+    ticket = (await test_client.get(f"/tickets/{ticket_id}", headers=headers)).json()
+    list_url = f"/tickets/list/{ticket['project_id']}"
+
+    def hits(metrics):
+        return metrics.json()["caches"]["ticket_list_snapshots"]["hits"]
+
+    first = await test_client.get(list_url, headers=headers)
+    before = hits(await test_client.get("/metrics"))
+    second = await test_client.get(list_url, headers=headers)
+    assert second.content == first.content
+    assert hits(await test_client.get("/metrics")) == before + 1
+
+    response = await test_client.get(
+        list_url, headers={**headers, "If-None-Match": first.headers["ETag"]}
+    )
+    assert response.status_code == 304
+
+    response = await test_client.put(
+        f"/tickets/{ticket_id}", json={"title": "Renamed"}, headers=headers
+    )
+    assert response.status_code == 200
+
+    response = await test_client.get(list_url, headers=headers)
+    assert response.headers["ETag"] != first.headers["ETag"]
+    assert [t["title"] for t in response.json()] == ["Renamed"]
+
+
+@pytest.mark.asyncio
+async def test_ticket_actions_require_project_membership(
+    test_client: AsyncClient, create_ticket, manager_user
+):
+    """Outsiders cannot change tickets, nor be assigned as executors."""
+    ticket_id, token = await create_ticket
+    outsider_id, outsider_token = await manager_user
+
+    response = await test_client.put(
+        f"/tickets/{ticket_id}/status",
+        json={"new_status": "done"},
+        headers={"Authorization": f"Bearer {outsider_token}"},
+    )
+    assert response.status_code == 403
+
+    response = await test_client.post(
+        f"/tickets/{ticket_id}/executors",
+        json={"user_id": outsider_id},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 400
+
+    response = await test_client.post(
+        f"/tickets/{ticket_id}/executors",
+        json={"user_id": 10**9},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_archived_ticket_reads_fall_back(test_client: AsyncClient, create_ticket):
+    """Tickets of an archived project move to the archive and stay readable."""
+    ticket_id, token = await create_ticket
+    headers = {"Authorization": f"Bearer {token}"}
+    ticket = (await test_client.get(f"/tickets/{ticket_id}", headers=headers)).json()
+
+    response = await test_client.put(
+        f"/projects/{ticket['project_id']}/status",
+        json={"new_status": "archived"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+    job = Job(kind="archive_tickets")
+    await archive_tickets_in_batches(job)
+    assert job.progress["tickets_archived"] >= 1
+
+    response = await test_client.get(f"/tickets/{ticket_id}", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == ticket
+
+    response = await test_client.get(
+        f"/tickets/list/{ticket['project_id']}", headers=headers
+    )
+    assert [t["id"] for t in response.json()] == [ticket_id]
+
+    # Archived tickets are read-only
+    response = await test_client.put(
+        f"/tickets/{ticket_id}/status",
+        json={"new_status": "done"},
+        headers=headers,
+    )
+    assert response.status_code == 409
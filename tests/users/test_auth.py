@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient
 
+from app.main import app
+
 
 @pytest.mark.asyncio
 async def test_signup(test_client: AsyncClient):
@@ -44,3 +46,18 @@ async def test_login(test_client: AsyncClient):
     )
     assert response.status_code == 200
     assert "access_token" in response.json()
+
+
+@pytest.mark.asyncio
+async def test_readiness_probe(test_client: AsyncClient):
+    """
+    Test that /ready reports 503 until the app is warmed up.
+    """
+    app.state.ready = False
+    response = await test_client.get("/ready")
+    assert response.status_code == 503
+
+    app.state.ready = True
+    response = await test_client.get("/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready"}
@@ -0,0 +1,30 @@
+from passlib.context import CryptContext
+
+from app.core.settings import settings
+from app.users.utils import get_pwd_context, hash_password, verify_and_update_password
+
+
+def test_outdated_hashes_are_upgraded_on_verify(monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_SCHEMES", "argon2,bcrypt")
+    monkeypatch.setattr(settings, "PASSWORD_BCRYPT_ROUNDS", 5)
+    monkeypatch.setattr(settings, "PASSWORD_ARGON2_TIME_COST", 1)
+    monkeypatch.setattr(settings, "PASSWORD_ARGON2_MEMORY_COST", 1024)
+    monkeypatch.setattr(settings, "PASSWORD_ARGON2_PARALLELISM", 1)
+    get_pwd_context.cache_clear()
+    try:
+        assert hash_password("secret").startswith("$argon2id$")
+
+        # A bcrypt hash still verifies and comes back as argon2id
+        old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("secret")
+        verified, new_hash = verify_and_update_password("secret", old_hash)
+        assert verified and new_hash.startswith("$argon2id$")
+        assert verify_and_update_password("secret", new_hash) == (True, None)
+        assert verify_and_update_password("wrong", new_hash) == (False, None)
+
+        # So does an argon2id hash made with a lower cost than configured
+        monkeypatch.setattr(settings, "PASSWORD_ARGON2_TIME_COST", 2)
+        get_pwd_context.cache_clear()
+        verified, upgraded = verify_and_update_password("secret", new_hash)
+        assert verified and "t=2" in upgraded
+    finally:
+        get_pwd_context.cache_clear()
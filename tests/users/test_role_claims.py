@@ -0,0 +1,41 @@
+import pytest
+from fastapi import HTTPException
+
+from app.core.invalidation import invalidation_bus
+from app.users.dependencies import _claims_role_checker
+from app.users.role_claims import claimed_role, record_role_change, role_changes
+from app.users.utils import create_access_token
+
+
+def test_role_claims_follow_role_changes():
+    claims = {"sub": "manager@example.com", "id": 41, "role": "manager"}
+    assert claimed_role(claims) == "manager"
+
+    # Demoted: tokens carrying the old role stop working, new ones do
+    record_role_change(41, "user")
+    assert claimed_role(claims) is None
+    assert claimed_role({**claims, "role": "user"}) == "user"
+
+    invalidation_bus.dispatch({"entity": "user_role", "id": [41, None]})
+    assert claimed_role({**claims, "role": "user"}) is None
+    role_changes.clear()
+
+
+async def test_claims_role_checker_needs_no_user_row():
+    check = _claims_role_checker(("admin",))
+    admin = create_access_token({"sub": "a@example.com", "id": 42, "role": "admin"})
+    user = create_access_token({"sub": "u@example.com", "id": 43, "role": "user"})
+
+    assert (await check(admin))["id"] == 42
+    with pytest.raises(HTTPException) as forbidden:
+        await check(user)
+    assert forbidden.value.status_code == 403
+
+    record_role_change(42, "user")
+    with pytest.raises(HTTPException) as revoked:
+        await check(admin)
+    assert revoked.value.status_code == 401
+    with pytest.raises(HTTPException) as invalid:
+        await check("not-a-token")
+    assert invalid.value.status_code == 401
+    role_changes.clear()
@@ -0,0 +1,24 @@
+from datetime import timedelta
+
+import pytest
+from jose.exceptions import JWTError
+
+from app.users.utils import create_access_token, decode_access_token, verified_tokens
+
+
+def test_verified_tokens_are_cached_until_exp():
+    verified_tokens.clear()
+    token = create_access_token({"sub": "a@example.com", "id": 1, "role": "user"})
+
+    claims = decode_access_token(token)
+    assert decode_access_token(token) is claims
+    assert verified_tokens.snapshot()["hits"] >= 1
+
+    # Invalid and expired tokens are never cached
+    with pytest.raises(JWTError):
+        decode_access_token(token[:-2] + "xx")
+    expired = create_access_token({"id": 1}, expires_delta=timedelta(seconds=-1))
+    with pytest.raises(JWTError):
+        decode_access_token(expired)
+    assert len(verified_tokens) == 1
+    verified_tokens.clear()
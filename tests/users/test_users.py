@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from httpx import AsyncClient
 
@@ -154,14 +156,93 @@ async def test_delete_user_as_admin(test_client: AsyncClient, create_users):
     delete_response = await test_client.delete(
         f"/users/{user_id}", headers={"Authorization": f"Bearer {token}"}
     )
-    assert delete_response.status_code == 200
+    assert delete_response.status_code == 202
+    job_url = delete_response.headers["Location"]
 
-    # Ensure the user no longer exists
+    # Ensure the user no longer exists, even before the job has finished
     response = await test_client.get(
         f"/users/{user_id}", headers={"Authorization": f"Bearer {token}"}
     )
     assert response.status_code == 404
 
+    for _ in range(50):
+        job = (
+            await test_client.get(
+                job_url, headers={"Authorization": f"Bearer {token}"}
+            )
+        ).json()
+        if job["status"] not in ("pending", "running"):
+            break
+        await asyncio.sleep(0.1)
+    assert job["status"] == "succeeded"
+
+
+@pytest.mark.asyncio
+async def test_delete_user_reassigns_projects(test_client: AsyncClient, create_users):
+    """Test that a deleted user's projects are handed over to the admin."""
+    signup_response = await test_client.post(
+        "/users/signup",
+        json={
+            "email": "leaving@example.com",
+            "password": "password123",
+            "name": "Leaving",
+            "surname": "User",
+        },
+    )
+    user_id = signup_response.json()["id"]
+    user_login = await test_client.post(
+        "/users/login",
+        data={"username": "leaving@example.com", "password": "password123"},
+    )
+    user_headers = {"Authorization": f"Bearer {user_login.json()['access_token']}"}
+    project_response = await test_client.post(
+        "/projects/", json={"title": "Handover"}, headers=user_headers
+    )
+    assert project_response.status_code == 200
+    project_id = project_response.json()["id"]
+
+    admin_login = await test_client.post(
+        "/users/login",
+        data={"username": "admin@example.com", "password": "adminpassword"},
+    )
+    admin_headers = {"Authorization": f"Bearer {admin_login.json()['access_token']}"}
+    admin_id = (await test_client.get("/users/me", headers=admin_headers)).json()["id"]
+
+    delete_response = await test_client.delete(
+        f"/users/{user_id}", headers=admin_headers
+    )
+    assert delete_response.status_code == 202
+    for _ in range(50):
+        job = (
+            await test_client.get(
+                delete_response.headers["Location"], headers=admin_headers
+            )
+        ).json()
+        if job["status"] not in ("pending", "running"):
+            break
+        await asyncio.sleep(0.1)
+    assert job["status"] == "succeeded"
+    assert job["progress"]["projects_reassigned"] == 1
+
+    # User deletions are for admins only
+    manager_login = await test_client.post(
+        "/users/login",
+        data={"username": "manager@example.com", "password": "managerpassword"},
+    )
+    response = await test_client.get(
+        delete_response.headers["Location"],
+        headers={"Authorization": f"Bearer {manager_login.json()['access_token']}"},
+    )
+    assert response.status_code == 404
+
+    response = await test_client.get(f"/projects/{project_id}", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["owner_id"] == admin_id
+
+    # The deleted user's token no longer works
+    response = await test_client.get("/users/me", headers=user_headers)
+    assert response.status_code == 401
+
 
 @pytest.mark.asyncio
 async def test_forbidden_access_for_non_admin(test_client: AsyncClient, create_users):